@@ -1,68 +1,279 @@
-import json
+import os
 import logging
+import numpy as np
+import pandas as pd
 import azure.functions as func
+
+from typing import Dict
+from typing import List
+from typing import Union
+
 from .stock_frame.build import StockFrame
 from .indicators.build import Indicators
-from azure.identity import DefaultAzureCredential
-from azure.storage.blob import ContainerClient
-from azure.storage.blob import BlobServiceClient
+from .indicators.kernels import lookback_bars
+from .loaders.build import PRICE_COLUMNS
+from .loaders.build import end_bound
+from .loaders.build import concat_price_columns
+from .loaders.build import download_changed_price_blobs
+from .storage.build import CLIENT_CACHE
+from .price_store.build import PriceStore
+from .cache.build import ResultCache
+from .cache.build import spec_hash
+from .serializers.build import negotiate_format
+from .serializers.build import serialize_frame
+from .serializers.build import NotAcceptableError
+from azure.core.exceptions import ResourceNotFoundError
+
+# Define the URL to our Blob Client Service.
+ACCOUNT_URL = os.environ.get('PRICE_STORAGE_ACCOUNT_URL', 'https://tradingsystem.blob.core.windows.net/')
+
+# Define where the price history of a symbol is stored.
+BLOB_NAME = 'iex-price-history/{symbol}.json'
+
+# Define the indicators, they are calculated for every symbol in one pass.
+INDICATOR_SPECS = [
+    {'indicator': 'rsi', 'period': 14},
+    {'indicator': 'sma', 'period': 100},
+    {'indicator': 'ema', 'period': 50, 'alpha': 1/50}
+]
+
+# Keep a local copy of the price history when a folder is set, `/home` is shared by the instances of an app.
+PRICE_STORE = PriceStore(root_path=os.environ['PRICE_STORE_DIRECTORY']) if os.environ.get('PRICE_STORE_DIRECTORY') else None
+
+# The indicator results of this worker, checked against the blob ETag before they are used.
+RESULT_CACHE = ResultCache(
+    max_entries=int(os.environ.get('RESULT_CACHE_SIZE', 128)),
+    directory=os.environ.get('RESULT_CACHE_DIRECTORY', None)
+)
+
+
+def grab_symbols(req: func.HttpRequest) -> List[str]:
+    """Grabs the symbols from the query string or the request body.
+
+    Overview:
+    ----
+    Symbols can be passed as `symbols=MSFT,AAPL`, as one or more
+    `symbol` parameters, or in a JSON body as `{"symbols": ["MSFT", "AAPL"]}`.
+    Duplicates are dropped and the order is kept.
+
+    Arguments:
+    ----
+    req {func.HttpRequest} -- The HTTP request.
+
+    Returns:
+    ----
+    {List[str]} -- The requested symbols.
+    """
+
+    symbols = []
+
+    for parameter in ['symbols', 'symbol']:
+        value = req.params.get(parameter)
+        if value:
+            symbols += value.split(',')
+
+    try:
+        body = req.get_json()
+    except ValueError:
+        body = None
+
+    if isinstance(body, dict):
+        body_symbols = body.get('symbols', body.get('symbol', []))
+        if isinstance(body_symbols, str):
+            body_symbols = body_symbols.split(',')
+        symbols += body_symbols
+
+    symbols = [symbol.strip().upper() for symbol in symbols if symbol and symbol.strip()]
+
+    return list(dict.fromkeys(symbols))
+
+
+def grab_load_options(req: func.HttpRequest) -> dict:
+    """Grabs the columns and the date range to load from the query string.
+
+    Overview:
+    ----
+    The `columns` parameter lists the price columns to return, by default the
+    open, high, low, close and volume. The `close` is always loaded since the
+    indicators need it. `start` and `end` limit the dates returned.
+
+    Arguments:
+    ----
+    req {func.HttpRequest} -- The HTTP request.
+
+    Raises:
+    ----
+    ValueError: If `start` or `end` isn't a date.
+
+    Returns:
+    ----
+    {dict} -- The `columns`, `start` and `end` to load.
+    """
+
+    columns = req.params.get('columns')
+    columns = [column.strip() for column in columns.split(',') if column.strip()] if columns else list(PRICE_COLUMNS)
 
+    if 'close' not in columns:
+        columns.append('close')
 
-def grab_container() -> ContainerClient:
-   
-    # Initialize the Credentials.
-    default_credential = DefaultAzureCredential()
+    start = req.params.get('start')
+    end = req.params.get('end')
 
-    # Define the URL to our Blob Client Service.
-    account_url = 'https://tradingsystem.blob.core.windows.net/'
+    # Keep `end` as it was written, a date without a time covers the whole day.
+    if end:
+        end_bound(end=end)
 
-    # Connect to the client.
-    blob_service_client = BlobServiceClient(
-        account_url=account_url,
-        credential=default_credential
+    return {
+        'columns': columns,
+        'start': pd.Timestamp(start) if start else None,
+        'end': end or None
+    }
+
+
+def calculate_indicators(symbol_columns: Dict[str, Dict[str, Union[np.ndarray, list]]], start: pd.Timestamp = None) -> Dict[str, pd.DataFrame]:
+    """Calculates the indicators for several symbols in one batch.
+
+    Arguments:
+    ----
+    symbol_columns {Dict[str, Dict[str, Union[np.ndarray, list]]]} -- The price columns
+        of each symbol.
+
+    Keyword Arguments:
+    ----
+    start {pd.Timestamp} -- The first date to return, the bars before it were
+        only loaded to warm up the indicators. (default: {None})
+
+    Returns:
+    ----
+    {Dict[str, pd.DataFrame]} -- The price data and indicators of each symbol.
+    """
+
+    symbols = list(symbol_columns)
+
+    # Prep for indicators.
+    stock_frame = StockFrame.from_columns(
+        columns=concat_price_columns(symbol_columns=list(symbol_columns.values())),
+        symbol_names=symbols
     )
+    indicators = Indicators(price_data_frame=stock_frame)
+    indicators.compute(indicators=INDICATOR_SPECS)
+
+    # Split the results back up by symbol.
+    price_data_frame = indicators.price_data_frame
+    grouping = stock_frame.grouping
+
+    first_rows = grouping.starts
+
+    # Drop the bars that were only loaded to warm up the indicators.
+    if start is not None:
+        dates = price_data_frame.index.get_level_values('date')
+        first_rows = [
+            group_start + dates[group_start:group_end].searchsorted(start)
+            for group_start, group_end in zip(grouping.starts, grouping.ends)
+        ]
 
-    # Grab the container.
-    container_client = blob_service_client.get_container_client(
+    return {
+        symbol: price_data_frame.iloc[first_row:group_end].copy()
+        for symbol, first_row, group_end in zip(grouping.symbols, first_rows, grouping.ends)
+    }
+
+
+async def main(req: func.HttpRequest) -> func.HttpResponse:
+
+    symbols = grab_symbols(req=req)
+    logging.info(f'Symbols `{symbols}` captured...')
+
+    if not symbols:
+        return func.HttpResponse(
+            body='Pass the symbols to look up, for example `?symbols=MSFT,AAPL`.',
+            status_code=400
+        )
+
+    try:
+        load_options = grab_load_options(req=req)
+    except ValueError as bad_date:
+        return func.HttpResponse(body=str(bad_date), status_code=400)
+
+    # Pick the response format before doing any work.
+    try:
+        output_format = negotiate_format(
+            accept=req.headers.get('Accept'),
+            requested=req.params.get('format')
+        )
+    except NotAcceptableError as not_acceptable:
+        return func.HttpResponse(body=str(not_acceptable), status_code=406)
+
+    # Grab the container, the client is kept open between invocations.
+    container_client = await CLIENT_CACHE.get_container_client(
+        account_url=ACCOUNT_URL,
         container='price-history'
     )
 
-    return container_client
+    # Only read the columns asked for, and the bars the indicators need to warm up.
+    reader_options = dict(load_options, lookback=lookback_bars(indicators=INDICATOR_SPECS))
 
-def clean_json(blob_content: bytes) -> dict:
-    """Cleans up the content from Blob Storage, hidden characters present."""
+    # Grab the results we already have, they are only used if the blob hasn't changed.
+    spec_key = spec_hash(indicators=INDICATOR_SPECS + [load_options])
+    cached = {
+        symbol: RESULT_CACHE.get(blob_name=BLOB_NAME.format(symbol=symbol), spec_key=spec_key)
+        for symbol in symbols
+    }
 
-    content: bytes = blob_content.readall()
-    json_content = content.decode("unicode_escape").replace("\r\n", ",").replace('ï»¿','')
-    proper_json = '[' + json_content[:-1] + ']'
+    # Download the changed blobs for every symbol at the same time, through the local store if there is one.
+    load_changed = download_changed_price_blobs if PRICE_STORE is None else PRICE_STORE.load_changed
 
-    return json.loads(s=proper_json)
+    try:
+        downloads = await load_changed(
+            container_client=container_client,
+            symbols=symbols,
+            etags={symbol: entry[0] for symbol, entry in cached.items() if entry},
+            blob_name=BLOB_NAME,
+            reader_options=reader_options
+        )
+    except ResourceNotFoundError as not_found:
+        logging.warning(f'Price history missing: {not_found}')
+        return func.HttpResponse(
+            body='The price history for one of `{symbols}` could not be found.'.format(
+                symbols=','.join(symbols)
+            ),
+            status_code=404
+        )
 
-def main(req: func.HttpRequest) -> func.HttpResponse:
+    changed = {
+        symbol: columns for symbol, (columns, etag) in downloads.items() if columns is not None
+    }
+    logging.info(f'Data Captured Scucessfully, {len(symbols) - len(changed)} served from the cache...')
 
-    symbol = req.params.get('symbol')
-    logging.info(f'Symbol `{symbol}` captured...')
+    results = {
+        symbol: cached[symbol][1] for symbol in symbols if symbol not in changed
+    }
 
-    # Grab the blob content.
-    blob_container = grab_container()
-    blob_content = blob_container.download_blob(blob='iex-price-history/MSFT.json')
-    price_data = clean_json(blob_content=blob_content)
-    logging.info('Data Captured Scucessfully...')
+    # Calculate the indicators for the changed symbols and keep them for next time.
+    if changed:
 
-    # Prep for indicators.
-    stock_frame = StockFrame(data=price_data)
-    indicators = Indicators(price_data_frame=stock_frame)
+        results.update(
+            calculate_indicators(symbol_columns=changed, start=load_options['start'])
+        )
 
-    # Define the indicators.
-    indicators.rsi(period=14)
-    indicators.sma(period=100)
-    indicators.ema(period=50, alpha=1/50)
+        for symbol in changed:
+            RESULT_CACHE.put(
+                blob_name=BLOB_NAME.format(symbol=symbol),
+                spec_key=spec_key,
+                etag=downloads[symbol][1],
+                value=results[symbol]
+            )
 
-    stock_frame_with_indicators = indicators.price_data_frame
-    price_data = stock_frame_with_indicators.to_dict(orient='records')
+    stock_frame_with_indicators = pd.concat(
+        [results[symbol] for symbol in sorted(symbols)]
+    )
+
+    body, content_type = serialize_frame(
+        frame=stock_frame_with_indicators,
+        output_format=output_format
+    )
 
     return func.HttpResponse(
-        body=json.dumps(obj=price_data, indent=2),
-        mimetype='application/json',
+        body=body,
+        mimetype=content_type,
         status_code=200
     )
@@ -0,0 +1,328 @@
+import numpy as np
+import pandas as pd
+
+from typing import Dict
+
+from ..indicators import kernels
+from ..indicators.build import Indicators
+from ..signals.build import BUY
+from ..signals.build import SELL
+
+
+class BacktestResult():
+
+    """
+    Represents the outcome of a backtest, the bars, the trades and
+    a summary for each symbol.
+    """
+
+    def __init__(self, frame: pd.DataFrame, trades: pd.DataFrame, summary: pd.DataFrame) -> None:
+        """Initalizes the Backtest Result.
+
+        Arguments:
+        ----
+        frame {pd.DataFrame} -- The `signal`, `position`, `returns` and `equity` of every
+            bar, indexed like the StockFrame.
+
+        trades {pd.DataFrame} -- One row for each trade, with its symbol, entry and exit.
+
+        summary {pd.DataFrame} -- One row for each symbol, with its final equity, total
+            return, number of trades and maximum drawdown.
+        """
+
+        self.frame = frame
+        self.trades = trades
+        self.summary = summary
+
+    @property
+    def equity(self) -> pd.Series:
+        """Returns the equity curve of every symbol.
+
+        Returns:
+        ----
+        {pd.Series} -- The equity, indexed like the StockFrame.
+        """
+
+        return self.frame['equity']
+
+
+class Backtest():
+
+    """
+    Represents a backtest of the indicator signals, run over every bar of
+    every symbol at once.
+    """
+
+    def __init__(self, indicators: Indicators, initial_cash: float = 10000.0, slippage: float = 0.0005,
+                 commission: float = 0.0, fill_column: str = 'open', allow_short: bool = False,
+                 combine: str = 'all') -> None:
+        """Initalizes the Backtest.
+
+        Overview:
+        ----
+        The signals set with `Indicators.set_indicator_signal` and
+        `Indicators.set_indicator_signal_compare` are checked on every bar, not
+        just the last one, with the same `SignalEvaluator` used for live
+        signals. A buy signal goes long and a sell signal goes flat, or short
+        when `allow_short` is set; no signal keeps the position. The position
+        changes on the next bar, at the `fill_column` price, so a signal on a
+        bar's close is never traded at that same close.
+
+        Each symbol gets its own account of `initial_cash`, fully invested while
+        in a position. A bar compounds the return of the old position from the
+        previous close to the fill, the `slippage` and `commission` of each
+        unit of position traded, and the return of the new position from the
+        fill to the close. Nothing loops over the bars in
+        Python, so years of bars for hundreds of symbols run in seconds.
+
+        Arguments:
+        ----
+        indicators {Indicators} -- The indicators, with their columns calculated and
+            their signals set.
+
+        Keyword Arguments:
+        ----
+        initial_cash {float} -- The starting equity of each symbol. (default: {10000.0})
+
+        slippage {float} -- The price lost to slippage on each fill, as a
+            fraction of the price. (default: {0.0005})
+
+        commission {float} -- The commission on each fill, as a fraction of the
+            value traded. (default: {0.0})
+
+        fill_column {str} -- The price trades are filled at on the bar after the
+            signal, `close` is used if the column is missing. (default: {'open'})
+
+        allow_short {bool} -- If `True`, sell signals go short instead of flat. (default: {False})
+
+        combine {str} -- How the signals are combined, `all` or `any`. (default: {'all'})
+
+        Usage:
+        ----
+            >>> indicator_client = Indicators(price_data_frame=stock_frame)
+            >>> indicator_client.rsi(period=14)
+            >>> indicator_client.set_indicator_signal(
+                indicator='rsi', buy=30.0, sell=70.0, condition_buy=operator.le, condition_sell=operator.ge
+            )
+            >>> backtest_result = Backtest(indicators=indicator_client, slippage=0.001).run()
+            >>> backtest_result.summary
+        """
+
+        self.indicators = indicators
+        self.initial_cash = initial_cash
+        self.slippage = slippage
+        self.commission = commission
+        self.fill_column = fill_column
+        self.allow_short = allow_short
+        self.combine = combine
+
+    def signals(self) -> np.ndarray:
+        """Checks the signals on every bar of every symbol.
+
+        Returns:
+        ----
+        {np.ndarray} -- An `int8` array holding `1` for buy, `-1` for sell and `0`
+            otherwise, for each row of the frame.
+        """
+
+        evaluator = self.indicators.signal_evaluator(combine=self.combine)
+        stock_frame = self.indicators._stock_frame
+
+        stock_frame.do_indicator_exist(column_names=evaluator.columns)
+
+        # Every row is checked like the last row of a symbol is for live signals.
+        return evaluator.signals(
+            values=stock_frame.frame[evaluator.columns].to_numpy(dtype=np.float64)
+        )
+
+    def positions(self, signals: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+        """Turns the signals into the position held on each bar.
+
+        Arguments:
+        ----
+        signals {np.ndarray} -- The signal of each row.
+
+        offsets {np.ndarray} -- The symbol offsets.
+
+        Returns:
+        ----
+        {np.ndarray} -- The position held after each bar's fill, `1` for long, `-1`
+            for short and `0` for flat.
+        """
+
+        targets = np.full(signals.size, np.nan)
+        targets[signals == BUY] = 1.0
+        targets[signals == SELL] = -1.0 if self.allow_short else 0.0
+
+        # Every symbol starts flat, so nothing is carried over from the one before it.
+        first_rows = offsets[:-1][offsets[:-1] < signals.size]
+        targets[first_rows] = np.where(np.isnan(targets[first_rows]), 0.0, targets[first_rows])
+
+        # Carry each signal forward until the next one.
+        last_signal = np.where(np.isnan(targets), 0, np.arange(signals.size))
+        targets = targets[np.maximum.accumulate(last_signal)] if signals.size else targets
+
+        # The position changes on the bar after the signal.
+        return np.nan_to_num(kernels.shift(values=targets, periods=1, offsets=offsets), nan=0.0)
+
+    def run(self) -> BacktestResult:
+        """Runs the backtest.
+
+        Returns:
+        ----
+        {BacktestResult} -- The bars, the trades and the summary of each symbol.
+        """
+
+        stock_frame = self.indicators._stock_frame
+        frame = stock_frame.frame
+        offsets = stock_frame.symbol_offsets
+
+        close = frame['close'].to_numpy(dtype=np.float64)
+        fill = frame[self.fill_column].to_numpy(dtype=np.float64) if self.fill_column in frame.columns else close
+
+        signals = self.signals()
+        position = self.positions(signals=signals, offsets=offsets)
+
+        previous_position = np.nan_to_num(kernels.shift(values=position, periods=1, offsets=offsets), nan=0.0)
+        previous_close = kernels.shift(values=close, periods=1, offsets=offsets)
+        traded = np.abs(position - previous_position)
+
+        # Hold the old position up to the fill, pay for the trade, then hold the new one to the close.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            overnight = 1.0 + previous_position * (fill / previous_close - 1.0)
+            intraday = 1.0 + position * (close / fill - 1.0)
+
+        # Bars without prices, like the first bar of a symbol, don't move the equity.
+        overnight = np.where(np.isfinite(overnight), overnight, 1.0)
+        intraday = np.where(np.isfinite(intraday), intraday, 1.0)
+
+        returns = overnight * (1.0 - traded * (self.slippage + self.commission)) * intraday - 1.0
+
+        # Compound the returns inside each symbol, a loss of everything stays at zero.
+        growth = kernels.segmented_cumsum(values=np.log(np.maximum(1.0 + returns, 1e-300)), offsets=offsets)
+        equity = self.initial_cash * np.exp(growth)
+
+        result_frame = pd.DataFrame(
+            data={
+                'signal': signals,
+                'position': position,
+                'returns': returns,
+                'equity': equity
+            },
+            index=frame.index
+        )
+
+        trades = self._trades(
+            frame=frame,
+            position=position,
+            previous_position=previous_position,
+            fill=fill,
+            offsets=offsets
+        )
+
+        return BacktestResult(
+            frame=result_frame,
+            trades=trades,
+            summary=self._summary(equity=equity, trades=trades, offsets=offsets, symbols=stock_frame.symbols)
+        )
+
+    def _trades(self, frame: pd.DataFrame, position: np.ndarray, previous_position: np.ndarray,
+                fill: np.ndarray, offsets: np.ndarray) -> pd.DataFrame:
+        """Lists the trades, from the bar a position is opened to the bar it's closed.
+
+        Arguments:
+        ----
+        frame {pd.DataFrame} -- The price frame.
+
+        position {np.ndarray} -- The position held on each bar.
+
+        previous_position {np.ndarray} -- The position held on the bar before.
+
+        fill {np.ndarray} -- The fill price of each bar.
+
+        offsets {np.ndarray} -- The symbol offsets.
+
+        Returns:
+        ----
+        {pd.DataFrame} -- The `symbol`, `side`, `entry_date`, `entry_price`, `exit_date`,
+            `exit_price` and `returns` of each trade, trades still open have no exit.
+        """
+
+        changed = position != previous_position
+
+        entries = np.flatnonzero(changed & (position != 0))
+        exits = np.flatnonzero(changed & (previous_position != 0))
+
+        # A trade ends at the first exit after its entry, if that's still the same symbol.
+        symbol_ends = np.repeat(offsets[1:], np.diff(offsets))
+        candidates = np.searchsorted(exits, entries, side='right')
+        exit_rows = np.append(exits, -1)[candidates]
+        closed = (exit_rows >= 0) & (exit_rows < symbol_ends[entries])
+        exit_rows = np.where(closed, exit_rows, 0)
+
+        side = position[entries]
+        entry_price = fill[entries] * (1.0 + side * self.slippage)
+        exit_price = np.where(closed, fill[exit_rows] * (1.0 - side * self.slippage), np.nan)
+
+        dates = frame.index.get_level_values('date')
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            trade_returns = side * (exit_price / entry_price - 1.0) - 2 * self.commission
+
+        return pd.DataFrame(
+            data={
+                'symbol': frame.index.get_level_values('symbol')[entries],
+                'side': side.astype(np.int8),
+                'entry_date': dates[entries],
+                'entry_price': entry_price,
+                'exit_date': dates[exit_rows].where(closed),
+                'exit_price': exit_price,
+                'returns': trade_returns
+            }
+        )
+
+    def _summary(self, equity: np.ndarray, trades: pd.DataFrame, offsets: np.ndarray, symbols: pd.Index) -> pd.DataFrame:
+        """Summarizes the equity curve and the trades of each symbol.
+
+        Arguments:
+        ----
+        equity {np.ndarray} -- The equity of each bar.
+
+        trades {pd.DataFrame} -- The trades.
+
+        offsets {np.ndarray} -- The symbol offsets.
+
+        symbols {pd.Index} -- The symbols, in the order of the offsets.
+
+        Returns:
+        ----
+        {pd.DataFrame} -- The `final_equity`, `total_return`, `trades` and `max_drawdown`
+            of each symbol, indexed by symbol.
+        """
+
+        counts = np.diff(offsets)
+        non_empty = counts > 0
+
+        final_equity = np.full(counts.size, self.initial_cash)
+        final_equity[non_empty] = equity[offsets[1:][non_empty] - 1]
+
+        # The running peak of each symbol, the offset of the symbols keeps them apart.
+        codes = np.repeat(np.arange(counts.size), counts)
+        peaks = pd.Series(equity).groupby(codes).cummax().to_numpy()
+
+        max_drawdown = np.zeros(counts.size)
+        if equity.size:
+            drawdown = 1.0 - equity / peaks
+            max_drawdown[non_empty] = np.maximum.reduceat(drawdown, offsets[:-1][non_empty])
+
+        trade_counts: Dict[str, int] = trades['symbol'].value_counts().to_dict()
+
+        return pd.DataFrame(
+            data={
+                'final_equity': final_equity,
+                'total_return': final_equity / self.initial_cash - 1.0,
+                'trades': [trade_counts.get(symbol, 0) for symbol in symbols],
+                'max_drawdown': max_drawdown
+            },
+            index=pd.Index(symbols, name='symbol')
+        )
@@ -0,0 +1,196 @@
+import os
+import json
+import pickle
+import hashlib
+import tempfile
+import threading
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Optional
+from collections import OrderedDict
+
+
+def spec_hash(indicators: List[Dict]) -> str:
+    """Hashes a list of indicator specs, so equal specs share a key.
+
+    Arguments:
+    ----
+    indicators {List[Dict]} -- The indicator specs, as passed to `Indicators.compute`.
+
+    Returns:
+    ----
+    {str} -- The hex digest of the specs.
+    """
+
+    payload = json.dumps(obj=indicators, sort_keys=True, default=str)
+
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class ResultCache():
+
+    """
+    Represents a cache of the indicator results calculated for a blob,
+    kept in memory and optionally on disk.
+    """
+
+    def __init__(self, max_entries: int = 128, directory: str = None) -> None:
+        """Initalizes the Result Cache.
+
+        Overview:
+        ----
+        Each entry is keyed by the blob name and the hash of the indicator specs,
+        and holds the ETag of the blob it was calculated from. Before using an
+        entry, the blob is downloaded with `If-None-Match` set to that ETag, so
+        an unchanged blob costs a `304` instead of a download and a calculation.
+
+        The memory tier keeps the most recently used entries. When a directory
+        is given, entries are also written there, so they survive a worker
+        restart and can be shared by workers on the same machine. The entries
+        are pickled and unpickling them can run code, so the directory must not
+        be writable by anyone the app doesn't trust.
+
+        Keyword Arguments:
+        ----
+        max_entries {int} -- The number of entries kept in memory. (default: {128})
+
+        directory {str} -- The folder used for the disk tier, `None` turns the
+            disk tier off. (default: {None})
+
+        Usage:
+        ----
+            >>> result_cache = ResultCache(max_entries=256)
+            >>> result_cache.put(blob_name=blob_name, spec_key=spec_key, etag=etag, value=result)
+            >>> etag, result = result_cache.get(blob_name=blob_name, spec_key=spec_key)
+        """
+
+        self.max_entries = max_entries
+        self.directory = directory
+
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, blob_name: str, spec_key: str) -> Optional[Tuple[str, Any]]:
+        """Grabs an entry, looking in memory first and then on disk.
+
+        Arguments:
+        ----
+        blob_name {str} -- The name of the blob.
+
+        spec_key {str} -- The hash of the indicator specs.
+
+        Returns:
+        ----
+        {Optional[Tuple[str, Any]]} -- The ETag and the result, or `None` if
+            there's no entry.
+        """
+
+        key = (blob_name, spec_key)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        entry = self._read_entry(key=key)
+
+        if entry is not None:
+            self._remember(key=key, entry=entry)
+
+        return entry
+
+    def put(self, blob_name: str, spec_key: str, etag: str, value: Any) -> None:
+        """Adds an entry, replacing the one calculated from an older blob.
+
+        Arguments:
+        ----
+        blob_name {str} -- The name of the blob.
+
+        spec_key {str} -- The hash of the indicator specs.
+
+        etag {str} -- The ETag of the blob the result was calculated from.
+
+        value {Any} -- The result.
+        """
+
+        key = (blob_name, spec_key)
+        entry = (etag, value)
+
+        self._remember(key=key, entry=entry)
+        self._write_entry(key=key, entry=entry)
+
+    def clear(self) -> None:
+        """Removes the entries held in memory."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(self, key: tuple, entry: Tuple[str, Any]) -> None:
+        """Adds an entry to the memory tier and drops the least recently used ones."""
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _path(self, key: tuple) -> str:
+        """Returns the disk path of an entry."""
+
+        file_name = hashlib.sha1('|'.join(key).encode('utf-8')).hexdigest() + '.pkl'
+
+        return os.path.join(self.directory, file_name)
+
+    def _read_entry(self, key: tuple) -> Optional[Tuple[str, Any]]:
+        """Reads an entry from the disk tier."""
+
+        if not self.directory:
+            return None
+
+        path = self._path(key=key)
+
+        try:
+            with open(path, 'rb') as cache_file:
+                stored_key, etag, value = pickle.load(cache_file)
+        except FileNotFoundError:
+            return None
+
+        # An unreadable entry, for example one pickled by an older version of the
+        # code or of pandas, is removed and treated as a miss.
+        except Exception:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+        if stored_key != key:
+            return None
+
+        return etag, value
+
+    def _write_entry(self, key: tuple, entry: Tuple[str, Any]) -> None:
+        """Writes an entry to the disk tier, replacing the old file in one step."""
+
+        if not self.directory:
+            return
+
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+
+        try:
+            with os.fdopen(file_descriptor, 'wb') as cache_file:
+                pickle.dump((key, entry[0], entry[1]), cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._path(key=key))
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
@@ -0,0 +1,488 @@
+import json
+import time
+import asyncio
+import inspect
+import numpy as np
+import pandas as pd
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Callable
+from typing import Optional
+from typing import AsyncIterator
+from itertools import groupby
+from abc import ABC
+from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+from ..stock_frame.build import StockFrame
+from ..indicators.build import Indicators
+
+# The stages a batch of bars goes through, in order.
+STAGES = ['queue', 'add_rows', 'refresh', 'signals', 'callbacks', 'total']
+
+
+class BarSource(ABC):
+
+    """
+    Represents a feed of bars, handed out in batches. Each batch holds the
+    bars that closed together, usually one bar for each symbol.
+    """
+
+    @abstractmethod
+    def batches(self) -> AsyncIterator[List[Dict]]:
+        """Yields the batches of bars, until the feed ends, implemented as an async generator.
+
+        Yields:
+        ----
+        {List[Dict]} -- The bars, each one with a `symbol` and a `date` key, like
+            the ones passed to `StockFrame.add_rows`.
+        """
+
+
+class FileReplaySource(BarSource):
+
+    """
+    Replays the bars of a newline delimited JSON file, like the price
+    history kept in blob storage.
+    """
+
+    def __init__(self, path: str, interval: float = 0.0) -> None:
+        """Initalizes the File Replay Source.
+
+        Overview:
+        ----
+        The bars are sorted by date and the bars sharing a date are handed out
+        as one batch, the way they'd come out of a feed when the bar closes.
+
+        Arguments:
+        ----
+        path {str} -- The path of the file, one bar on each line.
+
+        Keyword Arguments:
+        ----
+        interval {float} -- The seconds to wait between batches, `0` replays
+            the file as fast as it can be processed. (default: {0.0})
+
+        Usage:
+        ----
+            >>> source = FileReplaySource(path='data/MSFT.json', interval=1.0)
+        """
+
+        self.path = path
+        self.interval = interval
+
+    def read(self) -> List[List[Dict]]:
+        """Reads the file into batches of bars, one batch for each date."""
+
+        with open(self.path, 'r', encoding='utf-8-sig') as bar_file:
+            bars = [json.loads(line) for line in bar_file if line.strip()]
+
+        bars.sort(key=lambda bar: pd.Timestamp(bar['date']))
+
+        return [list(batch) for _, batch in groupby(bars, key=lambda bar: pd.Timestamp(bar['date']))]
+
+    async def batches(self) -> AsyncIterator[List[Dict]]:
+
+        for position, batch in enumerate(self.read()):
+
+            if position and self.interval:
+                await asyncio.sleep(self.interval)
+
+            yield batch
+
+
+class SocketSource(BarSource):
+
+    """
+    Reads bars from a local TCP socket, a stand in for a market data feed.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8765) -> None:
+        """Initalizes the Socket Source.
+
+        Overview:
+        ----
+        The feed sends one JSON document on each line, either a single bar
+        or a list of bars that closed together. Each line is one batch. The
+        source ends when the feed closes the connection.
+
+        Keyword Arguments:
+        ----
+        host {str} -- The host of the feed. (default: {'127.0.0.1'})
+
+        port {int} -- The port of the feed. (default: {8765})
+
+        Usage:
+        ----
+            >>> source = SocketSource(host='127.0.0.1', port=8765)
+        """
+
+        self.host = host
+        self.port = port
+
+    async def batches(self) -> AsyncIterator[List[Dict]]:
+
+        reader, writer = await asyncio.open_connection(host=self.host, port=self.port)
+
+        try:
+            async for line in reader:
+
+                if not line.strip():
+                    continue
+
+                batch = json.loads(line)
+                yield batch if isinstance(batch, list) else [batch]
+
+        finally:
+            writer.close()
+
+
+class LatencyStats():
+
+    """
+    Represents the time each batch of bars spent in each stage of the engine.
+    """
+
+    def __init__(self, budget: float = 0.1) -> None:
+        """Initalizes the Latency Stats.
+
+        Keyword Arguments:
+        ----
+        budget {float} -- The most seconds a batch should take, from the moment
+            it's received until its signal callbacks are done. (default: {0.1})
+        """
+
+        self.budget = budget
+        self.timings: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+        self.batches = 0
+        self.bars = 0
+        self.over_budget = 0
+
+    def record(self, timings: Dict[str, float], bars: int) -> None:
+        """Records the seconds a batch spent in each stage.
+
+        Arguments:
+        ----
+        timings {Dict[str, float]} -- The seconds spent in each stage.
+
+        bars {int} -- The number of bars in the batch.
+        """
+
+        for stage in STAGES:
+            self.timings[stage].append(timings.get(stage, 0.0))
+
+        self.batches += 1
+        self.bars += bars
+
+        if timings['total'] > self.budget:
+            self.over_budget += 1
+
+    def summary(self) -> pd.DataFrame:
+        """Summarizes the latency of each stage.
+
+        Returns:
+        ----
+        {pd.DataFrame} -- The `mean`, `p50`, `p95`, `p99` and `max` milliseconds spent
+            in each stage, indexed by stage.
+        """
+
+        rows = {}
+
+        for stage, seconds in self.timings.items():
+
+            milliseconds = np.asarray(seconds, dtype=np.float64) * 1000.0
+
+            if milliseconds.size == 0:
+                rows[stage] = [np.nan] * 5
+                continue
+
+            rows[stage] = [
+                milliseconds.mean(),
+                *np.percentile(milliseconds, [50, 95, 99]),
+                milliseconds.max()
+            ]
+
+        return pd.DataFrame.from_dict(
+            data=rows,
+            orient='index',
+            columns=['mean', 'p50', 'p95', 'p99', 'max']
+        )
+
+    def __repr__(self) -> str:
+        total = np.asarray(self.timings['total']) * 1000.0
+
+        return '<LatencyStats batches={batches} bars={bars} p99_ms={p99:.2f} over_budget={over_budget}>'.format(
+            batches=self.batches,
+            bars=self.bars,
+            p99=np.percentile(total, 99) if total.size else float('nan'),
+            over_budget=self.over_budget
+        )
+
+
+class LiveEngine():
+
+    """
+    Represents the live loop, feeding bars from a source into a StockFrame,
+    refreshing the indicators and firing callbacks on the new signals.
+    """
+
+    def __init__(self, stock_frame: StockFrame, indicators: Indicators, source: BarSource,
+                 combine: str = 'all', incremental: bool = True, latency_budget: float = 0.1) -> None:
+        """Initalizes the Live Engine.
+
+        Overview:
+        ----
+        Bars are received on one task and processed on another, connected by a
+        queue. For each batch the engine adds the bars to the frame, refreshes
+        the indicators incrementally, so only the new rows are calculated for
+        the indicators that keep a running state, and checks the signals of
+        the symbols in the batch. If the engine falls behind, the batches
+        waiting in the queue are processed together, so a slow refresh costs
+        one refresh instead of letting the queue grow.
+
+        Adding the bars, refreshing the indicators and checking the signals
+        run on a worker thread, so the event loop keeps receiving bars, and
+        stamping the time they arrived, while a batch is processed. The time
+        each batch spends waiting and in every stage is recorded in `stats`,
+        against a budget counted from the moment the batch was received.
+
+        Arguments:
+        ----
+        stock_frame {StockFrame} -- The frame holding the price history.
+
+        indicators {Indicators} -- The indicators of the frame, with their signals set.
+
+        source {BarSource} -- The feed of bars.
+
+        Keyword Arguments:
+        ----
+        combine {str} -- How the signals are combined, `all` or `any`. (default: {'all'})
+
+        incremental {bool} -- If `True`, indicators with a running state only look
+            at the new rows. (default: {True})
+
+        latency_budget {float} -- The most seconds a batch should take. (default: {0.1})
+
+        Usage:
+        ----
+            >>> engine = LiveEngine(
+                stock_frame=stock_frame,
+                indicators=indicator_client,
+                source=FileReplaySource(path='data/bars.json')
+            )
+            >>> engine.add_callback(callback=lambda signals, bars: print(signals['buys']))
+            >>> stats = asyncio.run(engine.run())
+            >>> stats.summary()
+        """
+
+        self.stock_frame = stock_frame
+        self.indicators = indicators
+        self.source = source
+        self.combine = combine
+        self.incremental = incremental
+        self.stats = LatencyStats(budget=latency_budget)
+
+        self._callbacks: List[Callable] = []
+        self._queue: Optional[asyncio.Queue] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stopped = False
+
+    def add_callback(self, callback: Callable[[Dict[str, pd.Series], List[Dict]], Any]) -> None:
+        """Adds a function called with the signals of every batch that has any.
+
+        Arguments:
+        ----
+        callback {Callable[[Dict[str, pd.Series], List[Dict]], Any]} -- Called with the
+            `buys` and `sells`, like `Indicators.check_signals` returns them but only for
+            the symbols in the batch, and the bars of the batch. It can be a coroutine
+            function.
+        """
+
+        self._callbacks.append(callback)
+
+    def stop(self) -> None:
+        """Stops the engine once the batch being processed is done."""
+
+        self._stopped = True
+
+        if self._queue is not None:
+            self._queue.put_nowait(None)
+
+    async def run(self) -> LatencyStats:
+        """Runs the engine until the source ends or `stop` is called.
+
+        Returns:
+        ----
+        {LatencyStats} -- The latency of every batch.
+        """
+
+        self._stopped = False
+        self._queue = asyncio.Queue()
+
+        # A single worker, so the frame is only ever touched by one thread.
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+        receiver = asyncio.ensure_future(self._receive())
+
+        try:
+            await self._process()
+        finally:
+            receiver.cancel()
+
+            try:
+                await receiver
+            except asyncio.CancelledError:
+                pass
+
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        return self.stats
+
+    async def _receive(self) -> None:
+        """Puts each batch from the source on the queue, with the time it was received."""
+
+        try:
+            async for batch in self.source.batches():
+                self._queue.put_nowait((time.perf_counter(), batch))
+
+                if self._stopped:
+                    break
+        finally:
+            self._queue.put_nowait(None)
+
+    async def _process(self) -> None:
+        """Processes the batches on the queue, merging the ones that are waiting."""
+
+        while not self._stopped:
+
+            item = await self._queue.get()
+
+            if item is None:
+                return
+
+            received, bars = item
+            ended = False
+
+            # Catch up on everything that came in while the last batch was processed.
+            while not self._queue.empty():
+
+                waiting = self._queue.get_nowait()
+
+                if waiting is None:
+                    ended = True
+                    break
+
+                bars = bars + waiting[1]
+
+            await self.process(bars=bars, received=received)
+
+            if ended:
+                return
+
+    async def process(self, bars: List[Dict], received: float = None) -> Tuple[Dict[str, pd.Series], Dict[str, float]]:
+        """Adds a batch of bars, refreshes the indicators and fires the callbacks.
+
+        Arguments:
+        ----
+        bars {List[Dict]} -- The bars of the batch.
+
+        Keyword Arguments:
+        ----
+        received {float} -- The `time.perf_counter` the batch was received at,
+            `None` means now. (default: {None})
+
+        Returns:
+        ----
+        {Tuple[Dict[str, pd.Series], Dict[str, float]]} -- The signals of the symbols in
+            the batch and the seconds spent in each stage.
+        """
+
+        started = time.perf_counter()
+        received = started if received is None else received
+
+        # The blocking stages run off the event loop, so the receiver keeps stamping new bars.
+        signals, timings = await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._update, bars
+        )
+        timings['queue'] = started - received
+
+        stage = time.perf_counter()
+
+        if len(signals['buys']) or len(signals['sells']):
+            for callback in self._callbacks:
+
+                result = callback(signals, bars)
+
+                if inspect.isawaitable(result):
+                    await result
+
+        finished = time.perf_counter()
+        timings['callbacks'] = finished - stage
+        timings['total'] = finished - received
+
+        self.stats.record(timings=timings, bars=len(bars))
+
+        return signals, timings
+
+    def _update(self, bars: List[Dict]) -> Tuple[Dict[str, pd.Series], Dict[str, float]]:
+        """Adds the bars, refreshes the indicators and checks the signals, on the worker thread.
+
+        Arguments:
+        ----
+        bars {List[Dict]} -- The bars of the batch.
+
+        Returns:
+        ----
+        {Tuple[Dict[str, pd.Series], Dict[str, float]]} -- The signals of the symbols in
+            the batch and the seconds spent in each stage.
+        """
+
+        timings = {}
+
+        # Grab the bars.
+        stage = time.perf_counter()
+        self.stock_frame.add_rows(data=bars)
+        timings['add_rows'] = time.perf_counter() - stage
+
+        # Update the indicators.
+        stage = time.perf_counter()
+        self.indicators.refresh(incremental=self.incremental)
+        timings['refresh'] = time.perf_counter() - stage
+
+        # Check the signals, only the symbols with a new bar can have a new signal.
+        stage = time.perf_counter()
+        signals = self._batch_signals(symbols={bar['symbol'] for bar in bars})
+        timings['signals'] = time.perf_counter() - stage
+
+        return signals, timings
+
+    def _batch_signals(self, symbols: set) -> Dict[str, pd.Series]:
+        """Checks the signals, keeping only the symbols in the batch.
+
+        Arguments:
+        ----
+        symbols {set} -- The symbols in the batch.
+
+        Returns:
+        ----
+        {Dict[str, pd.Series]} -- The `buys` and `sells` of the symbols in the batch.
+        """
+
+        signal_array = self.indicators.signal_array(combine=self.combine)
+        in_batch = self.stock_frame.symbols.isin(list(symbols))
+
+        # Skip building the signal series when nothing fired.
+        if not np.any(signal_array[in_batch]):
+            index = self.stock_frame.frame.index[:0]
+            return {side: pd.Series(True, index=index, dtype=bool) for side in ('buys', 'sells')}
+
+        signals = self.indicators.check_signals(combine=self.combine)
+
+        return {
+            side: values[values.index.get_level_values('symbol').isin(list(symbols))]
+            for side, values in signals.items()
+        }
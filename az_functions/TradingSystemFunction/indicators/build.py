@@ -3,9 +3,23 @@ import pandas as pd
 
 from typing import Any
 from typing import Dict
-from typing import Union
-
+from typing import List
+from typing import Iterator
+from typing import Optional
+from typing import Sequence
+from contextlib import contextmanager
+
+from . import kernels
+from .kernels import KERNEL_COLUMNS
+from .kernels import INDICATOR_SWEEPS
+from .plan import IndicatorPlan
+from .plan import PLAN_BUILDERS
+from .context import IndicatorContext
+from .parallel import compute_parallel
+from .incremental import IndicatorState
+from .incremental import INDICATOR_STATES
 from ..stock_frame.build import StockFrame
+from ..signals.build import SignalEvaluator
 
 class Indicators():
 
@@ -38,7 +52,10 @@ class Indicators():
         self._stock_frame: StockFrame = price_data_frame
         self._price_groups = price_data_frame.symbol_groups
         self._current_indicators = {}
+        self._incremental_states: Dict[str, Dict[str, IndicatorState]] = {}
         self._indicator_signals = {}
+        self._signal_evaluators: Dict[str, SignalEvaluator] = {}
+        self._context: Optional[IndicatorContext] = None
         self._frame = self._stock_frame.frame
 
         self._indicators_comp_key = []
@@ -100,6 +117,9 @@ class Indicators():
             self._indicator_signals[indicator] = {}
             self._indicators_key.append(indicator)      
 
+        # The signals changed, so they need to be compiled again.
+        self._signal_evaluators = {}
+
         # Add the signals.
         self._indicator_signals[indicator]['buy'] = buy     
         self._indicator_signals[indicator]['sell'] = sell
@@ -147,6 +167,9 @@ class Indicators():
             self._indicator_signals[key] = {}
             self._indicators_comp_key.append(key)   
 
+        # The signals changed, so they need to be compiled again.
+        self._signal_evaluators = {}
+
         # Grab the dictionary.
         indicator_dict = self._indicator_signals[key]
 
@@ -193,6 +216,47 @@ class Indicators():
         else:
             return False
 
+    @contextmanager
+    def batch(self) -> Iterator[IndicatorContext]:
+        """Runs several indicators together and adds their columns to the frame at once.
+
+        Overview:
+        ----
+        Every indicator method runs inside an `IndicatorContext`, which keeps
+        the intermediate values out of the frame and adds the outputs in one
+        operation when the method is done. Inside a batch, the methods share a
+        single context, so the price columns are only read once and the frame
+        is only copied once, at the end of the batch. The frame returned by the
+        methods inside a batch doesn't have the new columns yet.
+
+        Yields:
+        ----
+        {IndicatorContext} -- The context shared by the indicators in the batch.
+
+        Usage:
+        ----
+            >>> indicator_client = Indicators(price_data_frame=stock_frame)
+            >>> with indicator_client.batch():
+                    indicator_client.rsi(period=14)
+                    indicator_client.macd(fast_period=12, slow_period=26)
+                    indicator_client.bollinger_bands(period=20)
+            >>> indicator_client.price_data_frame
+        """
+
+        # Indicators called inside a batch join it.
+        if self._context is not None:
+            yield self._context
+            return
+
+        self._context = IndicatorContext(stock_frame=self._stock_frame)
+
+        try:
+            yield self._context
+            self._frame = self._context.attach()
+            self._price_groups = self._stock_frame.symbol_groups
+        finally:
+            self._context = None
+
     def change_in_price(self, column_name: str = 'change_in_price') -> pd.DataFrame:
         """Calculates the Change in Price.
 
@@ -208,9 +272,8 @@ class Indicators():
         self._current_indicators[column_name]['args'] = locals_data
         self._current_indicators[column_name]['func'] = self.change_in_price
 
-        self._frame[column_name] = self._price_groups['close'].transform(
-            lambda x: x.diff()
-        )
+        with self.batch() as context:
+            context.plan.add(indicator='change_in_price', column_name=column_name)
 
         return self._frame
 
@@ -223,7 +286,8 @@ class Indicators():
 
         Keyword Arguments:
         ----
-        method {str} -- The calculation methodology. (default: {'wilders'})
+        method {str} -- The calculation methodology, `wilders` uses Wilder's moving
+            average and `ema` an exponential moving average. (default: {'wilders'})
 
         Returns:
         ----
@@ -250,45 +314,9 @@ class Indicators():
         self._current_indicators[column_name]['args'] = locals_data
         self._current_indicators[column_name]['func'] = self.rsi
 
-        # First calculate the Change in Price.
-        if 'change_in_price' not in self._frame.columns:
-            self.change_in_price()
-
-        # Define the up days.
-        self._frame['up_day'] = self._price_groups['change_in_price'].transform(
-            lambda x : np.where(x >= 0, x, 0)
-        )
-
-        # Define the down days.
-        self._frame['down_day'] = self._price_groups['change_in_price'].transform(
-            lambda x : np.where(x < 0, x.abs(), 0)
-        )
-
-        # Calculate the EWMA for the Up days.
-        self._frame['ewma_up'] = self._price_groups['up_day'].transform(
-            lambda x: x.ewm(span = period).mean()
-        )
-
-        # Calculate the EWMA for the Down days.
-        self._frame['ewma_down'] = self._price_groups['down_day'].transform(
-            lambda x: x.ewm(span = period).mean()
-        )
-
-        # Calculate the Relative Strength
-        relative_strength = self._frame['ewma_up'] / self._frame['ewma_down']
-
-        # Calculate the Relative Strength Index
-        relative_strength_index = 100.0 - (100.0 / (1.0 + relative_strength))
-
-        # Add the info to the data frame.
-        self._frame['rsi'] = np.where(relative_strength_index == 0, 100, 100 - (100 / (1 + relative_strength_index)))
-
-        # Clean up before sending back.
-        self._frame.drop(
-            labels=['ewma_up', 'ewma_down', 'down_day', 'up_day', 'change_in_price'],
-            axis=1,
-            inplace=True
-        )
+        # Average the up and down moves of every symbol in one pass.
+        with self.batch() as context:
+            context.plan.add(indicator='rsi', column_name=column_name, period=period, method=method)
 
         return self._frame
 
@@ -324,9 +352,8 @@ class Indicators():
         self._current_indicators[column_name]['func'] = self.sma
 
         # Add the SMA
-        self._frame[column_name] = self._price_groups['close'].transform(
-            lambda x: x.rolling(window=period).mean()
-        )
+        with self.batch() as context:
+            context.plan.add(indicator='sma', column_name=column_name, period=period)
 
         return self._frame
 
@@ -364,9 +391,8 @@ class Indicators():
         self._current_indicators[column_name]['func'] = self.ema
 
         # Add the EMA
-        self._frame[column_name] = self._price_groups['close'].transform(
-            lambda x: x.ewm(span=period).mean()
-        )
+        with self.batch() as context:
+            context.plan.add(indicator='ema', column_name=column_name, period=period, alpha=alpha)
 
         return self._frame
 
@@ -402,24 +428,33 @@ class Indicators():
         self._current_indicators[column_name]['func'] = self.rate_of_change
 
         # Add the Momentum indicator.
-        self._frame[column_name] = self._price_groups['close'].transform(
-            lambda x: x.pct_change(periods=period)
-        )
+        with self.batch() as context:
+            context.plan.add(indicator='rate_of_change', column_name=column_name, period=period)
 
-        return self._frame        
+        return self._frame
 
-    def bollinger_bands(self, period: int = 20, column_name: str = 'bollinger_bands') -> pd.DataFrame:
+    def bollinger_bands(self, period: int = 20, num_std: float = 2.0, column_name: str = 'bollinger_bands') -> pd.DataFrame:
         """Calculates the Bollinger Bands.
 
+        Overview:
+        ----
+        The middle band is the moving average of the close, and the upper and
+        lower bands sit `num_std` moving standard deviations above and below
+        it. The mean and the standard deviation come out of the same pass over
+        each window, and all three bands are added at once.
+
         Arguments:
         ----
         period {int} -- The number of periods to use when calculating 
             the Bollinger Bands. (default: {20})
 
+        num_std {float} -- The number of standard deviations between the middle
+            band and the outer bands. (default: {2.0})
+
         Returns:
         ----
-        {pd.DataFrame} -- A Pandas data frame with the Lower and Upper band
-            indicator included.
+        {pd.DataFrame} -- A Pandas data frame with the `band_upper`, `band_mid` and
+            `band_lower` columns included.
 
         Usage:
         ----
@@ -440,34 +475,11 @@ class Indicators():
         self._current_indicators[column_name]['args'] = locals_data
         self._current_indicators[column_name]['func'] = self.bollinger_bands
 
-        # Define the Moving Avg.
-        self._frame['moving_avg'] = self._price_groups['close'].transform(
-            lambda x : x.rolling(window=period).mean()
-        )
+        # Calculate the bands from one pass over the moving moments.
+        with self.batch() as context:
+            context.plan.add(indicator='bollinger_bands', column_name=column_name, period=period, num_std=num_std)
 
-        # Define Moving Std.
-        self._frame['moving_std'] = self._price_groups['close'].transform(
-            lambda x : x.rolling(window=period).std()
-        )
-
-        # Define the Upper Band.
-        self._frame['band_upper'] = 4 * (self._frame['moving_std'] / self._frame['moving_avg'])
-
-        # Define the lower band
-        self._frame['band_lower'] = (
-            (self._frame['close'] - self._frame['moving_avg']) + 
-            (2 * self._frame['moving_std']) / 
-            (4 * self._frame['moving_std'])
-        )
-
-        # Clean up before sending back.
-        self._frame.drop(
-            labels=['moving_avg', 'moving_std'],
-            axis=1,
-            inplace=True
-        )
-
-        return self._frame   
+        return self._frame
 
     def average_true_range(self, period: int = 14, column_name: str ='average_true_range') -> pd.DataFrame:
         """Calculates the Average True Range (ATR).
@@ -501,26 +513,9 @@ class Indicators():
         self._current_indicators[column_name]['args'] = locals_data
         self._current_indicators[column_name]['func'] = self.average_true_range
 
-
-        # Calculate the different parts of True Range.
-        self._frame['true_range_0'] = abs(self._frame['high'] - self._frame['low'])
-        self._frame['true_range_1'] = abs(self._frame['high'] - self._frame['close'].shift())
-        self._frame['true_range_2'] = abs(self._frame['low'] - self._frame['close'].shift())
-
-        # Grab the Max.
-        self._frame['true_range'] = self._frame[['true_range_0', 'true_range_1', 'true_range_2']].max(axis=1)
-
-        # Calculate the Average True Range.
-        self._frame['average_true_range'] = self._frame['true_range'].transform(
-            lambda x: x.ewm(span = period, min_periods = period).mean()
-        )
-
-        # Clean up before sending back.
-        self._frame.drop(
-            labels=['true_range_0', 'true_range_1', 'true_range_2', 'true_range'],
-            axis=1,
-            inplace=True
-        )
+        # Calculate the Average True Range, without reaching into the previous symbol's close.
+        with self.batch() as context:
+            context.plan.add(indicator='average_true_range', column_name=column_name, period=period)
 
         return self._frame
 
@@ -552,12 +547,17 @@ class Indicators():
         self._current_indicators[column_name]['func'] = self.stochastic_oscillator
 
         # Calculate the stochastic_oscillator.
-        self._frame['stochastic_oscillator'] = (
-            self._frame['close'] - self._frame['low'] / 
-            self._frame['high'] - self._frame['low']
-        )
+        with self.batch() as context:
 
-        return self._frame 
+            low = context.column(name='low')
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                context.add_output(
+                    column_name=column_name,
+                    values=(context.column(name='close') - low) / (context.column(name='high') - low)
+                )
+
+        return self._frame
 
     def macd(self, fast_period: int = 12, slow_period: int = 26, column_name: str = 'macd') -> pd.DataFrame:
         """Calculates the Moving Average Convergence Divergence (MACD).
@@ -594,25 +594,16 @@ class Indicators():
         self._current_indicators[column_name]['args'] = locals_data
         self._current_indicators[column_name]['func'] = self.macd
 
-        # Calculate the Fast Moving MACD.
-        self._frame['macd_fast'] = self._frame['close'].transform(
-            lambda x: x.ewm(span = fast_period, min_periods = fast_period).mean()
-        )
-
-        # Calculate the Slow Moving MACD.
-        self._frame['macd_slow'] = self._frame['close'].transform(
-            lambda x: x.ewm(span = slow_period, min_periods = slow_period).mean()
-        )
-
-        # Calculate the difference between the fast and the slow.
-        self._frame['macd_diff'] = self._frame['macd_fast'] - self._frame['macd_slow']
-
-        # Calculate the Exponential moving average of the fast.
-        self._frame['macd'] = self._frame['macd_diff'].transform(
-            lambda x: x.ewm(span = 9, min_periods = 8).mean()
-        )
+        # The fast and slow EWMAs are shared with any EMA of the same period in the batch.
+        with self.batch() as context:
+            context.plan.add(
+                indicator='macd',
+                column_name=column_name,
+                fast_period=fast_period,
+                slow_period=slow_period
+            )
 
-        return self._frame 
+        return self._frame
 
     def mass_index(self, period: int = 9, column_name: str = 'mass_index') -> pd.DataFrame:
         """Calculates the Mass Index indicator.
@@ -646,33 +637,36 @@ class Indicators():
         self._current_indicators[column_name]['args'] = locals_data
         self._current_indicators[column_name]['func'] = self.mass_index
 
-        # Calculate the Diff.
-        self._frame['diff'] = self._frame['high'] - self._frame['low']
+        with self.batch() as context:
 
-        # Calculate Mass Index 1
-        self._frame['mass_index_1'] = self._frame['diff'].transform(
-            lambda x: x.ewm(span = period, min_periods = period - 1).mean()
-        )
+            # Calculate the Diff.
+            high_low = context.column(name='high') - context.column(name='low')
 
-        # Calculate Mass Index 2
-        self._frame['mass_index_2'] = self._frame['mass_index_1'].transform(
-            lambda x: x.ewm(span = period, min_periods = period - 1).mean()
-        )
-        
-        # Grab the raw index.
-        self._frame['mass_index_raw'] = self._frame['mass_index_1'] / self._frame['mass_index_2']
+            # Calculate Mass Index 1
+            mass_index_1 = kernels.ewm_mean(
+                values=high_low,
+                alpha=2.0 / (period + 1.0),
+                min_periods=period - 1,
+                offsets=context.offsets
+            )
 
-        # Calculate the Mass Index.
-        self._frame['mass_index'] = self._frame['mass_index_raw'].transform(
-            lambda x: x.rolling(window=25).sum()
-        )
+            # Calculate Mass Index 2
+            mass_index_2 = kernels.ewm_mean(
+                values=mass_index_1,
+                alpha=2.0 / (period + 1.0),
+                min_periods=period - 1,
+                offsets=context.offsets
+            )
 
-        # Clean up before sending back.
-        self._frame.drop(
-            labels=['diff', 'mass_index_1', 'mass_index_2', 'mass_index_raw'],
-            axis=1,
-            inplace=True
-        )
+            # Grab the raw index.
+            with np.errstate(divide='ignore', invalid='ignore'):
+                mass_index_raw = mass_index_1 / mass_index_2
+
+            # Calculate the Mass Index.
+            context.add_output(
+                column_name=column_name,
+                values=kernels.rolling_sum(values=mass_index_raw, window=25, offsets=context.offsets)
+            )
 
         return self._frame
     
@@ -709,7 +703,14 @@ class Indicators():
         self._current_indicators[column_name]['func'] = self.force_index
 
         # Calculate the Force Index.
-        self._frame[column_name] = self._frame['close'].diff(period)  * self._frame['volume'].diff(period)
+        with self.batch() as context:
+            context.add_output(
+                column_name=column_name,
+                values=(
+                    kernels.diff(values=context.column(name='close'), periods=period, offsets=context.offsets) *
+                    kernels.diff(values=context.column(name='volume'), periods=period, offsets=context.offsets)
+                )
+            )
 
         return self._frame
 
@@ -744,23 +745,27 @@ class Indicators():
         self._current_indicators[column_name] = {}
         self._current_indicators[column_name]['args'] = locals_data
         self._current_indicators[column_name]['func'] = self.ease_of_movement
-        
-        # Calculate the ease of movement.
-        high_plus_low = (self._frame['high'].diff(1) + self._frame['low'].diff(1))
-        diff_divi_vol = (self._frame['high'] - self._frame['low']) / (2 * self._frame['volume'])
-        self._frame['ease_of_movement_raw'] = high_plus_low * diff_divi_vol
-
-        # Calculate the Rolling Average of the Ease of Movement.
-        self._frame['ease_of_movement'] = self._frame['ease_of_movement_raw'].transform(
-            lambda x: x.rolling(window=period).mean()
-        )
 
-        # Clean up before sending back.
-        self._frame.drop(
-            labels=['ease_of_movement_raw'],
-            axis=1,
-            inplace=True
-        )
+        with self.batch() as context:
+
+            high = context.column(name='high')
+            low = context.column(name='low')
+
+            # Calculate the ease of movement.
+            high_plus_low = kernels.diff(values=high, offsets=context.offsets) + kernels.diff(values=low, offsets=context.offsets)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                diff_divi_vol = (high - low) / (2 * context.column(name='volume'))
+
+            # Calculate the Rolling Average of the Ease of Movement.
+            context.add_output(
+                column_name=column_name,
+                values=kernels.rolling_mean(
+                    values=high_plus_low * diff_divi_vol,
+                    window=period,
+                    offsets=context.offsets
+                )
+            )
 
         return self._frame
 
@@ -796,28 +801,33 @@ class Indicators():
         self._current_indicators[column_name]['args'] = locals_data
         self._current_indicators[column_name]['func'] = self.commodity_channel_index
 
-        # Calculate the Typical Price.
-        self._frame['typical_price'] = (self._frame['high'] + self._frame['low'] + self._frame['close']) / 3
+        with self.batch() as context:
 
-        # Calculate the Rolling Average of the Typical Price.
-        self._frame['typical_price_mean'] = self._frame['pp'].transform(
-            lambda x: x.rolling(window=period).mean()
-        )
+            # Calculate the Typical Price.
+            typical_price = (
+                context.column(name='high') + context.column(name='low') + context.column(name='close')
+            ) / 3
 
-        # Calculate the Rolling Standard Deviation of the Typical Price.
-        self._frame['typical_price_std'] = self._frame['pp'].transform(
-            lambda x: x.rolling(window=period).std()
-        )
+            # Calculate the Rolling Average and Mean Deviation of the Typical Price.
+            typical_price_mean = kernels.rolling_mean(
+                values=typical_price,
+                window=period,
+                offsets=context.offsets
+            )
 
-        # Calculate the Commodity Channel Index.
-        self._frame[column_name] = self._frame['typical_price_mean'] / self._frame['typical_price_std']
+            typical_price_deviation = kernels.rolling_mean_deviation(
+                values=typical_price,
+                window=period,
+                offsets=context.offsets,
+                means=typical_price_mean
+            )
 
-        # Clean up before sending back.
-        self._frame.drop(
-            labels=['typical_price', 'typical_price_mean', 'typical_price_std'],
-            axis=1,
-            inplace=True
-        )
+            # Calculate the Commodity Channel Index.
+            with np.errstate(divide='ignore', invalid='ignore'):
+                context.add_output(
+                    column_name=column_name,
+                    values=(typical_price - typical_price_mean) / (0.015 * typical_price_deviation)
+                )
 
         return self._frame
 
@@ -853,10 +863,9 @@ class Indicators():
         self._current_indicators[column_name]['args'] = locals_data
         self._current_indicators[column_name]['func'] = self.standard_deviation
 
-        # Calculate the Standard Deviation.
-        self._frame[column_name] = self._frame['close'].transform(
-            lambda x: x.ewm(span=period).std()
-        )
+        # Calculate the Standard Deviation over each symbol's moving window.
+        with self.batch() as context:
+            context.plan.add(indicator='standard_deviation', column_name=column_name, period=period)
 
         return self._frame
 
@@ -892,46 +901,61 @@ class Indicators():
         self._current_indicators[column_name]['args'] = locals_data
         self._current_indicators[column_name]['func'] = self.chaikin_oscillator
 
-        # Calculate the Money Flow Multiplier.
-        money_flow_multiplier_top = 2 * (self._frame['close'] - self._frame['high'] - self._frame['low'])
-        money_flow_multiplier_bot = (self._frame['high'] - self._frame['low'])
+        with self.batch() as context:
 
-        # Calculate Money Flow Volume
-        self._frame['money_flow_volume'] = (money_flow_multiplier_top / money_flow_multiplier_bot) * self._frame['volume']
+            high = context.column(name='high')
+            low = context.column(name='low')
 
-        # Calculate the 3-Day moving average of the Money Flow Volume.
-        self._frame['money_flow_volume_3'] = self._frame['money_flow_volume'].transform(
-            lambda x: x.ewm(span=3, min_periods=2).mean()
-        )
+            # Calculate the Money Flow Multiplier.
+            money_flow_multiplier_top = 2 * (context.column(name='close') - high - low)
+            money_flow_multiplier_bot = high - low
 
-        # Calculate the 10-Day moving average of the Money Flow Volume.
-        self._frame['money_flow_volume_10'] = self._frame['money_flow_volume'].transform(
-            lambda x: x.ewm(span=10, min_periods=9).mean()
-        )
+            # Calculate Money Flow Volume
+            with np.errstate(divide='ignore', invalid='ignore'):
+                money_flow_volume = (
+                    money_flow_multiplier_top / money_flow_multiplier_bot
+                ) * context.column(name='volume')
 
-        # Calculate the Chaikin Oscillator.
-        self._frame[column_name] = self._frame['money_flow_volume_3'] - self._frame['money_flow_volume_10']
+            # Calculate the 3-Day moving average of the Money Flow Volume.
+            money_flow_volume_3 = kernels.ewm_mean(
+                values=money_flow_volume,
+                alpha=2.0 / (3 + 1.0),
+                min_periods=2,
+                offsets=context.offsets
+            )
 
-        # Clean up before sending back.
-        self._frame.drop(
-            labels=['money_flow_volume_3', 'money_flow_volume_10', 'money_flow_volume'],
-            axis=1,
-            inplace=True
-        )
+            # Calculate the 10-Day moving average of the Money Flow Volume.
+            money_flow_volume_10 = kernels.ewm_mean(
+                values=money_flow_volume,
+                alpha=2.0 / (10 + 1.0),
+                min_periods=9,
+                offsets=context.offsets
+            )
+
+            # Calculate the Chaikin Oscillator.
+            context.add_output(column_name=column_name, values=money_flow_volume_3 - money_flow_volume_10)
 
         return self._frame
 
-    def kst_oscillator(self, r1: int, r2: int, r3: int, r4: int, n1: int, n2: int, n3: int, n4: int, column_name: str = 'kst_oscillator') -> pd.DataFrame:
-        """Calculates the Mass Index indicator.
+    def kst_oscillator(self, r1: int, r2: int, r3: int, r4: int, n1: int, n2: int, n3: int, n4: int,
+                       signal_period: int = 9, column_name: str = 'kst_oscillator') -> pd.DataFrame:
+        """Calculates the Know Sure Thing (KST) Oscillator.
 
         Arguments:
         ----
-        period {int} -- The number of periods to use when calculating 
-            the mass index. (default: {9})
+        r1, r2, r3, r4 {int} -- The number of periods each of the four rates of
+            change looks back, plus one.
+
+        n1, n2, n3, n4 {int} -- The number of periods each rate of change is summed over.
+
+        Keyword Arguments:
+        ----
+        signal_period {int} -- The number of periods in the moving average used as
+            the signal line. (default: {9})
 
         Returns:
         ----
-        {pd.DataFrame} -- A Pandas data frame with the Mass Index included.
+        {pd.DataFrame} -- A Pandas data frame with the KST Oscillator and its signal line included.
 
         Usage:
         ----
@@ -943,7 +967,7 @@ class Indicators():
             )
             >>> price_data_frame = pd.DataFrame(data=historical_prices)
             >>> indicator_client = Indicators(price_data_frame=price_data_frame)
-            >>> indicator_client.mass_index(period=9)
+            >>> indicator_client.kst_oscillator(r1=10, r2=15, r3=20, r4=30, n1=10, n2=10, n3=10, n4=15)
         """
 
         locals_data = locals()
@@ -953,61 +977,282 @@ class Indicators():
         self._current_indicators[column_name]['args'] = locals_data
         self._current_indicators[column_name]['func'] = self.kst_oscillator
 
-        # Calculate the ROC 1.
-        self._frame['roc_1'] = self._frame['close'].diff(r1 - 1)  / self._frame['close'].shift(r1 - 1)
+        with self.batch() as context:
 
-        # Calculate the ROC 2.
-        self._frame['roc_2'] = self._frame['close'].diff(r2 - 1)  / self._frame['close'].shift(r2 - 1)
+            close = context.column(name='close')
+            kst = np.zeros(close.size)
 
-        # Calculate the ROC 3.
-        self._frame['roc_3'] = self._frame['close'].diff(r3 - 1)  / self._frame['close'].shift(r3 - 1)
+            # Add up the summed Rates of Change, weighted 1 to 4.
+            for weight, (rate_period, sum_period) in enumerate(zip([r1, r2, r3, r4], [n1, n2, n3, n4]), start=1):
 
-        # Calculate the ROC 4.
-        self._frame['roc_4'] = self._frame['close'].diff(r4 - 1)  / self._frame['close'].shift(r4 - 1)
+                rate_of_change = kernels.pct_change(values=close, periods=rate_period - 1, offsets=context.offsets)
 
+                kst += weight * kernels.rolling_sum(values=rate_of_change, window=sum_period, offsets=context.offsets)
 
-        # Calculate the Mass Index.
-        self._frame['roc_1_n'] = self._frame['roc_1'].transform(
-            lambda x: x.rolling(window=n1).sum()
-        )
+            context.add_output(column_name=column_name, values=100 * kst)
+            context.add_output(
+                column_name=column_name + "_signal",
+                values=kernels.rolling_mean(values=100 * kst, window=signal_period, offsets=context.offsets)
+            )
 
-        # Calculate the Mass Index.
-        self._frame['roc_2_n'] = self._frame['roc_2'].transform(
-            lambda x: x.rolling(window=n2).sum()
-        )
+        return self._frame
 
-        # Calculate the Mass Index.
-        self._frame['roc_3_n'] = self._frame['roc_3'].transform(
-            lambda x: x.rolling(window=n3).sum()
-        )
+    def compute(self, indicators: List[Dict], workers: int = 1) -> pd.DataFrame:
+        """Calculates several indicators in a single pass over the frame.
 
-        # Calculate the Mass Index.
-        self._frame['roc_4_n'] = self._frame['roc_4'].transform(
-            lambda x: x.rolling(window=n4).sum()
-        )
+        Overview:
+        ----
+        The indicators are added to one plan, so the steps they share, like
+        the change in price used by `change_in_price` and `rsi`, or the EWMA of
+        the close used by `ema` and `macd`, are calculated once. Each step runs
+        over a whole price column at once, using the symbol offsets to start
+        over at each symbol, and the columns are then added to the frame in one
+        go. The supported indicators are `change_in_price`, `rate_of_change`,
+        `sma`, `ema`, `rsi`, `standard_deviation`, `bollinger_bands`,
+        `average_true_range` and `macd`.
+
+        With more than one worker, the symbols are split into shards of about
+        the same number of rows and the plan runs on a process pool, see
+        `compute_parallel`. The results are the same.
 
-        self._frame[column_name] = 100 * (self._frame['roc_1_n'] + 2 * self._frame['roc_2_n'] + 3 * self._frame['roc_3_n'] + 4 * self._frame['roc_4_n'])
-        self._frame[column_name + "_signal"] = self._frame['column_name'].transform(
-            lambda x: x.rolling().mean()
-        )
-        
-        # Clean up before sending back.
-        self._frame.drop(
-            labels=['roc_1', 'roc_2', 'roc_3', 'roc_4', 'roc_1_n', 'roc_2_n', 'roc_3_n', 'roc_4_n'],
-            axis=1,
-            inplace=True
-        )
+        Arguments:
+        ----
+        indicators {List[Dict]} -- The indicators to calculate. Each one is a dictionary
+            with an `indicator` key holding the method name and the same arguments the
+            method takes, including an optional `column_name`.
+
+        Keyword Arguments:
+        ----
+        workers {int} -- The number of processes, `None` uses every core. (default: {1})
+
+        Raises:
+        ----
+        ValueError: If one of the indicators can't be planned.
+
+        Returns:
+        ----
+        {pd.DataFrame} -- A Pandas data frame with the indicators included.
+
+        Usage:
+        ----
+            >>> indicator_client = Indicators(price_data_frame=stock_frame)
+            >>> indicator_client.compute(
+                indicators=[
+                    {'indicator': 'rsi', 'period': 14},
+                    {'indicator': 'sma', 'period': 100},
+                    {'indicator': 'ema', 'period': 50, 'column_name': 'ema_50'}
+                ]
+            )
+        """
+
+        self._frame = self._stock_frame.frame
+
+        # Check the whole list before anything is added.
+        self.plan(indicators=indicators)
+
+        with self.batch() as context:
+
+            for indicator in indicators:
+
+                arguments = dict(indicator)
+                name = arguments.pop('indicator')
+                column_name = arguments.pop('column_name', name)
+
+                self._current_indicators[column_name] = {}
+                self._current_indicators[column_name]['args'] = dict(arguments, column_name=column_name)
+                self._current_indicators[column_name]['func'] = getattr(self, name)
+
+                if workers == 1:
+                    context.plan.add(indicator=name, column_name=column_name, **arguments)
+
+            # Hand the whole plan to the pool, the outputs come back as one block.
+            if workers != 1:
+                context.add_output(
+                    column_name=None,
+                    values=compute_parallel(stock_frame=self._stock_frame, indicators=indicators, workers=workers)
+                )
 
         return self._frame
 
-    def refresh(self):
-        """Updates the Indicator columns after adding the new rows."""
+    def plan(self, indicators: List[Dict] = None) -> IndicatorPlan:
+        """Builds the plan for a list of indicators, without calculating it.
+
+        Arguments:
+        ----
+        indicators {List[Dict]} -- The indicators, in the same format as `compute`.
+            `None` plans the indicators added so far that can be planned. (default: {None})
+
+        Raises:
+        ----
+        ValueError: If one of the indicators can't be planned.
+
+        Returns:
+        ----
+        {IndicatorPlan} -- The plan.
+        """
+
+        if indicators is None:
+            indicators = [
+                dict(indicator['args'], indicator=indicator['func'].__name__)
+                for indicator in self._current_indicators.values()
+                if indicator['func'].__name__ in PLAN_BUILDERS
+            ]
+
+        indicator_plan = IndicatorPlan()
+
+        for indicator in indicators:
+            arguments = dict(indicator)
+            indicator_plan.add(indicator=arguments.pop('indicator'), **arguments)
+
+        return indicator_plan
+
+    def explain(self, indicators: List[Dict] = None) -> str:
+        """Describes how a list of indicators would be calculated.
+
+        Overview:
+        ----
+        Shows each step of the plan in the order it runs, the steps that read
+        it, when it's freed, and the columns it's written to. A step read by
+        more than one indicator is only calculated once.
+
+        Arguments:
+        ----
+        indicators {List[Dict]} -- The indicators, in the same format as `compute`.
+            `None` explains the indicators added so far. (default: {None})
+
+        Returns:
+        ----
+        {str} -- The description of the plan.
+
+        Usage:
+        ----
+            >>> indicator_client = Indicators(price_data_frame=stock_frame)
+            >>> print(
+                indicator_client.explain(
+                    indicators=[
+                        {'indicator': 'ema', 'period': 12},
+                        {'indicator': 'macd', 'fast_period': 12, 'slow_period': 26}
+                    ]
+                )
+            )
+        """
+
+        return self.plan(indicators=indicators).explain()
+
+    def sweep(self, indicator: str, periods: Sequence[int], column_name: str = None,
+              add_columns: bool = True, **arguments) -> pd.DataFrame:
+        """Calculates one indicator for many periods in a single vectorized call.
+
+        Overview:
+        ----
+        Calling `sma` in a loop over a range of periods scans the close prices
+        once per period and inserts one column at a time. A sweep builds the
+        shared parts once, the running sums for `sma` and `bollinger_bands`,
+        the price changes for `rsi` and the missing value mask for `ema`, and
+        fills one block with a column per period. The block is then added to
+        the frame in a single `pd.concat`.
+
+        The columns are named `<column_name>_<period>`, and for the Bollinger
+        Bands `band_upper_<period>`, `band_mid_<period>` and `band_lower_<period>`.
+
+        Arguments:
+        ----
+        indicator {str} -- The indicator, one of `sma`, `ema`, `rsi` or `bollinger_bands`.
+
+        periods {Sequence[int]} -- The periods to calculate.
+
+        Keyword Arguments:
+        ----
+        column_name {str} -- The prefix of the column names, `None` uses the
+            indicator name. (default: {None})
+
+        add_columns {bool} -- If `True`, the columns are added to the frame and
+            recalculated on `refresh`. If `False`, they are only returned. (default: {True})
+
+        **arguments -- The other arguments of the indicator, like `method` for
+            `rsi` or `num_std` for `bollinger_bands`.
+
+        Raises:
+        ----
+        ValueError: If the indicator can't be swept.
+
+        Returns:
+        ----
+        {pd.DataFrame} -- The swept columns, indexed like the frame.
+
+        Usage:
+        ----
+            >>> indicator_client = Indicators(price_data_frame=stock_frame)
+            >>> sma_block = indicator_client.sweep(indicator='sma', periods=range(5, 201))
+            >>> sma_block['sma_50']
+        """
+
+        if indicator not in INDICATOR_SWEEPS:
+            raise ValueError(
+                "The indicator `{indicator}` can't be swept, supported indicators are: {supported}".format(
+                    indicator=indicator,
+                    supported=list(INDICATOR_SWEEPS)
+                )
+            )
+
+        periods = [int(period) for period in periods]
+        column_name = column_name or indicator
+
+        if add_columns:
+            self._current_indicators[column_name + '_sweep'] = {}
+            self._current_indicators[column_name + '_sweep']['args'] = dict(
+                arguments, indicator=indicator, periods=periods, column_name=column_name
+            )
+            self._current_indicators[column_name + '_sweep']['func'] = self.sweep
+
+        with self.batch() as context:
+
+            columns = {
+                column: context.column(name=column) for column in KERNEL_COLUMNS.get(indicator, ['close'])
+            }
+
+            blocks = INDICATOR_SWEEPS[indicator](columns, context.offsets, periods, **arguments)
+
+            if not isinstance(blocks, dict):
+                blocks = {column_name: blocks}
+
+            frames = [
+                pd.DataFrame(
+                    data=block,
+                    index=context.index,
+                    columns=['{prefix}_{period}'.format(prefix=prefix, period=period) for period in periods],
+                    copy=False
+                )
+                for prefix, block in blocks.items()
+            ]
+
+            swept = frames[0] if len(frames) == 1 else pd.concat(frames, axis=1)
+
+            if add_columns:
+                context.add_output(column_name=column_name, values=swept)
+
+        return swept
+
+    def refresh(self, incremental: bool = False):
+        """Updates the Indicator columns after adding the new rows.
+
+        Keyword Arguments:
+        ----
+        incremental {bool} -- If `True`, indicators that keep a running state
+            (`change_in_price`, `rate_of_change`, `sma`, `ema`, `rsi`, `bollinger_bands`
+            and `average_true_range`) are only calculated for the rows added since the
+            last refresh. The other indicators are still recalculated over the whole
+            frame. (default: {False})
+        """
 
         # First update the groups since, we have new rows.
+        self._frame = self._stock_frame.frame
         self._price_groups = self._stock_frame.symbol_groups
 
+        batch = []
+
         # Grab all the details of the indicators so far.
-        for indicator in self._current_indicators:
+        for indicator in list(self._current_indicators):
             
             # Grab the function.
             indicator_argument = self._current_indicators[indicator]['args']
@@ -1015,22 +1260,164 @@ class Indicators():
             # Grab the arguments.
             indicator_function = self._current_indicators[indicator]['func']
 
+            # Indicators with a running state only look at the new rows.
+            if incremental and indicator_function.__name__ in INDICATOR_STATES:
+                self._update_incremental(
+                    name=indicator_function.__name__,
+                    arguments=indicator_argument
+                )
+                continue
+
+            # Indicators that can be planned get calculated together.
+            if indicator_function.__name__ in PLAN_BUILDERS:
+                batch.append(dict(indicator_argument, indicator=indicator_function.__name__))
+                continue
+
             # Update the function.
             indicator_function(**indicator_argument)
 
-    def check_signals(self) -> Union[pd.DataFrame, None]:
+        if batch:
+            self.compute(indicators=batch)
+
+    def _update_incremental(self, name: str, arguments: dict) -> None:
+        """Feeds the rows added since the last refresh to an indicator's running state.
+
+        Overview:
+        ----
+        Each symbol keeps its own state along with the number of rows it has seen
+        and the date of the last one. If the rows no longer line up, for example
+        because rows were inserted in the middle, the state is rebuilt from the
+        start of that symbol's history.
+
+        Arguments:
+        ----
+        name {str} -- The name of the indicator method.
+
+        arguments {dict} -- The arguments the indicator was added with.
+        """
+
+        states = self._incremental_states.setdefault(arguments['column_name'], {})
+
+        grouping = self._stock_frame.grouping
+        symbols = grouping.symbols
+        offsets = grouping.offsets
+
+        # Read the dates once, looking a row up in the MultiIndex costs more than the update.
+        dates = self._frame.index.get_level_values('date').values
+
+        columns = {
+            column: self._frame[column].to_numpy(dtype=np.float64)
+            for column in ['open', 'high', 'low', 'close'] if column in self._frame.columns
+        }
+
+        positions = []
+        outputs = {}
+
+        for symbol, start, end in zip(symbols, offsets[:-1], offsets[1:]):
+
+            state = states.get(symbol)
+
+            # Start over if the rows we already processed have changed.
+            if state is None or state.rows > end - start or (
+                state.rows and dates[start + state.rows - 1] != state.last_date
+            ):
+                state = INDICATOR_STATES[name](**arguments)
+                states[symbol] = state
+
+            first = start + state.rows
+
+            if first == end:
+                continue
+
+            new_values = state.update(
+                bars={column: values[first:end] for column, values in columns.items()}
+            )
+
+            state.rows = end - start
+            state.last_date = dates[end - 1]
+
+            positions.append(np.arange(first, end))
+
+            for column, values in new_values.items():
+                outputs.setdefault(column, []).append(values)
+
+        if not positions:
+            return
+
+        positions = np.concatenate(positions)
+
+        for column, values in outputs.items():
+            self._stock_frame.set_values(
+                column=column,
+                positions=positions,
+                values=np.concatenate(values)
+            )
+
+        self._frame = self._stock_frame.frame
+
+    def signal_evaluator(self, combine: str = 'all') -> SignalEvaluator:
+        """Returns the indicator signals compiled into a `SignalEvaluator`.
+
+        Overview:
+        ----
+        The evaluator is kept until another signal is set, so checking
+        the signals on every new bar doesn't compile them again.
+
+        Keyword Arguments:
+        ----
+        combine {str} -- How the signals are combined, `all` or `any`. (default: {'all'})
+
+        Returns:
+        ----
+        {SignalEvaluator} -- The compiled signals.
+        """
+
+        if combine not in self._signal_evaluators:
+            self._signal_evaluators[combine] = SignalEvaluator(
+                indicators=self._indicator_signals,
+                indicators_key=self._indicators_key,
+                indicators_comp_key=self._indicators_comp_key,
+                combine=combine
+            )
+
+        return self._signal_evaluators[combine]
+
+    def check_signals(self, combine: str = 'all') -> Dict[str, pd.Series]:
         """Checks to see if any signals have been generated.
 
+        Keyword Arguments:
+        ----
+        combine {str} -- How the signals are combined, `all` means every signal must
+            be met and `any` means a single signal is enough. (default: {'all'})
+
         Returns:
         ----
-        {Union[pd.DataFrame, None]} -- If signals are generated then a pandas.DataFrame
-            is returned otherwise nothing is returned.
+        {Dict[str, pd.Series]} -- The `buys` and `sells`, each indexed by the last
+            row of the symbols where the signal was generated.
         """
 
         signals_df = self._stock_frame._check_signals(
             indicators=self._indicator_signals,
             indciators_comp_key=self._indicators_comp_key,
-            indicators_key=self._indicators_key
+            indicators_key=self._indicators_key,
+            evaluator=self.signal_evaluator(combine=combine)
         )
 
         return signals_df
+
+    def signal_array(self, combine: str = 'all') -> np.ndarray:
+        """Returns a single signal for each symbol.
+
+        Keyword Arguments:
+        ----
+        combine {str} -- How the signals are combined, `all` or `any`. (default: {'all'})
+
+        Returns:
+        ----
+        {np.ndarray} -- An `int8` array holding `1` for buy, `-1` for sell and `0`
+            otherwise, in the order of `StockFrame.symbols`.
+        """
+
+        return self._stock_frame.evaluate_signals(
+            evaluator=self.signal_evaluator(combine=combine)
+        )
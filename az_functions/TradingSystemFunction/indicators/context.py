@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+
+from typing import Dict
+from typing import List
+from typing import Union
+
+from .plan import IndicatorPlan
+from ..stock_frame.build import StockFrame
+
+
+class IndicatorContext():
+
+    """
+    Represents a single run of one or more indicators, holding their
+    inputs and outputs until they are added to the StockFrame.
+    """
+
+    def __init__(self, stock_frame: StockFrame) -> None:
+        """Initalizes the Indicator Context.
+
+        Overview:
+        ----
+        Writing intermediate values into the frame and dropping them again
+        reallocates the frame's storage every time, and adding the outputs
+        one column at a time leaves it fragmented. The context reads each price
+        column from the frame once, keeps intermediate values as plain arrays,
+        and collects the outputs so they can be added to the frame in a single
+        operation when the run is over.
+
+        Indicators added to the context's `plan` are held back until the run
+        is over, so the steps they have in common, like the change in price or
+        an EWMA of the close, are only calculated once.
+
+        Arguments:
+        ----
+        stock_frame {StockFrame} -- The StockFrame the indicators are calculated for.
+
+        Usage:
+        ----
+            >>> context = IndicatorContext(stock_frame=stock_frame)
+            >>> close = context.column(name='close')
+            >>> context.add_output(
+                column_name='sma',
+                values=kernels.rolling_mean(values=close, window=20, offsets=context.offsets)
+            )
+            >>> context.attach()
+        """
+
+        self._stock_frame = stock_frame
+        self._frame = stock_frame.frame
+        self._columns: Dict[str, np.ndarray] = {}
+        self._blocks: List[pd.DataFrame] = []
+
+        self.index = self._frame.index
+        self.offsets = stock_frame.grouping.offsets
+        self.outputs: Dict[str, np.ndarray] = {}
+        self.plan = IndicatorPlan()
+
+    def __len__(self) -> int:
+        planned = sum(len(node.outputs) for node in self.plan.nodes.values())
+        return len(self.outputs) + sum(len(block.columns) for block in self._blocks) + planned
+
+    def column(self, name: str) -> np.ndarray:
+        """Grabs a column as a float array, including the outputs of this run.
+
+        Arguments:
+        ----
+        name {str} -- The name of the column.
+
+        Returns:
+        ----
+        {np.ndarray} -- The values of the column.
+        """
+
+        if name in self.outputs:
+            return self.outputs[name]
+
+        if name not in self._columns:
+            self._columns[name] = self._frame[name].to_numpy(dtype=np.float64)
+
+        return self._columns[name]
+
+    def add_output(self, column_name: str, values: Union[np.ndarray, pd.DataFrame]) -> None:
+        """Keeps an output so it can be added to the frame with the others.
+
+        Arguments:
+        ----
+        column_name {str} -- The column the values are written to, ignored for
+            a data frame, which keeps its own column names.
+
+        values {Union[np.ndarray, pd.DataFrame]} -- The values, aligned with the rows
+            of the frame, or a block of columns indexed like the frame.
+        """
+
+        if isinstance(values, pd.DataFrame):
+            self._blocks.append(values)
+        else:
+            self.outputs[column_name] = values
+
+    def attach(self) -> pd.DataFrame:
+        """Adds every output to the StockFrame in a single operation.
+
+        Returns:
+        ----
+        {pd.DataFrame} -- The frame with the outputs included.
+        """
+
+        # Calculate the planned indicators first, they're outputs like the others.
+        if len(self.plan):
+            self.plan.run(context=self)
+
+        if not len(self):
+            return self._stock_frame.frame
+
+        parts = self._blocks
+
+        if self.outputs:
+            parts = [pd.DataFrame(data=self.outputs, index=self._frame.index)] + parts
+
+        columns = parts[0] if len(parts) == 1 else pd.concat(parts, axis=1)
+
+        # A later output with the same name replaces the earlier one.
+        columns = columns.loc[:, ~columns.columns.duplicated(keep='last')]
+
+        self.outputs = {}
+        self._blocks = []
+
+        return self._stock_frame.add_columns(columns=columns)
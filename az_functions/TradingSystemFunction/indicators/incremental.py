@@ -0,0 +1,369 @@
+import numpy as np
+
+from abc import ABC
+from abc import abstractmethod
+from typing import Dict
+from typing import Type
+
+from . import kernels
+
+
+class IndicatorState(ABC):
+
+    """
+    Represents the running state of an indicator for a single symbol,
+    so new bars can be added without going back over the history.
+    """
+
+    def __init__(self, column_name: str) -> None:
+        """Initalizes the Indicator State.
+
+        Arguments:
+        ----
+        column_name {str} -- The column the indicator is written to.
+        """
+
+        self.column_name = column_name
+        self.rows = 0
+        self.last_date = None
+
+    @abstractmethod
+    def update(self, bars: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Calculates the indicator for the new bars and updates the state.
+
+        Arguments:
+        ----
+        bars {Dict[str, np.ndarray]} -- The new `open`, `high`, `low` and `close`
+            values for the symbol.
+
+        Returns:
+        ----
+        {Dict[str, np.ndarray]} -- The indicator values for the new bars, keyed
+            by column name.
+        """
+
+
+class EwmState():
+
+    """
+    Keeps the weighted sums of an exponentially weighted mean.
+    """
+
+    def __init__(self, alpha: float, min_periods: int = 0) -> None:
+        """Initalizes the EWM State.
+
+        Arguments:
+        ----
+        alpha {float} -- The smoothing factor.
+
+        Keyword Arguments:
+        ----
+        min_periods {int} -- The number of observations needed before a value
+            is returned. (default: {0})
+        """
+
+        self.decay = 1.0 - alpha
+        self.min_periods = max(min_periods, 1)
+
+        self.numerator = 0.0
+        self.denominator = 0.0
+        self.observations = 0
+
+    def update(self, values: np.ndarray) -> np.ndarray:
+        """Adds the new values and returns the means.
+
+        Arguments:
+        ----
+        values {np.ndarray} -- The new values.
+
+        Returns:
+        ----
+        {np.ndarray} -- The exponentially weighted means at each new value.
+        """
+
+        if values.size == 0:
+            return np.empty(0)
+
+        numerators, denominators = kernels.ewm_sums(
+            values=values,
+            decay=self.decay,
+            numerator=self.numerator,
+            denominator=self.denominator
+        )
+
+        observations = self.observations + np.cumsum(~np.isnan(values))
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            output = numerators / denominators
+
+        output[observations < self.min_periods] = np.nan
+
+        self.numerator = numerators[-1]
+        self.denominator = denominators[-1]
+        self.observations = int(observations[-1])
+
+        return output
+
+
+class WilderState():
+
+    """
+    Keeps the running average of Wilder's moving average.
+    """
+
+    def __init__(self, period: int) -> None:
+        """Initalizes the Wilder State.
+
+        Arguments:
+        ----
+        period {int} -- The number of values averaged.
+        """
+
+        self.period = period
+        self.decay = 1.0 - 1.0 / period
+
+        self.count = 0
+        self.total = 0.0
+        self.value = np.nan
+
+    def update(self, values: np.ndarray) -> np.ndarray:
+        """Adds the new values and returns the averages.
+
+        Arguments:
+        ----
+        values {np.ndarray} -- The new values, missing values count as zero.
+
+        Returns:
+        ----
+        {np.ndarray} -- The averages at each new value, `NaN` until there are
+            `period` values.
+        """
+
+        values = np.nan_to_num(values, nan=0.0)
+        output = np.full(values.size, np.nan)
+
+        first = 0
+
+        # Sum up the first `period` values for the seed.
+        if self.count < self.period:
+
+            first = min(self.period - self.count, values.size)
+
+            self.total += values[:first].sum()
+            self.count += first
+
+            if self.count < self.period:
+                return output
+
+            self.value = self.total / self.period
+            output[first - 1] = self.value
+
+        if first < values.size:
+
+            smoothed = kernels.linear_scan(
+                inputs=(1.0 - self.decay) * values[first:],
+                decay=self.decay,
+                initial=self.value
+            )
+
+            output[first:] = smoothed
+            self.value = smoothed[-1]
+
+        return output
+
+
+class WindowState():
+
+    """
+    Keeps the last values of a rolling window.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initalizes the Window State.
+
+        Arguments:
+        ----
+        size {int} -- The number of values to keep.
+        """
+
+        self.size = size
+        self.values = np.empty(0)
+
+    def extend(self, values: np.ndarray) -> np.ndarray:
+        """Returns the kept values followed by the new ones, and keeps the new tail.
+
+        Arguments:
+        ----
+        values {np.ndarray} -- The new values.
+
+        Returns:
+        ----
+        {np.ndarray} -- The kept values followed by the new values.
+        """
+
+        joined = np.concatenate([self.values, values])
+        self.values = joined[max(joined.size - self.size, 0):]
+
+        return joined
+
+
+class ChangeInPriceState(IndicatorState):
+
+    """Keeps the previous close for `change_in_price`."""
+
+    def __init__(self, column_name: str = 'change_in_price') -> None:
+        super().__init__(column_name=column_name)
+        self.window = WindowState(size=1)
+
+    def update(self, bars: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+
+        kept = self.window.values.size
+        joined = self.window.extend(values=bars['close'])
+
+        return {self.column_name: kernels.diff(values=joined)[kept:]}
+
+
+class RateOfChangeState(IndicatorState):
+
+    """Keeps the last `period` closes for `rate_of_change`."""
+
+    def __init__(self, period: int = 1, column_name: str = 'rate_of_change') -> None:
+        super().__init__(column_name=column_name)
+        self.period = period
+        self.window = WindowState(size=period)
+
+    def update(self, bars: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+
+        kept = self.window.values.size
+        joined = self.window.extend(values=bars['close'])
+
+        return {self.column_name: kernels.pct_change(values=joined, periods=self.period)[kept:]}
+
+
+class SmaState(IndicatorState):
+
+    """Keeps the last `period - 1` closes for `sma`."""
+
+    def __init__(self, period: int, column_name: str = 'sma') -> None:
+        super().__init__(column_name=column_name)
+        self.period = period
+        self.window = WindowState(size=period - 1)
+
+    def update(self, bars: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+
+        kept = self.window.values.size
+        joined = self.window.extend(values=bars['close'])
+
+        return {self.column_name: kernels.rolling_mean(values=joined, window=self.period)[kept:]}
+
+
+class EmaState(IndicatorState):
+
+    """Keeps the weighted sums of the closes for `ema`."""
+
+    def __init__(self, period: int, alpha: float = 0.0, column_name: str = 'ema') -> None:
+        super().__init__(column_name=column_name)
+        self.ewm = EwmState(alpha=2.0 / (period + 1.0))
+
+    def update(self, bars: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+
+        return {self.column_name: self.ewm.update(values=bars['close'])}
+
+
+class RsiState(IndicatorState):
+
+    """Keeps the previous close and the averages of the up and down moves for `rsi`."""
+
+    def __init__(self, period: int, method: str = 'wilders', column_name: str = 'rsi') -> None:
+        super().__init__(column_name=column_name)
+        self.method = method
+        self.window = WindowState(size=1)
+
+        if method == 'wilders':
+            self.average_up = WilderState(period=period)
+            self.average_down = WilderState(period=period)
+        elif method == 'ema':
+            self.average_up = EwmState(alpha=2.0 / (period + 1.0))
+            self.average_down = EwmState(alpha=2.0 / (period + 1.0))
+        else:
+            raise ValueError("The RSI method must be `wilders` or `ema`, not `{method}`.".format(method=method))
+
+    def update(self, bars: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+
+        kept = self.window.values.size
+        change = kernels.diff(values=self.window.extend(values=bars['close']))[kept:]
+
+        # Wilder's average starts with the first change, not the missing one before it.
+        skipped = 1 if self.method == 'wilders' and kept == 0 and change.size else 0
+
+        ewma_up = self.average_up.update(values=np.where(change >= 0, change, 0.0)[skipped:])
+        ewma_down = self.average_down.update(values=np.where(change < 0, -change, 0.0)[skipped:])
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            relative_strength = ewma_up / ewma_down
+
+        relative_strength_index = 100.0 - (100.0 / (1.0 + relative_strength))
+
+        if skipped:
+            relative_strength_index = np.concatenate([[np.nan], relative_strength_index])
+
+        return {self.column_name: relative_strength_index}
+
+
+class BollingerBandsState(IndicatorState):
+
+    """Keeps the last `period - 1` closes for `bollinger_bands`."""
+
+    def __init__(self, period: int = 20, num_std: float = 2.0, column_name: str = 'bollinger_bands') -> None:
+        super().__init__(column_name=column_name)
+        self.period = period
+        self.num_std = num_std
+        self.window = WindowState(size=period - 1)
+
+    def update(self, bars: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+
+        kept = self.window.values.size
+        joined = self.window.extend(values=bars['close'])
+
+        bands = kernels.bollinger_bands(values=joined, window=self.period, num_std=self.num_std)
+
+        return {column: values[kept:] for column, values in bands.items()}
+
+
+class AverageTrueRangeState(IndicatorState):
+
+    """Keeps the previous close and the average of the true range for `average_true_range`."""
+
+    def __init__(self, period: int = 14, column_name: str = 'average_true_range') -> None:
+        super().__init__(column_name=column_name)
+        self.previous_close = np.nan
+        self.average = WilderState(period=period)
+
+    def update(self, bars: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+
+        close = bars['close']
+
+        if close.size == 0:
+            return {self.column_name: np.empty(0)}
+
+        # Put the previous close in front so the first new bar can see it.
+        true_range = kernels.true_range(
+            high=np.concatenate([[np.nan], bars['high']]),
+            low=np.concatenate([[np.nan], bars['low']]),
+            close=np.concatenate([[self.previous_close], close])
+        )[1:]
+        self.previous_close = close[-1]
+
+        return {self.column_name: self.average.update(values=true_range)}
+
+
+# The indicators that can be updated one bar at a time, keyed by `Indicators` method.
+INDICATOR_STATES: Dict[str, Type[IndicatorState]] = {
+    'change_in_price': ChangeInPriceState,
+    'rate_of_change': RateOfChangeState,
+    'sma': SmaState,
+    'ema': EmaState,
+    'rsi': RsiState,
+    'bollinger_bands': BollingerBandsState,
+    'average_true_range': AverageTrueRangeState
+}
@@ -0,0 +1,1131 @@
+import numpy as np
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+from typing import Callable
+from typing import Optional
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Largest exponent we let `decay ** -k` reach inside a single scan block.
+_SCAN_EXPONENT = 230.0
+
+
+def linear_scan(inputs: np.ndarray, decay: float, initial: float = 0.0) -> np.ndarray:
+    """Runs the recursive filter `y[t] = decay * y[t - 1] + inputs[t]`.
+
+    Overview:
+    ----
+    The recursion is solved in blocks, inside each block the values are
+    rescaled by `decay ** -k` so the filter becomes a cumulative sum. The
+    block size is picked so the rescaling never overflows.
+
+    Arguments:
+    ----
+    inputs {np.ndarray} -- The values fed into the filter.
+
+    decay {float} -- The weight given to the previous value.
+
+    Keyword Arguments:
+    ----
+    initial {float} -- The value of the filter before the first input. (default: {0.0})
+
+    Returns:
+    ----
+    {np.ndarray} -- The filtered values.
+    """
+
+    inputs = np.asarray(inputs, dtype=np.float64)
+    size = inputs.size
+
+    if size == 0:
+        return np.empty(0)
+
+    if decay <= 1e-300:
+        output = inputs.copy()
+        output[0] += decay * initial
+        return output
+
+    if decay == 1.0:
+        return np.cumsum(inputs) + initial
+
+    block = int(min(max(_SCAN_EXPONENT / -np.log(decay), 1), size))
+    steps = np.arange(block)
+    forward = decay ** steps
+    inverse = decay ** -steps
+
+    output = np.empty(size)
+    carry = initial
+
+    for start in range(0, size, block):
+
+        chunk = inputs[start:start + block]
+        length = chunk.size
+
+        scaled = np.cumsum(chunk * inverse[:length])
+        output[start:start + length] = forward[:length] * (scaled + decay * carry)
+
+        carry = output[start + length - 1]
+
+    return output
+
+
+def _scan_resets(inputs: np.ndarray, decay: float, resets: np.ndarray, output: np.ndarray) -> None:
+    """Runs the recursive filter one value at a time, starting over wherever `resets` is set."""
+
+    carry = 0.0
+
+    for position in range(inputs.shape[0]):
+
+        if resets[position]:
+            carry = 0.0
+
+        carry = decay * carry + inputs[position]
+        output[position] = carry
+
+
+if numba is not None:
+    _scan_resets = numba.njit(cache=True, nogil=True)(_scan_resets)
+
+
+def segmented_scan(inputs: np.ndarray, decay: float, starts: np.ndarray) -> np.ndarray:
+    """Runs the recursive filter `y[t] = decay * y[t - 1] + inputs[t]`, starting over at each of `starts`.
+
+    Overview:
+    ----
+    This lets one pass over a whole column filter every symbol separately,
+    with the state going back to zero at the first row of each symbol. When
+    `numba` is installed the filter runs as a compiled loop. Otherwise the
+    whole column is filtered with `linear_scan`, and the part carried over
+    from before each start, which is the value before the start decayed by
+    the number of steps since, is taken back out.
+
+    Arguments:
+    ----
+    inputs {np.ndarray} -- The values fed into the filter.
+
+    decay {float} -- The weight given to the previous value.
+
+    starts {np.ndarray} -- The sorted positions where the filter starts over.
+
+    Returns:
+    ----
+    {np.ndarray} -- The filtered values.
+    """
+
+    inputs = np.asarray(inputs, dtype=np.float64)
+    starts = np.asarray(starts, dtype=np.int64)
+    size = inputs.size
+
+    if numba is not None:
+        resets = np.zeros(size, dtype=np.bool_)
+        resets[starts[starts < size]] = True
+        output = np.empty(size)
+        _scan_resets(inputs, decay, resets, output)
+        return output
+
+    output = linear_scan(inputs=inputs, decay=decay)
+    starts = starts[(starts > 0) & (starts < size)]
+
+    if starts.size == 0:
+        return output
+
+    # Grab the start each row falls after, rows before the first one are left alone.
+    rows = np.arange(size)
+    segment = np.searchsorted(starts, rows, side='right') - 1
+    inside = segment >= 0
+    segment_starts = starts[segment[inside]]
+
+    carry = output[segment_starts - 1]
+    steps = rows[inside] - segment_starts + 1
+
+    output[inside] -= np.power(decay, steps) * carry
+
+    return output
+
+
+def segment_positions(size: int, offsets: np.ndarray = None) -> np.ndarray:
+    """Returns the position of each row inside its symbol.
+
+    Arguments:
+    ----
+    size {int} -- The number of rows.
+
+    Keyword Arguments:
+    ----
+    offsets {np.ndarray} -- The row where each symbol starts, followed by the
+        number of rows. `None` means a single symbol. (default: {None})
+
+    Returns:
+    ----
+    {np.ndarray} -- The number of rows before each row that belong to the same symbol.
+    """
+
+    if offsets is None:
+        return np.arange(size)
+
+    offsets = np.asarray(offsets, dtype=np.int64)
+
+    return np.arange(size) - np.repeat(offsets[:-1], np.diff(offsets))
+
+
+def segmented_cumsum(values: np.ndarray, offsets: np.ndarray = None) -> np.ndarray:
+    """Calculates the cumulative sum of each symbol's values.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- The values of one or more symbols.
+
+    Keyword Arguments:
+    ----
+    offsets {np.ndarray} -- The symbol offsets, `None` means a single symbol. (default: {None})
+
+    Returns:
+    ----
+    {np.ndarray} -- The running totals, starting over at each symbol.
+    """
+
+    totals = np.cumsum(values)
+
+    if offsets is None or totals.size == 0:
+        return totals
+
+    offsets = np.asarray(offsets, dtype=np.int64)
+    before = np.concatenate([[0], totals])[offsets[:-1]]
+
+    return totals - np.repeat(before, np.diff(offsets))
+
+
+def shift(values: np.ndarray, periods: int = 1, offsets: np.ndarray = None) -> np.ndarray:
+    """Shifts the values forward by `periods` rows, without crossing from one symbol into the next.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- The values of one or more symbols.
+
+    Keyword Arguments:
+    ----
+    periods {int} -- The number of rows to shift. (default: {1})
+
+    offsets {np.ndarray} -- The symbol offsets, `None` means a single symbol. (default: {None})
+
+    Returns:
+    ----
+    {np.ndarray} -- The shifted values, the first `periods` rows of each symbol are `NaN`.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+    output = np.full(values.size, np.nan)
+
+    if periods < values.size:
+        output[periods:] = values[:values.size - periods]
+
+    if offsets is not None:
+        output[segment_positions(size=values.size, offsets=offsets) < periods] = np.nan
+
+    return output
+
+
+def diff(values: np.ndarray, periods: int = 1, offsets: np.ndarray = None) -> np.ndarray:
+    """Calculates the difference between a value and the value `periods` back.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- The values of one or more symbols.
+
+    Keyword Arguments:
+    ----
+    periods {int} -- The number of values to look back. (default: {1})
+
+    offsets {np.ndarray} -- The symbol offsets, `None` means a single symbol. (default: {None})
+
+    Returns:
+    ----
+    {np.ndarray} -- The differences, the first `periods` values of each symbol are `NaN`.
+    """
+
+    return np.asarray(values, dtype=np.float64) - shift(values=values, periods=periods, offsets=offsets)
+
+
+def pct_change(values: np.ndarray, periods: int = 1, offsets: np.ndarray = None) -> np.ndarray:
+    """Calculates the percent change from the value `periods` back.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- The values of one or more symbols.
+
+    Keyword Arguments:
+    ----
+    periods {int} -- The number of values to look back. (default: {1})
+
+    offsets {np.ndarray} -- The symbol offsets, `None` means a single symbol. (default: {None})
+
+    Returns:
+    ----
+    {np.ndarray} -- The percent changes, the first `periods` values of each symbol are `NaN`.
+    """
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.asarray(values, dtype=np.float64) / shift(values=values, periods=periods, offsets=offsets) - 1.0
+
+
+def rolling_sum(values: np.ndarray, window: int, offsets: np.ndarray = None) -> np.ndarray:
+    """Calculates the sum over a rolling window.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- The values of one or more symbols.
+
+    window {int} -- The size of the window.
+
+    Keyword Arguments:
+    ----
+    offsets {np.ndarray} -- The symbol offsets, `None` means a single symbol. (default: {None})
+
+    Returns:
+    ----
+    {np.ndarray} -- The rolling sum, windows that aren't full or contain
+        a `NaN` are returned as `NaN`.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+    output = np.full(values.size, np.nan)
+
+    if window > values.size:
+        return output
+
+    observed = ~np.isnan(values)
+
+    totals = np.concatenate([[0.0], np.cumsum(np.where(observed, values, 0.0))])
+    counts = np.concatenate([[0], np.cumsum(observed)])
+
+    window_totals = totals[window:] - totals[:-window]
+    window_counts = counts[window:] - counts[:-window]
+
+    output[window - 1:] = np.where(window_counts == window, window_totals, np.nan)
+
+    if offsets is not None:
+        output[segment_positions(size=values.size, offsets=offsets) < window - 1] = np.nan
+
+    return output
+
+
+def rolling_mean(values: np.ndarray, window: int, offsets: np.ndarray = None) -> np.ndarray:
+    """Calculates the mean over a rolling window.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- The values of one or more symbols.
+
+    window {int} -- The size of the window.
+
+    Keyword Arguments:
+    ----
+    offsets {np.ndarray} -- The symbol offsets, `None` means a single symbol. (default: {None})
+
+    Returns:
+    ----
+    {np.ndarray} -- The rolling mean, windows that aren't full or contain
+        a `NaN` are returned as `NaN`.
+    """
+
+    return rolling_sum(values=values, window=window, offsets=offsets) / window
+
+
+def rolling_mean_deviation(values: np.ndarray, window: int, offsets: np.ndarray = None,
+                           means: np.ndarray = None) -> np.ndarray:
+    """Calculates the mean absolute deviation from the rolling mean.
+
+    Overview:
+    ----
+    Every value in a window is compared with the mean of that same window,
+    so the deviation can't be kept as a running sum. Instead each symbol's
+    windows are taken as a strided view of its rows, without copying them,
+    and the distances to the window means are averaged along each window.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- The values of one or more symbols.
+
+    window {int} -- The size of the window.
+
+    Keyword Arguments:
+    ----
+    offsets {np.ndarray} -- The symbol offsets, `None` means a single symbol. (default: {None})
+
+    means {np.ndarray} -- The rolling means, if they were already calculated. (default: {None})
+
+    Returns:
+    ----
+    {np.ndarray} -- The rolling mean deviation, windows that aren't full or
+        contain a `NaN` are returned as `NaN`.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+
+    if means is None:
+        means = rolling_mean(values=values, window=window, offsets=offsets)
+
+    if offsets is None:
+        offsets = np.array([0, values.shape[0]])
+
+    deviations = np.full(values.shape[0], np.nan)
+
+    for first, last in zip(offsets[:-1], offsets[1:]):
+
+        if last - first < window:
+            continue
+
+        windows = np.lib.stride_tricks.sliding_window_view(values[first:last], window)
+        window_means = means[first + window - 1:last]
+        deviations[first + window - 1:last] = np.abs(windows - window_means[:, None]).mean(axis=1)
+
+    return deviations
+
+
+def _rolling_moments_loop(values: np.ndarray, window: int, positions: np.ndarray, means: np.ndarray,
+                          stds: np.ndarray) -> None:
+    """Runs Welford's update over the rows, adding the new value and removing the one leaving the window."""
+
+    count = 0
+    missing = 0
+    mean = 0.0
+    squares = 0.0
+
+    for row in range(values.shape[0]):
+
+        # Start over at the first row of each symbol.
+        if positions[row] == 0:
+            count = 0
+            missing = 0
+            mean = 0.0
+            squares = 0.0
+
+        value = values[row]
+
+        if np.isnan(value):
+            missing += 1
+        else:
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            squares += delta * (value - mean)
+
+        if positions[row] >= window:
+
+            leaving = values[row - window]
+
+            if np.isnan(leaving):
+                missing -= 1
+            elif count == 1:
+                count = 0
+                mean = 0.0
+                squares = 0.0
+            else:
+                count -= 1
+                delta = leaving - mean
+                mean -= delta / count
+                squares -= delta * (leaving - mean)
+
+        if positions[row] < window - 1 or missing > 0:
+            means[row] = np.nan
+            stds[row] = np.nan
+        else:
+            means[row] = mean
+            stds[row] = np.sqrt(max(squares, 0.0) / (window - 1)) if window > 1 else np.nan
+
+
+if numba is not None:
+    _rolling_moments_loop = numba.njit(cache=True, nogil=True)(_rolling_moments_loop)
+
+
+def rolling_moments(values: np.ndarray, window: int, offsets: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculates the mean and the sample standard deviation over a rolling window in one pass.
+
+    Overview:
+    ----
+    When `numba` is installed, each window is updated with Welford's method,
+    adding the new value and removing the one that left. Otherwise the values
+    of each symbol are shifted by that symbol's mean, so the running sums and
+    sums of squares stay small, and every window is read off the two running
+    sums at once.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- The values of one or more symbols.
+
+    window {int} -- The size of the window.
+
+    Keyword Arguments:
+    ----
+    offsets {np.ndarray} -- The symbol offsets, `None` means a single symbol. (default: {None})
+
+    Returns:
+    ----
+    {Tuple[np.ndarray, np.ndarray]} -- The rolling mean and standard deviation, windows
+        that aren't full or contain a `NaN` are returned as `NaN`.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+    size = values.size
+
+    if offsets is None:
+        offsets = np.array([0, size])
+
+    offsets = np.asarray(offsets, dtype=np.int64)
+
+    if numba is not None:
+        means = np.empty(size)
+        stds = np.empty(size)
+        _rolling_moments_loop(values, window, segment_positions(size=size, offsets=offsets), means, stds)
+        return means, stds
+
+    return _window_moments(sums=_centered_sums(values=values, offsets=offsets), window=window)
+
+
+def _centered_sums(values: np.ndarray, offsets: np.ndarray) -> Dict[str, np.ndarray]:
+    """Builds the running sums behind the rolling moments, shared by every window size.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- The values of one or more symbols.
+
+    offsets {np.ndarray} -- The symbol offsets.
+
+    Returns:
+    ----
+    {Dict[str, np.ndarray]} -- The mean each symbol is shifted by, the running sums of the
+        shifted values and of their squares, the running count of observed values and the
+        position of each row inside its symbol.
+    """
+
+    observed = ~np.isnan(values)
+    filled = np.where(observed, values, 0.0)
+
+    # Shift each symbol by its own mean, so one symbol's prices don't swamp another's.
+    counts = np.diff(offsets)
+    starts = offsets[:-1][counts > 0]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        centers = np.add.reduceat(filled, starts) / np.add.reduceat(observed.astype(np.float64), starts)
+
+    centers = np.repeat(np.nan_to_num(centers), counts[counts > 0])
+    centered = np.where(observed, values - centers, 0.0)
+
+    return {
+        'centers': centers,
+        'totals': np.concatenate([[0.0], np.cumsum(centered)]),
+        'squares': np.concatenate([[0.0], np.cumsum(centered * centered)]),
+        'observations': np.concatenate([[0], np.cumsum(observed)]),
+        'positions': segment_positions(size=values.size, offsets=offsets)
+    }
+
+
+def _window_moments(sums: Dict[str, np.ndarray], window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Reads the rolling mean and standard deviation of one window size off the running sums."""
+
+    size = sums['centers'].size
+
+    means = np.full(size, np.nan)
+    stds = np.full(size, np.nan)
+
+    if window > size or size == 0:
+        return means, stds
+
+    totals = sums['totals']
+    squares = sums['squares']
+    observations = sums['observations']
+
+    window_totals = totals[window:] - totals[:-window]
+    window_squares = squares[window:] - squares[:-window]
+    window_counts = observations[window:] - observations[:-window]
+
+    full = (window_counts == window) & (sums['positions'][window - 1:] >= window - 1)
+
+    means[window - 1:] = np.where(full, sums['centers'][window - 1:] + window_totals / window, np.nan)
+
+    if window > 1:
+        variance = (window_squares - window_totals * window_totals / window) / (window - 1)
+        stds[window - 1:] = np.where(full, np.sqrt(np.maximum(variance, 0.0)), np.nan)
+
+    return means, stds
+
+
+def rolling_std(values: np.ndarray, window: int, offsets: np.ndarray = None) -> np.ndarray:
+    """Calculates the sample standard deviation over a rolling window.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- The values of one or more symbols.
+
+    window {int} -- The size of the window.
+
+    Keyword Arguments:
+    ----
+    offsets {np.ndarray} -- The symbol offsets, `None` means a single symbol. (default: {None})
+
+    Returns:
+    ----
+    {np.ndarray} -- The rolling standard deviation, windows that aren't full
+        or contain a `NaN` are returned as `NaN`.
+    """
+
+    return rolling_moments(values=values, window=window, offsets=offsets)[1]
+
+
+def bollinger_bands(values: np.ndarray, window: int = 20, num_std: float = 2.0,
+                    offsets: np.ndarray = None) -> Dict[str, np.ndarray]:
+    """Calculates the Bollinger Bands from a single pass over the rolling moments.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- The close prices of one or more symbols.
+
+    Keyword Arguments:
+    ----
+    window {int} -- The size of the window. (default: {20})
+
+    num_std {float} -- The number of standard deviations between the middle
+        band and the outer bands. (default: {2.0})
+
+    offsets {np.ndarray} -- The symbol offsets, `None` means a single symbol. (default: {None})
+
+    Returns:
+    ----
+    {Dict[str, np.ndarray]} -- The `band_upper`, `band_mid` and `band_lower` values.
+    """
+
+    moving_avg, moving_std = rolling_moments(values=values, window=window, offsets=offsets)
+
+    return {
+        'band_upper': moving_avg + num_std * moving_std,
+        'band_mid': moving_avg,
+        'band_lower': moving_avg - num_std * moving_std
+    }
+
+
+def ewm_sums(values: np.ndarray, decay: float, numerator: float = 0.0, denominator: float = 0.0) -> tuple:
+    """Calculates the running weighted sums behind an exponentially weighted mean.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- The values of a single symbol.
+
+    decay {float} -- The weight given to the previous sums, `1 - alpha`.
+
+    Keyword Arguments:
+    ----
+    numerator {float} -- The weighted sum of the values before the first one. (default: {0.0})
+
+    denominator {float} -- The sum of the weights before the first value. (default: {0.0})
+
+    Returns:
+    ----
+    {tuple} -- The weighted sums of the values and the sums of the weights, `NaN`
+        values don't add anything but still decay the earlier weights.
+    """
+
+    observed = ~np.isnan(values)
+
+    numerators = linear_scan(inputs=np.where(observed, values, 0.0), decay=decay, initial=numerator)
+    denominators = linear_scan(inputs=observed.astype(np.float64), decay=decay, initial=denominator)
+
+    return numerators, denominators
+
+
+def ewm_mean(values: np.ndarray, alpha: float, min_periods: int = 0, offsets: np.ndarray = None) -> np.ndarray:
+    """Calculates the exponentially weighted mean, matching `ewm(adjust=True).mean()`.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- The values of one or more symbols.
+
+    alpha {float} -- The smoothing factor.
+
+    Keyword Arguments:
+    ----
+    min_periods {int} -- The number of observations needed before a value
+        is returned. (default: {0})
+
+    offsets {np.ndarray} -- The symbol offsets, `None` means a single symbol. (default: {None})
+
+    Returns:
+    ----
+    {np.ndarray} -- The exponentially weighted mean.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+    observed = ~np.isnan(values)
+
+    if offsets is None:
+        numerators, denominators = ewm_sums(values=values, decay=1.0 - alpha)
+    else:
+        starts = np.asarray(offsets[:-1], dtype=np.int64)
+        numerators = segmented_scan(inputs=np.where(observed, values, 0.0), decay=1.0 - alpha, starts=starts)
+        denominators = segmented_scan(inputs=observed.astype(np.float64), decay=1.0 - alpha, starts=starts)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        output = numerators / denominators
+
+    output[segmented_cumsum(values=observed, offsets=offsets) < max(min_periods, 1)] = np.nan
+
+    return output
+
+
+def wilder_mean(values: np.ndarray, period: int, offsets: np.ndarray = None, skip: int = 0) -> np.ndarray:
+    """Calculates Wilder's moving average.
+
+    Overview:
+    ----
+    The first average is the simple mean of the first `period` values, after
+    that each value gets a weight of `1 / period`, so `y[t] = y[t - 1] +
+    (x[t] - y[t - 1]) / period`. Missing values count as zero.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- The values of one or more symbols.
+
+    period {int} -- The number of values averaged.
+
+    Keyword Arguments:
+    ----
+    offsets {np.ndarray} -- The symbol offsets, `None` means a single symbol. (default: {None})
+
+    skip {int} -- The number of values at the start of each symbol to leave out,
+        like the first change in price which is always missing. (default: {0})
+
+    Returns:
+    ----
+    {np.ndarray} -- The averages, `NaN` until each symbol has `period` values.
+    """
+
+    values = np.nan_to_num(np.asarray(values, dtype=np.float64), nan=0.0)
+    size = values.size
+    output = np.full(size, np.nan)
+
+    if offsets is None:
+        offsets = np.array([0, size])
+
+    offsets = np.asarray(offsets, dtype=np.int64)
+
+    # The first full window of each symbol, symbols that are too short are left out.
+    firsts = offsets[:-1] + skip
+    seeds = firsts + period - 1
+    ends = offsets[1:]
+    complete = seeds < ends
+
+    if not complete.any():
+        return output
+
+    firsts, seeds, ends = firsts[complete], seeds[complete], ends[complete]
+
+    totals = np.concatenate([[0.0], np.cumsum(values)])
+    alpha = 1.0 / period
+
+    # Seed each symbol with the simple mean, then let the filter run from there.
+    inputs = alpha * values
+    inputs[seeds] = (totals[seeds + 1] - totals[firsts]) / period
+
+    smoothed = segmented_scan(inputs=inputs, decay=1.0 - alpha, starts=seeds)
+
+    marks = np.zeros(size + 1, dtype=np.int64)
+    np.add.at(marks, seeds, 1)
+    np.add.at(marks, ends, -1)
+    active = np.cumsum(marks[:-1]) > 0
+
+    output[active] = smoothed[active]
+
+    return output
+
+
+def relative_strength_index(values: np.ndarray, period: int, method: str = 'wilders', offsets: np.ndarray = None) -> np.ndarray:
+    """Calculates the Relative Strength Index from the close prices.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- The close prices of one or more symbols.
+
+    period {int} -- The span of the moving averages of the up and down moves.
+
+    Keyword Arguments:
+    ----
+    method {str} -- `wilders` averages the moves with Wilder's moving average, `ema`
+        with an exponentially weighted mean with a span of `period`. (default: {'wilders'})
+
+    offsets {np.ndarray} -- The symbol offsets, `None` means a single symbol. (default: {None})
+
+    Raises:
+    ----
+    ValueError: If the method isn't `wilders` or `ema`.
+
+    Returns:
+    ----
+    {np.ndarray} -- The Relative Strength Index.
+    """
+
+    change = diff(values=values, offsets=offsets)
+
+    up_moves = np.where(change >= 0, change, 0.0)
+    down_moves = np.where(change < 0, -change, 0.0)
+
+    if method == 'wilders':
+        ewma_up = wilder_mean(values=up_moves, period=period, offsets=offsets, skip=1)
+        ewma_down = wilder_mean(values=down_moves, period=period, offsets=offsets, skip=1)
+    elif method == 'ema':
+        ewma_up = ewm_mean(values=up_moves, alpha=2.0 / (period + 1.0), offsets=offsets)
+        ewma_down = ewm_mean(values=down_moves, alpha=2.0 / (period + 1.0), offsets=offsets)
+    else:
+        raise ValueError("The RSI method must be `wilders` or `ema`, not `{method}`.".format(method=method))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        relative_strength = ewma_up / ewma_down
+
+    return 100.0 - (100.0 / (1.0 + relative_strength))
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray, offsets: np.ndarray = None) -> np.ndarray:
+    """Calculates the True Range, the largest of the bar's range and its gaps from the previous close.
+
+    Arguments:
+    ----
+    high {np.ndarray} -- The high prices of one or more symbols.
+
+    low {np.ndarray} -- The low prices.
+
+    close {np.ndarray} -- The close prices.
+
+    Keyword Arguments:
+    ----
+    offsets {np.ndarray} -- The symbol offsets, `None` means a single symbol. (default: {None})
+
+    Returns:
+    ----
+    {np.ndarray} -- The True Range, the first bar of each symbol only uses its own range.
+    """
+
+    previous_close = shift(values=close, offsets=offsets)
+
+    ranges = np.vstack([
+        np.abs(high - low),
+        np.abs(high - previous_close),
+        np.abs(low - previous_close)
+    ])
+
+    with np.errstate(invalid='ignore'):
+        return np.fmax.reduce(ranges, axis=0)
+
+
+def average_true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14,
+                       offsets: np.ndarray = None) -> np.ndarray:
+    """Calculates the Average True Range, Wilder's moving average of the True Range.
+
+    Arguments:
+    ----
+    high {np.ndarray} -- The high prices of one or more symbols.
+
+    low {np.ndarray} -- The low prices.
+
+    close {np.ndarray} -- The close prices.
+
+    Keyword Arguments:
+    ----
+    period {int} -- The number of bars averaged. (default: {14})
+
+    offsets {np.ndarray} -- The symbol offsets, `None` means a single symbol. (default: {None})
+
+    Returns:
+    ----
+    {np.ndarray} -- The Average True Range.
+    """
+
+    return wilder_mean(
+        values=true_range(high=high, low=low, close=close, offsets=offsets),
+        period=period,
+        offsets=offsets
+    )
+
+
+# The price columns each kernel reads, the others only need the close.
+KERNEL_COLUMNS: Dict[str, List[str]] = {
+    'average_true_range': ['high', 'low', 'close']
+}
+
+
+def rolling_mean_sweep(values: np.ndarray, windows: List[int], offsets: np.ndarray = None) -> np.ndarray:
+    """Calculates the rolling mean for several window sizes from one set of running sums.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- The values of one or more symbols.
+
+    windows {List[int]} -- The window sizes.
+
+    Keyword Arguments:
+    ----
+    offsets {np.ndarray} -- The symbol offsets, `None` means a single symbol. (default: {None})
+
+    Returns:
+    ----
+    {np.ndarray} -- A block with a row for each value and a column for each window.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+    size = values.size
+
+    # Column major, so each window is written in one stretch and `pandas` can keep the block as is.
+    output = np.full((size, len(windows)), np.nan, order='F')
+
+    observed = ~np.isnan(values)
+    totals = np.concatenate([[0.0], np.cumsum(np.where(observed, values, 0.0))])
+    counts = np.concatenate([[0], np.cumsum(observed)])
+    positions = segment_positions(size=size, offsets=offsets)
+
+    for column, window in enumerate(windows):
+
+        if window > size:
+            continue
+
+        full = (counts[window:] - counts[:-window] == window) & (positions[window - 1:] >= window - 1)
+        output[window - 1:, column] = np.where(full, (totals[window:] - totals[:-window]) / window, np.nan)
+
+    return output
+
+
+def bollinger_bands_sweep(values: np.ndarray, windows: List[int], num_std: float = 2.0,
+                          offsets: np.ndarray = None) -> Dict[str, np.ndarray]:
+    """Calculates the Bollinger Bands for several window sizes from one set of running sums.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- The close prices of one or more symbols.
+
+    windows {List[int]} -- The window sizes.
+
+    Keyword Arguments:
+    ----
+    num_std {float} -- The number of standard deviations between the middle
+        band and the outer bands. (default: {2.0})
+
+    offsets {np.ndarray} -- The symbol offsets, `None` means a single symbol. (default: {None})
+
+    Returns:
+    ----
+    {Dict[str, np.ndarray]} -- A block for each of `band_upper`, `band_mid` and `band_lower`,
+        with a row for each value and a column for each window.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+
+    if offsets is None:
+        offsets = np.array([0, values.size])
+
+    sums = _centered_sums(values=values, offsets=np.asarray(offsets, dtype=np.int64))
+
+    bands = {
+        band: np.empty((values.size, len(windows)), order='F')
+        for band in ['band_upper', 'band_mid', 'band_lower']
+    }
+
+    for column, window in enumerate(windows):
+
+        moving_avg, moving_std = _window_moments(sums=sums, window=window)
+
+        bands['band_upper'][:, column] = moving_avg + num_std * moving_std
+        bands['band_mid'][:, column] = moving_avg
+        bands['band_lower'][:, column] = moving_avg - num_std * moving_std
+
+    return bands
+
+
+def ewm_mean_sweep(values: np.ndarray, spans: List[int], offsets: np.ndarray = None) -> np.ndarray:
+    """Calculates the exponentially weighted mean for several spans.
+
+    Overview:
+    ----
+    Every span needs its own filter, but the missing value mask, the filled
+    values and the running count of observations are only built once.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- The values of one or more symbols.
+
+    spans {List[int]} -- The spans, each one gives an `alpha` of `2 / (span + 1)`.
+
+    Keyword Arguments:
+    ----
+    offsets {np.ndarray} -- The symbol offsets, `None` means a single symbol. (default: {None})
+
+    Returns:
+    ----
+    {np.ndarray} -- A block with a row for each value and a column for each span.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+    size = values.size
+
+    if offsets is None:
+        offsets = np.array([0, size])
+
+    starts = np.asarray(offsets[:-1], dtype=np.int64)
+    observed = ~np.isnan(values)
+    filled = np.where(observed, values, 0.0)
+    weights = observed.astype(np.float64)
+    unobserved = segmented_cumsum(values=observed, offsets=offsets) < 1
+
+    output = np.empty((size, len(spans)), order='F')
+
+    for column, span in enumerate(spans):
+
+        decay = 1.0 - 2.0 / (span + 1.0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            output[:, column] = (
+                segmented_scan(inputs=filled, decay=decay, starts=starts) /
+                segmented_scan(inputs=weights, decay=decay, starts=starts)
+            )
+
+        output[unobserved, column] = np.nan
+
+    return output
+
+
+def relative_strength_index_sweep(values: np.ndarray, periods: List[int], method: str = 'wilders',
+                                  offsets: np.ndarray = None) -> np.ndarray:
+    """Calculates the Relative Strength Index for several periods from one set of price changes.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- The close prices of one or more symbols.
+
+    periods {List[int]} -- The periods.
+
+    Keyword Arguments:
+    ----
+    method {str} -- `wilders` or `ema`, see `relative_strength_index`. (default: {'wilders'})
+
+    offsets {np.ndarray} -- The symbol offsets, `None` means a single symbol. (default: {None})
+
+    Returns:
+    ----
+    {np.ndarray} -- A block with a row for each value and a column for each period.
+    """
+
+    if method not in ('wilders', 'ema'):
+        raise ValueError("The RSI method must be `wilders` or `ema`, not `{method}`.".format(method=method))
+
+    change = diff(values=values, offsets=offsets)
+
+    up_moves = np.where(change >= 0, change, 0.0)
+    down_moves = np.where(change < 0, -change, 0.0)
+
+    if method == 'ema':
+        ewma_up = ewm_mean_sweep(values=up_moves, spans=periods, offsets=offsets)
+        ewma_down = ewm_mean_sweep(values=down_moves, spans=periods, offsets=offsets)
+    else:
+        ewma_up = np.empty((change.size, len(periods)), order='F')
+        ewma_down = np.empty((change.size, len(periods)), order='F')
+
+        for column, period in enumerate(periods):
+            ewma_up[:, column] = wilder_mean(values=up_moves, period=period, offsets=offsets, skip=1)
+            ewma_down[:, column] = wilder_mean(values=down_moves, period=period, offsets=offsets, skip=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ewma_up /= ewma_down
+        ewma_up += 1.0
+        np.divide(100.0, ewma_up, out=ewma_up)
+
+    return np.subtract(100.0, ewma_up, out=ewma_up)
+
+
+# The kernels used by `Indicators.sweep`. Each one takes the price columns, the symbol offsets
+# and the periods to calculate, and returns a block with a column for each period, or a
+# dictionary of blocks when the indicator fills several columns.
+INDICATOR_SWEEPS: Dict[str, Callable[..., Union[np.ndarray, Dict[str, np.ndarray]]]] = {
+    'sma': lambda columns, offsets, periods: rolling_mean_sweep(
+        values=columns['close'], windows=periods, offsets=offsets
+    ),
+    'ema': lambda columns, offsets, periods: ewm_mean_sweep(
+        values=columns['close'], spans=periods, offsets=offsets
+    ),
+    'rsi': lambda columns, offsets, periods, method='wilders': relative_strength_index_sweep(
+        values=columns['close'], periods=periods, method=method, offsets=offsets
+    ),
+    'bollinger_bands': lambda columns, offsets, periods, num_std=2.0: bollinger_bands_sweep(
+        values=columns['close'], windows=periods, num_std=num_std, offsets=offsets
+    )
+}
+
+
+def ewm_warmup(alpha: float, tolerance: float = 1e-4) -> int:
+    """Returns how many values an exponentially weighted mean needs before the older ones stop mattering.
+
+    Arguments:
+    ----
+    alpha {float} -- The smoothing factor.
+
+    Keyword Arguments:
+    ----
+    tolerance {float} -- The total weight the dropped values are allowed to have. (default: {1e-4})
+
+    Returns:
+    ----
+    {int} -- The number of values.
+    """
+
+    if alpha >= 1.0:
+        return 1
+
+    return int(np.ceil(np.log(tolerance) / np.log(1.0 - alpha)))
+
+
+# The number of bars before the first requested bar that each indicator needs, given its arguments.
+INDICATOR_LOOKBACKS: Dict[str, Callable[..., int]] = {
+    'change_in_price': lambda **kwargs: 1,
+    'rate_of_change': lambda period=1, **kwargs: period,
+    'sma': lambda period, **kwargs: period - 1,
+    'standard_deviation': lambda period, **kwargs: period - 1,
+    'bollinger_bands': lambda period=20, **kwargs: period - 1,
+    'ema': lambda period, **kwargs: ewm_warmup(alpha=2.0 / (period + 1.0)),
+    'rsi': lambda period, method='wilders', **kwargs: 1 + max(
+        period, ewm_warmup(alpha=1.0 / period if method == 'wilders' else 2.0 / (period + 1.0))
+    ),
+    'average_true_range': lambda period=14, **kwargs: max(period - 1, ewm_warmup(alpha=1.0 / period))
+}
+
+
+def lookback_bars(indicators: List[Dict]) -> Optional[int]:
+    """Returns the number of bars before the first requested bar needed to calculate the indicators.
+
+    Overview:
+    ----
+    Moving windows need `period - 1` bars of history. Exponentially weighted
+    indicators depend on every bar before them, so they get enough history for
+    the bars that are dropped to carry less than `1e-4` of the weight.
+
+    Arguments:
+    ----
+    indicators {List[Dict]} -- The indicator specs, as passed to `Indicators.compute`.
+
+    Returns:
+    ----
+    {Optional[int]} -- The number of bars, or `None` if one of the indicators
+        needs the whole history.
+    """
+
+    lookback = 0
+
+    for spec in indicators:
+
+        arguments = {key: value for key, value in spec.items() if key not in ('indicator', 'column_name')}
+
+        if spec['indicator'] not in INDICATOR_LOOKBACKS:
+            return None
+
+        lookback = max(lookback, INDICATOR_LOOKBACKS[spec['indicator']](**arguments))
+
+    return lookback
@@ -0,0 +1,236 @@
+import os
+import numpy as np
+import pandas as pd
+import multiprocessing
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from .plan import IndicatorPlan
+from ..stock_frame.build import StockFrame
+from ..stock_frame.shared import shared_memory
+from ..stock_frame.shared import SharedPriceBlock
+
+
+# The number of shards given to each worker, a few more than one evens out the slower ones.
+SHARDS_PER_WORKER = 4
+
+
+class ShardContext():
+
+    """
+    Represents the columns of one shard of symbols, read by an indicator
+    plan in place of an `IndicatorContext`.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], offsets: np.ndarray) -> None:
+        """Initalizes the Shard Context.
+
+        Arguments:
+        ----
+        columns {Dict[str, np.ndarray]} -- The price columns of the shard.
+
+        offsets {np.ndarray} -- The symbol offsets inside the shard, starting at 0.
+        """
+
+        self._columns = columns
+        self.offsets = offsets
+        self.outputs: Dict[str, np.ndarray] = {}
+
+    def column(self, name: str) -> np.ndarray:
+        """Grabs a price column of the shard as a float array."""
+
+        return np.asarray(self._columns[name], dtype=np.float64)
+
+    def add_output(self, column_name: str, values: np.ndarray) -> None:
+        """Keeps an output of the plan."""
+
+        self.outputs[column_name] = values
+
+
+def balanced_shards(offsets: np.ndarray, shards: int) -> List[Tuple[int, int]]:
+    """Splits the symbols into runs of about the same number of rows.
+
+    Overview:
+    ----
+    Each shard is a run of whole symbols, so its rows are a contiguous slice
+    of the frame and the results can be written back without reordering. A
+    new shard starts at the first symbol past each multiple of the total rows
+    divided by `shards`, so no shard is off by more than one symbol.
+
+    Arguments:
+    ----
+    offsets {np.ndarray} -- The symbol offsets, the first row of each symbol
+        followed by the number of rows.
+
+    shards {int} -- The number of shards wanted.
+
+    Returns:
+    ----
+    {List[Tuple[int, int]]} -- The first symbol and the symbol after the last
+        one of each shard, empty shards are left out.
+    """
+
+    symbols = offsets.size - 1
+
+    if symbols <= 0:
+        return []
+
+    targets = offsets[-1] * np.arange(1, shards) / shards
+    boundaries = np.minimum(np.searchsorted(offsets, targets), symbols)
+    boundaries = np.unique(np.concatenate([[0], boundaries, [symbols]]))
+
+    return [(int(first), int(last)) for first, last in zip(boundaries[:-1], boundaries[1:])]
+
+
+def _run_shard(task: dict) -> None:
+    """Runs the indicator plan for one shard, reading and writing shared memory.
+
+    Arguments:
+    ----
+    task {dict} -- The names of the shared blocks, the first symbol of the shard and
+        the symbol after its last one, the columns read and the indicators to calculate.
+    """
+
+    inputs = SharedPriceBlock.attach(name=task['inputs'])
+    outputs = SharedPriceBlock.attach(name=task['outputs'])
+
+    try:
+        first, last = task['symbols']
+        start, stop = int(inputs.offsets[first]), int(inputs.offsets[last])
+
+        context = ShardContext(
+            columns={name: inputs.columns[name][start:stop] for name in task['columns']},
+            offsets=inputs.offsets[first:last + 1] - start
+        )
+
+        indicator_plan = IndicatorPlan()
+
+        for indicator in task['indicators']:
+            arguments = dict(indicator)
+            indicator_plan.add(indicator=arguments.pop('indicator'), **arguments)
+
+        indicator_plan.run(context=context)
+
+        for name, values in outputs.columns.items():
+            values[start:stop] = context.outputs[name]
+
+        # The views have to go before the blocks can be closed.
+        del context
+
+    finally:
+        inputs.close()
+        outputs.close()
+
+
+def compute_parallel(stock_frame: StockFrame, indicators: List[Dict], workers: int = None,
+                     shards_per_worker: int = SHARDS_PER_WORKER, inputs: SharedPriceBlock = None) -> pd.DataFrame:
+    """Calculates an indicator plan on a process pool, one shard of symbols at a time.
+
+    Overview:
+    ----
+    The price columns the plan reads are copied once into a shared memory
+    block with `StockFrame.to_shared`, and the outputs are written by the
+    workers into a second one, so no data frame is ever pickled. Each worker attaches to both blocks, runs
+    the plan over its own rows and writes the results in place, which puts
+    them back in the original order of the frame. Every planned indicator
+    starts over at each symbol, so the results match a run over the whole
+    frame.
+
+    Without `multiprocessing.shared_memory` (Python 3.7), with a single worker
+    or with a single symbol, the plan runs in this process.
+
+    Arguments:
+    ----
+    stock_frame {StockFrame} -- The StockFrame the indicators are calculated for.
+
+    indicators {List[Dict]} -- The indicators, in the same format as `Indicators.compute`.
+
+    Keyword Arguments:
+    ----
+    workers {int} -- The number of processes, `None` uses every core. (default: {None})
+
+    shards_per_worker {int} -- The number of shards for each worker. (default: {4})
+
+    inputs {SharedPriceBlock} -- A block made by `StockFrame.to_shared` holding the
+        columns the plan reads, `None` makes one for this run. (default: {None})
+
+    Returns:
+    ----
+    {pd.DataFrame} -- The output columns, indexed like the frame.
+
+    Usage:
+    ----
+        >>> outputs = compute_parallel(
+            stock_frame=stock_frame,
+            indicators=[{'indicator': 'rsi', 'period': 14}, {'indicator': 'sma', 'period': 100}],
+            workers=8
+        )
+    """
+
+    workers = workers or os.cpu_count() or 1
+
+    indicator_plan = IndicatorPlan()
+
+    for indicator in indicators:
+        arguments = dict(indicator)
+        indicator_plan.add(indicator=arguments.pop('indicator'), **arguments)
+
+    frame = stock_frame.frame
+    offsets = stock_frame.grouping.offsets
+
+    columns = [key[1] for key in indicator_plan.nodes if key[0] == 'column']
+    output_columns = list(indicator_plan.columns)
+
+    shards = balanced_shards(offsets=offsets, shards=workers * shards_per_worker)
+
+    # Small jobs aren't worth starting the pool for.
+    if shared_memory is None or workers <= 1 or len(shards) <= 1:
+        context = ShardContext(
+            columns={name: frame[name].to_numpy(dtype=np.float64) for name in columns},
+            offsets=offsets
+        )
+        indicator_plan.run(context=context)
+
+        return pd.DataFrame(data=context.outputs, index=frame.index, columns=output_columns)
+
+    # Share the price columns, unless the caller already did.
+    owned_inputs = inputs is None
+
+    if owned_inputs:
+        inputs = stock_frame.to_shared(columns=columns)
+
+    outputs = SharedPriceBlock.allocate(
+        dtypes={name: np.float64 for name in output_columns},
+        offsets=offsets,
+        symbols=inputs.symbols
+    )
+
+    try:
+        tasks = [
+            {
+                'inputs': inputs.name,
+                'outputs': outputs.name,
+                'symbols': shard,
+                'columns': columns,
+                'indicators': indicators
+            }
+            for shard in shards
+        ]
+
+        with multiprocessing.Pool(processes=min(workers, len(tasks))) as pool:
+            pool.map(_run_shard, tasks, chunksize=1)
+
+        # Copy the outputs out before the shared memory is released.
+        output_frame = pd.DataFrame(data=outputs.columns, index=frame.index, columns=output_columns)
+
+    finally:
+        outputs.close()
+        outputs.unlink()
+
+        if owned_inputs:
+            inputs.close()
+            inputs.unlink()
+
+    return output_frame
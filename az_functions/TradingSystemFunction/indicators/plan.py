@@ -0,0 +1,514 @@
+import numpy as np
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Callable
+
+from . import kernels
+
+
+class PlanNode():
+
+    """
+    Represents one step of an indicator plan, an intermediate
+    value or an output that can be shared by several indicators.
+    """
+
+    def __init__(self, key: tuple, function: Callable[..., Any], inputs: List[tuple], label: str) -> None:
+        """Initalizes the Plan Node.
+
+        Arguments:
+        ----
+        key {tuple} -- The key of the step, two steps with the same key are
+            calculated once.
+
+        function {Callable[..., Any]} -- Calculates the step from the symbol offsets
+            and the values of its inputs.
+
+        inputs {List[tuple]} -- The keys of the steps it reads.
+
+        label {str} -- A short description of the step, used by `explain`.
+        """
+
+        self.key = key
+        self.function = function
+        self.inputs = inputs
+        self.label = label
+        self.outputs: List[str] = []
+
+
+class IndicatorPlan():
+
+    """
+    Represents the indicators requested in a run as a graph of shared steps.
+    """
+
+    def __init__(self) -> None:
+        """Initalizes the Indicator Plan.
+
+        Overview:
+        ----
+        Each indicator is broken into steps like the change in price, the
+        exponentially weighted mean of the close for a given span, the rolling
+        moments of a window or the true range. Steps are keyed by what they
+        calculate, so when the RSI and the change in price both need the
+        difference of the close, or the EMA and the MACD both need the same
+        EWMA, it's calculated once. When the plan runs, each step is freed as
+        soon as the last step reading it is done.
+
+        Usage:
+        ----
+            >>> indicator_plan = IndicatorPlan()
+            >>> indicator_plan.add(indicator='ema', column_name='ema', period=12)
+            >>> indicator_plan.add(indicator='macd', column_name='macd', fast_period=12, slow_period=26)
+            >>> print(indicator_plan.explain())
+            >>> indicator_plan.run(context=context)
+        """
+
+        self.nodes: Dict[tuple, PlanNode] = {}
+        self.columns: Dict[str, tuple] = {}
+        self.requests: List[Tuple[str, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def add(self, indicator: str, column_name: str = None, **arguments) -> None:
+        """Adds an indicator to the plan.
+
+        Arguments:
+        ----
+        indicator {str} -- The name of the `Indicators` method.
+
+        Keyword Arguments:
+        ----
+        column_name {str} -- The column the indicator is written to, `None` uses
+            the indicator name. (default: {None})
+
+        **arguments -- The arguments of the `Indicators` method.
+
+        Raises:
+        ----
+        ValueError: If the indicator can't be planned.
+        """
+
+        if indicator not in PLAN_BUILDERS:
+            raise ValueError(
+                "The indicator `{name}` can't be computed in a batch, supported indicators are: {supported}".format(
+                    name=indicator,
+                    supported=list(PLAN_BUILDERS)
+                )
+            )
+
+        column_name = column_name or indicator
+
+        PLAN_BUILDERS[indicator](self, column_name, **arguments)
+        self.requests.append((indicator, column_name))
+
+    def node(self, key: tuple, function: Callable[..., Any], inputs: List[tuple] = None, label: str = None) -> tuple:
+        """Adds a step, unless a step with the same key is already in the plan.
+
+        Arguments:
+        ----
+        key {tuple} -- The key of the step.
+
+        function {Callable[..., Any]} -- Calculates the step from the symbol offsets
+            and the values of its inputs.
+
+        Keyword Arguments:
+        ----
+        inputs {List[tuple]} -- The keys of the steps it reads. (default: {None})
+
+        label {str} -- A short description of the step. (default: {None})
+
+        Returns:
+        ----
+        {tuple} -- The key of the step.
+        """
+
+        if key not in self.nodes:
+            self.nodes[key] = PlanNode(key=key, function=function, inputs=list(inputs or []), label=label or key[0])
+
+        return key
+
+    def output(self, key: tuple, column_name: str) -> None:
+        """Marks a step as the values of an output column, replacing an earlier output with the same name."""
+
+        if column_name in self.columns:
+            self.nodes[self.columns.pop(column_name)].outputs.remove(column_name)
+
+        self.columns[column_name] = key
+        self.nodes[key].outputs.append(column_name)
+
+    def column(self, name: str) -> tuple:
+        """Adds a price column read from the frame."""
+
+        return self.node(key=('column', name), function=None, label='column({name})'.format(name=name))
+
+    def diff(self, source: tuple, periods: int = 1) -> tuple:
+        """Adds the difference of a step with its value `periods` rows back."""
+
+        return self.node(
+            key=('diff', source, periods),
+            function=lambda offsets, values: kernels.diff(values=values, periods=periods, offsets=offsets),
+            inputs=[source],
+            label='diff(periods={periods})'.format(periods=periods)
+        )
+
+    def ewm(self, source: tuple, alpha: float) -> tuple:
+        """Adds the exponentially weighted mean of a step, before any warm up is hidden."""
+
+        return self.node(
+            key=('ewm', source, alpha),
+            function=lambda offsets, values: kernels.ewm_mean(values=values, alpha=alpha, offsets=offsets),
+            inputs=[source],
+            label='ewm(alpha={alpha:.4g})'.format(alpha=alpha)
+        )
+
+    def warmup(self, values: tuple, source: tuple, min_periods: int) -> tuple:
+        """Adds a copy of a step with the values before `min_periods` observations of `source` hidden."""
+
+        if min_periods <= 1:
+            return values
+
+        def hide_warmup(offsets: np.ndarray, values: np.ndarray, source: np.ndarray) -> np.ndarray:
+            observations = kernels.segmented_cumsum(values=~np.isnan(source), offsets=offsets)
+            return np.where(observations < min_periods, np.nan, values)
+
+        return self.node(
+            key=('warmup', values, source, min_periods),
+            function=hide_warmup,
+            inputs=[values, source],
+            label='warmup(min_periods={min_periods})'.format(min_periods=min_periods)
+        )
+
+    def rolling_mean(self, source: tuple, window: int) -> tuple:
+        """Adds the rolling mean of a step, read off the rolling moments if they're in the plan."""
+
+        return self.node(
+            key=('rolling_mean', source, window),
+            function=lambda offsets, values: kernels.rolling_mean(values=values, window=window, offsets=offsets),
+            inputs=[source],
+            label='rolling_mean(window={window})'.format(window=window)
+        )
+
+    def rolling_moments(self, source: tuple, window: int) -> Tuple[tuple, tuple]:
+        """Adds the rolling mean and standard deviation of a step, calculated together."""
+
+        moments = self.node(
+            key=('rolling_moments', source, window),
+            function=lambda offsets, values: kernels.rolling_moments(values=values, window=window, offsets=offsets),
+            inputs=[source],
+            label='rolling_moments(window={window})'.format(window=window)
+        )
+
+        moving_std = self.node(
+            key=('rolling_std', source, window),
+            function=lambda offsets, moments: moments[1],
+            inputs=[moments],
+            label='rolling_std(window={window})'.format(window=window)
+        )
+
+        return self.rolling_mean(source=source, window=window), moving_std
+
+    def wilder(self, source: tuple, period: int, skip: int = 0) -> tuple:
+        """Adds Wilder's moving average of a step."""
+
+        return self.node(
+            key=('wilder', source, period, skip),
+            function=lambda offsets, values: kernels.wilder_mean(values=values, period=period, offsets=offsets, skip=skip),
+            inputs=[source],
+            label='wilder(period={period})'.format(period=period)
+        )
+
+    def combine(self, name: str, function: Callable[..., np.ndarray], inputs: List[tuple], *parameters) -> tuple:
+        """Adds a step that combines other steps row by row, like the RSI from the average moves."""
+
+        return self.node(
+            key=(name, *inputs, *parameters),
+            function=lambda offsets, *values: function(*values),
+            inputs=inputs,
+            label='{name}({parameters})'.format(name=name, parameters=', '.join(str(value) for value in parameters))
+        )
+
+    def _share_moments(self) -> None:
+        """Reads the rolling means off the rolling moments of the same window, when both are needed."""
+
+        for key, node in self.nodes.items():
+
+            if key[0] != 'rolling_mean':
+                continue
+
+            moments = ('rolling_moments',) + key[1:]
+
+            if moments in self.nodes and node.inputs != [moments]:
+                node.function = lambda offsets, moments: moments[0]
+                node.inputs = [moments]
+                node.label = node.label.replace('rolling_mean', 'rolling_mean from moments')
+
+    def order(self) -> List[tuple]:
+        """Returns the keys of the steps, each one after the steps it reads."""
+
+        self._share_moments()
+
+        ordered = []
+        visited = set()
+
+        def visit(key: tuple) -> None:
+
+            if key in visited:
+                return
+
+            visited.add(key)
+
+            for input_key in self.nodes[key].inputs:
+                visit(input_key)
+
+            ordered.append(key)
+
+        for key in self.nodes:
+            visit(key)
+
+        return ordered
+
+    def run(self, context: Any) -> None:
+        """Calculates the plan and hands the outputs to the context.
+
+        Arguments:
+        ----
+        context {IndicatorContext} -- The context the price columns are read
+            from and the outputs are added to.
+        """
+
+        ordered = self.order()
+        readers = self._readers(ordered=ordered)
+
+        remaining = {key: len(readers[key]) for key in ordered}
+        values = {}
+        outputs = {}
+
+        for key in ordered:
+
+            node = self.nodes[key]
+
+            if key[0] == 'column':
+                values[key] = context.column(name=key[1])
+            else:
+                values[key] = node.function(context.offsets, *[values[input_key] for input_key in node.inputs])
+
+            if node.outputs:
+                outputs[key] = values[key]
+
+            # Free the steps nobody else is going to read.
+            for input_key in set(node.inputs):
+                remaining[input_key] -= 1
+                if remaining[input_key] == 0:
+                    del values[input_key]
+
+            if remaining[key] == 0:
+                del values[key]
+
+        # Hand over the outputs in the order the indicators asked for them.
+        for column_name, key in self.columns.items():
+            context.add_output(column_name=column_name, values=outputs[key])
+
+        self.nodes = {}
+        self.columns = {}
+        self.requests = []
+
+    def _readers(self, ordered: List[tuple]) -> Dict[tuple, List[tuple]]:
+        """Returns the steps that read each step."""
+
+        readers = {key: [] for key in ordered}
+
+        for key in ordered:
+            for input_key in set(self.nodes[key].inputs):
+                readers[input_key].append(key)
+
+        return readers
+
+    def explain(self) -> str:
+        """Describes the steps of the plan, which ones are shared and when they're freed.
+
+        Returns:
+        ----
+        {str} -- One line for each step, in the order they run.
+
+        Usage:
+        ----
+            >>> print(indicator_plan.explain())
+            Indicator plan: 2 indicators, 6 steps, 2 shared.
+              #1 column(close)                                 read by #2, #3, #5, freed after #5
+              #2 ewm(alpha=0.1538)                             read by #3, #4, freed after #4  => ema
+              ...
+        """
+
+        ordered = self.order()
+        readers = self._readers(ordered=ordered)
+        numbers = {key: position for position, key in enumerate(ordered, start=1)}
+
+        shared = sum(1 for key in ordered if len(readers[key]) + len(self.nodes[key].outputs) > 1)
+
+        lines = [
+            'Indicator plan: {indicators} indicators, {steps} steps, {shared} shared.'.format(
+                indicators=len(self.requests),
+                steps=len(ordered),
+                shared=shared
+            )
+        ]
+
+        for key in ordered:
+
+            node = self.nodes[key]
+            step = '#{number} {label}'.format(number=numbers[key], label=node.label)
+
+            if node.inputs:
+                step += ' <- ' + ', '.join('#{}'.format(numbers[input_key]) for input_key in node.inputs)
+
+            if readers[key]:
+                last = max(numbers[reader] for reader in readers[key])
+                use = 'read by {readers}, freed after #{last}'.format(
+                    readers=', '.join('#{}'.format(numbers[reader]) for reader in readers[key]),
+                    last=last
+                )
+            else:
+                use = 'freed after #{number}'.format(number=numbers[key])
+
+            line = '  {step:<48} {use}'.format(step=step, use=use)
+
+            if node.outputs:
+                line += '  => ' + ', '.join(node.outputs)
+
+            lines.append(line)
+
+        return '\n'.join(lines)
+
+
+def _relative_strength_index(ewma_up: np.ndarray, ewma_down: np.ndarray) -> np.ndarray:
+    """Turns the average up and down moves into the RSI."""
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100.0 - (100.0 / (1.0 + ewma_up / ewma_down))
+
+
+def _plan_change_in_price(plan: IndicatorPlan, column_name: str) -> None:
+
+    plan.output(plan.diff(source=plan.column(name='close')), column_name)
+
+
+def _plan_rate_of_change(plan: IndicatorPlan, column_name: str, period: int = 1) -> None:
+
+    close = plan.column(name='close')
+
+    plan.output(
+        plan.node(
+            key=('pct_change', close, period),
+            function=lambda offsets, values: kernels.pct_change(values=values, periods=period, offsets=offsets),
+            inputs=[close],
+            label='pct_change(periods={period})'.format(period=period)
+        ),
+        column_name
+    )
+
+
+def _plan_sma(plan: IndicatorPlan, column_name: str, period: int) -> None:
+
+    plan.output(plan.rolling_mean(source=plan.column(name='close'), window=period), column_name)
+
+
+def _plan_ema(plan: IndicatorPlan, column_name: str, period: int, alpha: float = 0.0) -> None:
+
+    plan.output(plan.ewm(source=plan.column(name='close'), alpha=2.0 / (period + 1.0)), column_name)
+
+
+def _plan_rsi(plan: IndicatorPlan, column_name: str, period: int, method: str = 'wilders') -> None:
+
+    change = plan.diff(source=plan.column(name='close'))
+
+    up_moves = plan.combine('up_moves', lambda change: np.where(change >= 0, change, 0.0), [change])
+    down_moves = plan.combine('down_moves', lambda change: np.where(change < 0, -change, 0.0), [change])
+
+    if method == 'wilders':
+        ewma_up = plan.wilder(source=up_moves, period=period, skip=1)
+        ewma_down = plan.wilder(source=down_moves, period=period, skip=1)
+    elif method == 'ema':
+        ewma_up = plan.ewm(source=up_moves, alpha=2.0 / (period + 1.0))
+        ewma_down = plan.ewm(source=down_moves, alpha=2.0 / (period + 1.0))
+    else:
+        raise ValueError("The RSI method must be `wilders` or `ema`, not `{method}`.".format(method=method))
+
+    plan.output(plan.combine('rsi', _relative_strength_index, [ewma_up, ewma_down]), column_name)
+
+
+def _plan_standard_deviation(plan: IndicatorPlan, column_name: str, period: int) -> None:
+
+    _, moving_std = plan.rolling_moments(source=plan.column(name='close'), window=period)
+
+    plan.output(moving_std, column_name)
+
+
+def _plan_bollinger_bands(plan: IndicatorPlan, column_name: str, period: int = 20, num_std: float = 2.0) -> None:
+
+    moving_avg, moving_std = plan.rolling_moments(source=plan.column(name='close'), window=period)
+
+    band_upper = plan.combine('band', lambda mean, std: mean + num_std * std, [moving_avg, moving_std], num_std)
+    band_lower = plan.combine('band', lambda mean, std: mean - num_std * std, [moving_avg, moving_std], -num_std)
+
+    plan.output(band_upper, 'band_upper')
+    plan.output(moving_avg, 'band_mid')
+    plan.output(band_lower, 'band_lower')
+
+
+def _plan_average_true_range(plan: IndicatorPlan, column_name: str, period: int = 14) -> None:
+
+    high = plan.column(name='high')
+    low = plan.column(name='low')
+    close = plan.column(name='close')
+
+    true_range = plan.node(
+        key=('true_range', high, low, close),
+        function=lambda offsets, high, low, close: kernels.true_range(high=high, low=low, close=close, offsets=offsets),
+        inputs=[high, low, close],
+        label='true_range'
+    )
+
+    plan.output(plan.wilder(source=true_range, period=period), column_name)
+
+
+def _plan_macd(plan: IndicatorPlan, column_name: str, fast_period: int = 12, slow_period: int = 26) -> None:
+
+    close = plan.column(name='close')
+
+    macd_fast = plan.warmup(
+        values=plan.ewm(source=close, alpha=2.0 / (fast_period + 1.0)),
+        source=close,
+        min_periods=fast_period
+    )
+    macd_slow = plan.warmup(
+        values=plan.ewm(source=close, alpha=2.0 / (slow_period + 1.0)),
+        source=close,
+        min_periods=slow_period
+    )
+    macd_diff = plan.combine('subtract', np.subtract, [macd_fast, macd_slow])
+    macd = plan.warmup(values=plan.ewm(source=macd_diff, alpha=2.0 / (9 + 1.0)), source=macd_diff, min_periods=8)
+
+    plan.output(macd_fast, 'macd_fast')
+    plan.output(macd_slow, 'macd_slow')
+    plan.output(macd_diff, 'macd_diff')
+    plan.output(macd, column_name)
+
+
+# Adds the steps of each indicator to a plan, keyed by `Indicators` method. Each one takes
+# the plan and the column name, along with the arguments of the method.
+PLAN_BUILDERS: Dict[str, Callable[..., None]] = {
+    'change_in_price': _plan_change_in_price,
+    'rate_of_change': _plan_rate_of_change,
+    'sma': _plan_sma,
+    'ema': _plan_ema,
+    'rsi': _plan_rsi,
+    'standard_deviation': _plan_standard_deviation,
+    'bollinger_bands': _plan_bollinger_bands,
+    'average_true_range': _plan_average_true_range,
+    'macd': _plan_macd
+}
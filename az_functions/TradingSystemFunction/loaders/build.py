@@ -0,0 +1,653 @@
+import re
+import json
+import asyncio
+import datetime
+import numpy as np
+import pandas as pd
+
+from array import array
+from collections import deque
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+from typing import Iterable
+from typing import Optional
+
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceNotModifiedError
+from azure.storage.blob import StorageStreamDownloader
+from azure.storage.blob.aio import ContainerClient as AsyncContainerClient
+from azure.storage.blob.aio import StorageStreamDownloader as AsyncStorageStreamDownloader
+
+# The UTF-8 Byte Order Mark that Data Factory writes at the start of the file.
+BOM = b'\xef\xbb\xbf'
+
+# Finds the date of a record without parsing the rest of it.
+DATE_PATTERN = re.compile(rb'"date"\s*:\s*"([^"]*)"')
+
+# An `end` written as a date alone, which covers the whole day.
+DATE_ONLY_PATTERN = re.compile(r'^\s*\d{4}-\d{2}-\d{2}\s*$')
+
+# The columns the indicators are calculated from.
+PRICE_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+def end_bound(end: Union[str, datetime.date, pd.Timestamp, None]) -> Optional[np.datetime64]:
+    """Returns the first date after the range, so every reader can filter on `date < bound`.
+
+    Overview:
+    ----
+    A date without a time, like `2021-01-05`, means the whole day, so the
+    bound is midnight of the next day and the intraday bars of the last day
+    are kept. A date with a time is the last date to keep.
+
+    Arguments:
+    ----
+    end {Union[str, datetime.date, pd.Timestamp, None]} -- The last date of the range.
+
+    Raises:
+    ----
+    ValueError: If `end` isn't a date.
+
+    Returns:
+    ----
+    {Optional[np.datetime64]} -- The bound, `None` if there's no `end`.
+    """
+
+    if end is None:
+        return None
+
+    timestamp = pd.Timestamp(end)
+
+    date_only = (
+        isinstance(end, str) and DATE_ONLY_PATTERN.match(end) is not None
+    ) or (
+        isinstance(end, datetime.date) and not isinstance(end, datetime.datetime)
+    )
+
+    if date_only:
+        return (timestamp.normalize() + pd.Timedelta(days=1)).to_datetime64()
+
+    return (timestamp + pd.Timedelta(nanoseconds=1)).to_datetime64()
+
+
+class NdjsonColumnReader():
+
+    """
+    Represents a streaming reader for line-delimited JSON price files,
+    that collects each record straight into columnar buffers.
+    """
+
+    def __init__(self, columns: List[str] = None, start: Union[str, pd.Timestamp] = None,
+                 end: Union[str, pd.Timestamp] = None, lookback: Optional[int] = 0) -> None:
+        """Initalizes the Reader.
+
+        Overview:
+        ----
+        The price history files are stored as one JSON record per line. Instead
+        of reading the whole file, decoding it and joining it back together as a
+        JSON array, the reader is fed the raw chunks as they are downloaded and
+        only holds on to the partial line at the end of each chunk.
+
+        When a date range is given, the date of each record is found before
+        the record is parsed. Records before `start` are kept as raw lines,
+        only the last `lookback` of them, and parsed once the first record in
+        the range shows up, so the indicators have the history they need to
+        warm up. Records after `end` are skipped, and since the price files
+        are written in date order `past_end` tells the caller it can stop
+        downloading.
+
+        Keyword Arguments:
+        ----
+        columns {List[str]} -- The columns to keep, `symbol` and `date` are always
+            kept. `None` keeps every column. (default: {None})
+
+        start {Union[str, pd.Timestamp]} -- The first date to return. (default: {None})
+
+        end {Union[str, pd.Timestamp]} -- The last date to return, a date without a
+            time returns the whole day. (default: {None})
+
+        lookback {Optional[int]} -- The number of records before `start` to return
+            as well, `None` returns all of them. (default: {0})
+
+        Usage:
+        ----
+            >>> reader = NdjsonColumnReader(columns=['close'], start='2021-01-01', lookback=99)
+            >>> for chunk in blob_container.download_blob(blob=blob_name).chunks():
+                    reader.feed(chunk=chunk)
+            >>> columns = reader.close()
+        """
+
+        self._remainder = b''
+        self._checked_bom = False
+        self._row_count = 0
+
+        self._keep = None if columns is None else set(columns) | {'symbol', 'date'}
+        self._start = None if start is None or lookback is None else pd.Timestamp(start).to_datetime64()
+        self._end = end_bound(end=end)
+        self._lookback: deque = deque(maxlen=lookback or 0)
+        self._in_range = self._start is None
+        self.past_end = False
+
+        self._columns: Dict[str, Union[array, list]] = {}
+        self._integer_columns: Dict[str, bool] = {}
+
+    @property
+    def row_count(self) -> int:
+        """The number of records parsed so far.
+
+        Returns:
+        ----
+        {int} -- The number of records.
+        """
+
+        return self._row_count
+
+    def feed(self, chunk: bytes) -> None:
+        """Parses every complete line in the chunk.
+
+        Arguments:
+        ----
+        chunk {bytes} -- The next chunk of the file.
+        """
+
+        buffer = self._remainder + chunk
+
+        # The BOM only ever shows up at the very start of the file.
+        if not self._checked_bom:
+
+            if len(buffer) < len(BOM):
+                self._remainder = buffer
+                return
+
+            if buffer.startswith(BOM):
+                buffer = buffer[len(BOM):]
+
+            self._checked_bom = True
+
+        lines = buffer.split(b'\n')
+
+        # The last piece is either empty or a partial record.
+        self._remainder = lines.pop()
+
+        for line in lines:
+            self._parse_line(line=line)
+
+    def close(self) -> Dict[str, Union[np.ndarray, list]]:
+        """Parses the last line and returns the columns.
+
+        Returns:
+        ----
+        {Dict[str, Union[np.ndarray, list]]} -- The columns of the file, numeric
+            columns are returned as `numpy` arrays and everything else as lists.
+        """
+
+        if not self._checked_bom and self._remainder.startswith(BOM):
+            self._remainder = self._remainder[len(BOM):]
+
+        self._checked_bom = True
+
+        # If we stopped early, the last line is cut off and past the range anyway.
+        if not self.past_end:
+            self._parse_line(line=self._remainder)
+
+        self._remainder = b''
+
+        columns = {}
+
+        for name, values in self._columns.items():
+
+            if isinstance(values, array):
+                values = np.frombuffer(values, dtype=np.float64)
+
+                if self._integer_columns[name]:
+                    values = values.astype(np.int64)
+
+            columns[name] = values
+
+        return columns
+
+    def _parse_line(self, line: bytes) -> None:
+        """Parses a single record and appends it to the columns.
+
+        Arguments:
+        ----
+        line {bytes} -- A single line from the file.
+        """
+
+        line = line.strip()
+
+        if not line:
+            return
+
+        if not self._in_range or self._end is not None:
+
+            date = self._find_date(line=line)
+
+            if date is not None:
+
+                if self._end is not None and date >= self._end:
+                    self.past_end = True
+                    return
+
+                if not self._in_range:
+
+                    if date < self._start:
+                        if self._lookback.maxlen:
+                            self._lookback.append(line)
+                        return
+
+                    # The first record in the range, so parse the lookback first.
+                    self._in_range = True
+
+                    for kept_line in self._lookback:
+                        self._parse_record(line=kept_line)
+
+                    self._lookback.clear()
+
+        self._parse_record(line=line)
+
+    def _find_date(self, line: bytes) -> Optional[np.datetime64]:
+        """Finds the date of a record without parsing it.
+
+        Arguments:
+        ----
+        line {bytes} -- A single line from the file.
+
+        Returns:
+        ----
+        {Optional[np.datetime64]} -- The date, or `None` if the record doesn't have one.
+        """
+
+        match = DATE_PATTERN.search(line)
+
+        if match is None:
+            return None
+
+        try:
+            return np.datetime64(match.group(1).decode('utf-8'), 'ns')
+        except ValueError:
+            return pd.Timestamp(match.group(1).decode('utf-8')).to_datetime64()
+
+    def _parse_record(self, line: bytes) -> None:
+        """Parses a single record and appends it to the columns.
+
+        Arguments:
+        ----
+        line {bytes} -- A single line from the file.
+        """
+
+        record: dict = json.loads(line)
+
+        if self._keep is not None:
+            record = {name: value for name, value in record.items() if name in self._keep}
+
+        for name, value in record.items():
+
+            if name not in self._columns:
+                self._add_column(name=name, value=value)
+
+            self._append_value(name=name, value=value)
+
+        self._row_count += 1
+
+        # Pad the columns missing from this record.
+        for name, values in self._columns.items():
+            if len(values) < self._row_count:
+                self._append_value(name=name, value=None)
+
+    def _add_column(self, name: str, value: object) -> None:
+        """Creates the buffer for a new column.
+
+        Arguments:
+        ----
+        name {str} -- The name of the column.
+
+        value {object} -- The first value seen for the column, used
+            to pick between a numeric or an object buffer.
+        """
+
+        if _is_number(value=value):
+            values = array('d', [np.nan]) * self._row_count
+        else:
+            values = [None] * self._row_count
+
+        self._columns[name] = values
+
+        # A column padded with `NaN` for the earlier records can't be stored as integers.
+        self._integer_columns[name] = self._row_count == 0
+
+    def _append_value(self, name: str, value: object) -> None:
+        """Appends a value to the column buffer.
+
+        Arguments:
+        ----
+        name {str} -- The name of the column.
+
+        value {object} -- The value to append.
+        """
+
+        values = self._columns[name]
+
+        if isinstance(values, array):
+
+            # A missing value is stored as `NaN`, so the column has to stay a float.
+            if value is None:
+                values.append(np.nan)
+                self._integer_columns[name] = False
+                return
+
+            if _is_number(value=value):
+
+                if not isinstance(value, int):
+                    self._integer_columns[name] = False
+
+                values.append(value)
+                return
+
+            # A non-numeric value showed up, so fall back to an object column.
+            values = [None if np.isnan(item) else item for item in values]
+            self._columns[name] = values
+
+        values.append(value)
+
+
+def _is_number(value: object) -> bool:
+    """Checks whether a JSON value can be stored in a numeric buffer."""
+
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def read_ndjson_columns(chunks: Iterable[bytes], reader: NdjsonColumnReader = None) -> Dict[str, Union[np.ndarray, list]]:
+    """Reads a line-delimited JSON file chunk by chunk into columns.
+
+    Arguments:
+    ----
+    chunks {Iterable[bytes]} -- The chunks of the file.
+
+    Keyword Arguments:
+    ----
+    reader {NdjsonColumnReader} -- The reader to use, set it up with the columns and
+        the date range to read. `None` reads everything. (default: {None})
+
+    Returns:
+    ----
+    {Dict[str, Union[np.ndarray, list]]} -- The columns of the file.
+    """
+
+    reader = reader or NdjsonColumnReader()
+
+    for chunk in chunks:
+
+        reader.feed(chunk=chunk)
+
+        # The rest of the file is past the date range.
+        if reader.past_end:
+            break
+
+    return reader.close()
+
+
+def read_price_blob(blob_content: StorageStreamDownloader, reader: NdjsonColumnReader = None) -> Dict[str, Union[np.ndarray, list]]:
+    """Streams a price history blob into columns.
+
+    Arguments:
+    ----
+    blob_content {StorageStreamDownloader} -- The downloader returned
+        by `download_blob`.
+
+    Keyword Arguments:
+    ----
+    reader {NdjsonColumnReader} -- The reader to use. (default: {None})
+
+    Returns:
+    ----
+    {Dict[str, Union[np.ndarray, list]]} -- The columns of the file.
+    """
+
+    return read_ndjson_columns(chunks=blob_content.chunks(), reader=reader)
+
+
+async def read_price_blob_async(blob_content: AsyncStorageStreamDownloader,
+                                reader: NdjsonColumnReader = None) -> Dict[str, Union[np.ndarray, list]]:
+    """Streams a price history blob into columns, as the chunks arrive.
+
+    Arguments:
+    ----
+    blob_content {AsyncStorageStreamDownloader} -- The downloader returned
+        by the async `download_blob`.
+
+    Keyword Arguments:
+    ----
+    reader {NdjsonColumnReader} -- The reader to use. (default: {None})
+
+    Returns:
+    ----
+    {Dict[str, Union[np.ndarray, list]]} -- The columns of the file.
+    """
+
+    reader = reader or NdjsonColumnReader()
+
+    async for chunk in blob_content.chunks():
+
+        reader.feed(chunk=chunk)
+
+        # The rest of the blob is past the date range, so stop downloading it.
+        if reader.past_end:
+            break
+
+    return reader.close()
+
+
+async def download_price_blob_async(container_client: AsyncContainerClient, blob_name: str, etag: str = None,
+                                    reader_options: dict = None) -> Tuple[Optional[Dict[str, Union[np.ndarray, list]]], str]:
+    """Downloads a price history blob into columns, unless it hasn't changed.
+
+    Arguments:
+    ----
+    container_client {AsyncContainerClient} -- The async container client holding
+        the price history.
+
+    blob_name {str} -- The name of the blob.
+
+    Keyword Arguments:
+    ----
+    etag {str} -- The ETag of the copy we already have. When it's given the
+        download is sent with `If-None-Match`. (default: {None})
+
+    reader_options {dict} -- The arguments of the `NdjsonColumnReader`, like the
+        `columns`, `start`, `end` and `lookback` to read. (default: {None})
+
+    Returns:
+    ----
+    {Tuple[Optional[Dict[str, Union[np.ndarray, list]]], str]} -- The columns of the
+        file and its ETag. The columns are `None` if the blob still matches `etag`.
+    """
+
+    conditions = {}
+
+    if etag:
+        conditions = {'etag': etag, 'match_condition': MatchConditions.IfModified}
+
+    try:
+        blob_content = await container_client.download_blob(blob=blob_name, **conditions)
+    except ResourceNotModifiedError:
+        return None, etag
+
+    columns = await read_price_blob_async(
+        blob_content=blob_content,
+        reader=NdjsonColumnReader(**(reader_options or {}))
+    )
+
+    return columns, blob_content.properties.etag
+
+
+async def download_changed_price_blobs(container_client: AsyncContainerClient, symbols: List[str],
+                                       etags: Dict[str, str] = None,
+                                       blob_name: str = 'iex-price-history/{symbol}.json',
+                                       max_downloads: int = 16,
+                                       reader_options: dict = None) -> Dict[str, Tuple[Optional[Dict[str, Union[np.ndarray, list]]], str]]:
+    """Downloads the price history of several symbols at the same time, skipping the unchanged ones.
+
+    Arguments:
+    ----
+    container_client {AsyncContainerClient} -- The async container client holding
+        the price history.
+
+    symbols {List[str]} -- The symbols to download.
+
+    Keyword Arguments:
+    ----
+    etags {Dict[str, str]} -- The ETag we already have for each symbol, these
+        blobs are only downloaded if they changed. (default: {None})
+
+    blob_name {str} -- The blob name of a symbol, where `{symbol}` is
+        replaced by the symbol. (default: {'iex-price-history/{symbol}.json'})
+
+    max_downloads {int} -- The most downloads to run at once. (default: {16})
+
+    reader_options {dict} -- The arguments of the `NdjsonColumnReader` used
+        for each blob. (default: {None})
+
+    Returns:
+    ----
+    {Dict[str, Tuple[Optional[Dict[str, Union[np.ndarray, list]]], str]]} -- The columns
+        and ETag of each symbol, the columns are `None` when the blob didn't change.
+    """
+
+    etags = etags or {}
+    semaphore = asyncio.Semaphore(max_downloads)
+
+    async def download(symbol: str) -> Tuple[Optional[Dict[str, Union[np.ndarray, list]]], str]:
+
+        async with semaphore:
+            return await download_price_blob_async(
+                container_client=container_client,
+                blob_name=blob_name.format(symbol=symbol),
+                etag=etags.get(symbol, None),
+                reader_options=reader_options
+            )
+
+    results = await asyncio.gather(
+        *[download(symbol=symbol) for symbol in symbols]
+    )
+
+    return dict(zip(symbols, results))
+
+
+async def download_price_blobs(container_client: AsyncContainerClient, symbols: List[str],
+                               blob_name: str = 'iex-price-history/{symbol}.json',
+                               max_downloads: int = 16,
+                               reader_options: dict = None) -> Dict[str, Union[np.ndarray, list]]:
+    """Downloads the price history of several symbols at the same time.
+
+    Overview:
+    ----
+    Each blob is streamed into its own reader, and the downloads are run
+    together so the time spent waiting on storage overlaps. Once they are
+    all done the columns are joined, with the rows of each symbol kept
+    next to each other so they can go straight into `StockFrame.from_columns`.
+
+    Arguments:
+    ----
+    container_client {AsyncContainerClient} -- The async container client holding
+        the price history.
+
+    symbols {List[str]} -- The symbols to download.
+
+    Keyword Arguments:
+    ----
+    blob_name {str} -- The blob name of a symbol, where `{symbol}` is
+        replaced by the symbol. (default: {'iex-price-history/{symbol}.json'})
+
+    max_downloads {int} -- The most downloads to run at once. (default: {16})
+
+    reader_options {dict} -- The arguments of the `NdjsonColumnReader` used
+        for each blob. (default: {None})
+
+    Returns:
+    ----
+    {Dict[str, Union[np.ndarray, list]]} -- The columns of every symbol, the `symbol`
+        column holds the position of the symbol in `symbols`.
+
+    Usage:
+    ----
+        >>> price_data = await download_price_blobs(
+                container_client=container_client,
+                symbols=['MSFT', 'AAPL']
+            )
+        >>> stock_frame = StockFrame.from_columns(columns=price_data, symbol_names=['MSFT', 'AAPL'])
+    """
+
+    results = await download_changed_price_blobs(
+        container_client=container_client,
+        symbols=symbols,
+        blob_name=blob_name,
+        max_downloads=max_downloads,
+        reader_options=reader_options
+    )
+
+    return concat_price_columns(
+        symbol_columns=[results[symbol][0] for symbol in symbols]
+    )
+
+
+def concat_price_columns(symbol_columns: List[Dict[str, Union[np.ndarray, list]]]) -> Dict[str, Union[np.ndarray, list]]:
+    """Joins the columns read for several symbols.
+
+    Arguments:
+    ----
+    symbol_columns {List[Dict[str, Union[np.ndarray, list]]]} -- The columns of
+        each symbol, in order.
+
+    Returns:
+    ----
+    {Dict[str, Union[np.ndarray, list]]} -- The joined columns, the `symbol` column
+        holds the position of each symbol in the list.
+    """
+
+    counts = [_column_length(columns=columns) for columns in symbol_columns]
+
+    names = []
+    for columns in symbol_columns:
+        names += [name for name in columns if name not in names and name != 'symbol']
+
+    joined = {
+        'symbol': np.repeat(np.arange(len(symbol_columns)), counts)
+    }
+
+    for name in names:
+
+        pieces = [columns.get(name, None) for columns in symbol_columns]
+
+        # Keep the column numeric if it's numeric for every symbol that has it.
+        if all(piece is None or isinstance(piece, np.ndarray) for piece in pieces):
+            joined[name] = np.concatenate([
+                np.full(count, np.nan) if piece is None else piece
+                for piece, count in zip(pieces, counts)
+            ])
+            continue
+
+        values = []
+
+        for piece, count in zip(pieces, counts):
+            if piece is None:
+                values += [None] * count
+            elif isinstance(piece, np.ndarray):
+                values += [None if value != value else value for value in piece.tolist()]
+            else:
+                values += piece
+
+        joined[name] = values
+
+    return joined
+
+
+def _column_length(columns: Dict[str, Union[np.ndarray, list]]) -> int:
+    """Returns the number of rows in a set of columns."""
+
+    for values in columns.values():
+        return len(values)
+
+    return 0
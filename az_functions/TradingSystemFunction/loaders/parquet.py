@@ -0,0 +1,431 @@
+import os
+import numpy as np
+import pandas as pd
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+from typing import Optional
+
+from .build import end_bound
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    ds = None
+    pq = None
+
+
+# The columns that are kept as 64 bit integers, every other number is stored as a 32 bit float.
+INTEGER_COLUMNS = ['volume', 'uVolume', 'fVolume', 'updated']
+
+# The most rows in each row group. A year of minute bars is about 100,000 rows, so each
+# partition is usually a single row group and the footer stays small; the symbol and year
+# partitions do most of the pruning, the row group statistics do the rest.
+ROW_GROUP_SIZE = 128 * 1024
+
+# Roughly how many calendar days there are for each trading day, plus a margin for holidays.
+CALENDAR_DAYS_PER_TRADING_DAY = 365 / 250
+CALENDAR_MARGIN_DAYS = 14
+
+# Intraday lookbacks usually span a few sessions, so they only need room for a long weekend.
+INTRADAY_MARGIN_DAYS = 4
+
+# The length of a regular trading session, used to count the intraday bars in a trading day.
+SESSION_LENGTH = pd.Timedelta(hours=6, minutes=30)
+
+
+def _check_pyarrow() -> None:
+    """Raises an error if `pyarrow` isn't installed."""
+
+    if pa is None:
+        raise ImportError('The Parquet price store needs `pyarrow`, install it with `pip install pyarrow`.')
+
+
+def write_price_dataset(columns: Dict[str, Union[np.ndarray, list]], root_path: str, filesystem: Any = None,
+                        row_group_size: int = ROW_GROUP_SIZE) -> List[str]:
+    """Writes price columns as Parquet files partitioned by symbol and year.
+
+    Overview:
+    ----
+    The files are laid out as `symbol=<SYMBOL>/year=<YEAR>/part-0.parquet`
+    under `root_path`, so a reader only opens the partitions it needs. Prices
+    are stored as `float32`, volumes and counters as `int64`, and the dates as
+    millisecond timestamps. Text fields like `label` or `id` are left out. The
+    rows are sorted by date and written in large row groups with min/max
+    statistics, so a date filter skips whole partitions and row groups
+    without the footer and per group overhead outgrowing the data. Writing
+    a partition that already exists replaces it.
+
+    Arguments:
+    ----
+    columns {Dict[str, Union[np.ndarray, list]]} -- The price columns, like the ones
+        returned by `read_price_blob`. Must include `symbol` and `date`.
+
+    root_path {str} -- The folder the dataset is written to.
+
+    Keyword Arguments:
+    ----
+    filesystem {Any} -- A `pyarrow` or `fsspec` filesystem, for example one for
+        Azure Blob Storage. `None` means the local disk. (default: {None})
+
+    row_group_size {int} -- The most rows in each row group. (default: {131072})
+
+    Returns:
+    ----
+    {List[str]} -- The paths of the files written.
+
+    Usage:
+    ----
+        >>> price_data = read_price_blob(blob_content=blob_content)
+        >>> write_price_dataset(columns=price_data, root_path='price-history/iex-price-parquet')
+    """
+
+    _check_pyarrow()
+
+    symbols = np.asarray(columns['symbol'], dtype=object)
+    dates = pd.DatetimeIndex(pd.to_datetime(np.asarray(columns['date']))).values.astype('datetime64[ms]')
+    years = dates.astype('datetime64[Y]').astype(np.int64) + 1970
+
+    arrays = {'date': pa.array(dates, type=pa.timestamp('ms'))}
+
+    for name, values in columns.items():
+
+        if name in ('symbol', 'date') or not isinstance(values, np.ndarray):
+            continue
+
+        if name in INTEGER_COLUMNS and np.issubdtype(values.dtype, np.integer):
+            arrays[name] = pa.array(values, type=pa.int64())
+        else:
+            arrays[name] = pa.array(values.astype(np.float32), type=pa.float32())
+
+    table = pa.table(arrays)
+
+    # Group the rows by partition, with the dates in order inside each one.
+    partition_codes, partitions = pd.factorize(
+        pd.MultiIndex.from_arrays([symbols, years])
+    )
+    order = np.lexsort((dates, partition_codes))
+    offsets = np.searchsorted(partition_codes[order], np.arange(len(partitions) + 1))
+
+    paths = []
+
+    for position, (symbol, year) in enumerate(partitions):
+
+        rows = order[offsets[position]:offsets[position + 1]]
+        folder = '{root}/symbol={symbol}/year={year}'.format(
+            root=root_path.rstrip('/'),
+            symbol=symbol,
+            year=year
+        )
+        path = folder + '/part-0.parquet'
+
+        if filesystem is None:
+            os.makedirs(folder, exist_ok=True)
+        elif hasattr(filesystem, 'makedirs'):
+            filesystem.makedirs(folder, exist_ok=True)
+
+        pq.write_table(
+            table.take(pa.array(rows)),
+            path,
+            row_group_size=row_group_size,
+            compression='snappy',
+            use_dictionary=True,
+            filesystem=filesystem
+        )
+        paths.append(path)
+
+    return paths
+
+
+def read_price_dataset(root_path: str, symbols: List[str] = None, columns: List[str] = None,
+                       start: Union[str, pd.Timestamp] = None, end: Union[str, pd.Timestamp] = None,
+                       lookback: Optional[int] = 0, bar_interval: Union[str, pd.Timedelta] = '1D',
+                       filesystem: Any = None) -> Tuple[Dict[str, np.ndarray], List[str]]:
+    """Reads a partitioned Parquet price dataset into columns.
+
+    Overview:
+    ----
+    Only the partitions of the requested symbols and only the requested
+    columns are read. The `symbol` partition is read as a dictionary, so the
+    symbols come back as integer codes along with the names they refer to,
+    ready for `StockFrame.from_columns`.
+
+    The date range is pushed down as a filter, so the `year` partitions and
+    the row groups outside of it are skipped. To make room for `lookback`
+    bars before `start`, the filter starts early by the number of calendar
+    days that `lookback` bars of `bar_interval` usually span, and the extra
+    rows are trimmed off. That's only an estimate, so any symbol that comes
+    back with fewer than `lookback` bars before `start`, because of a trading
+    halt or a gap in the data, has the rest of its history before the window
+    read as well.
+
+    Arguments:
+    ----
+    root_path {str} -- The folder the dataset was written to.
+
+    Keyword Arguments:
+    ----
+    symbols {List[str]} -- The symbols to read, `None` reads all of them. (default: {None})
+
+    columns {List[str]} -- The price columns to read, `None` reads all of
+        them. (default: {None})
+
+    start {Union[str, pd.Timestamp]} -- The first date to read. (default: {None})
+
+    end {Union[str, pd.Timestamp]} -- The last date to read, a date without a time
+        reads the whole day. (default: {None})
+
+    lookback {Optional[int]} -- The number of bars before `start` to read as
+        well, `None` reads all of them. (default: {0})
+
+    bar_interval {Union[str, pd.Timedelta]} -- How far apart the bars are, like
+        `'1D'` or `'1min'`, used to size the `lookback` window. (default: {'1D'})
+
+    filesystem {Any} -- A `pyarrow` or `fsspec` filesystem, `None` means
+        the local disk. (default: {None})
+
+    Returns:
+    ----
+    {Tuple[Dict[str, np.ndarray], List[str]]} -- The columns, with the `symbol` column
+        holding codes, and the symbol names the codes refer to.
+    """
+
+    _check_pyarrow()
+
+    dataset = ds.dataset(
+        root_path,
+        format='parquet',
+        partitioning=ds.HivePartitioning.discover(infer_dictionary=True),
+        filesystem=filesystem
+    )
+
+    if columns is None:
+        columns = [name for name in dataset.schema.names if name not in ('symbol', 'date', 'year')]
+
+    filters = []
+
+    if symbols is not None:
+        filters.append(ds.field('symbol').isin(list(symbols)))
+
+    first_date = None
+
+    if start is not None and lookback is not None:
+        start = pd.Timestamp(start)
+        first_date = start - _lookback_span(lookback=lookback, bar_interval=bar_interval)
+    else:
+        start = None
+
+    if end is not None:
+
+        # The dates are stored in milliseconds, so round the bound up to the next one.
+        bound = pd.Timestamp(end_bound(end=end)).ceil('ms')
+        filters.append(ds.field('year') <= (bound - pd.Timedelta(milliseconds=1)).year)
+        filters.append(ds.field('date') < pa.scalar(bound.to_pydatetime(), type=pa.timestamp('ms')))
+
+    read_columns = ['symbol', 'date'] + [name for name in columns if name not in ('symbol', 'date')]
+    table = dataset.to_table(
+        columns=read_columns,
+        filter=_combine_filters(filters=filters + _after_filters(first_date=first_date))
+    )
+
+    price_data, symbol_names = _table_to_columns(table=table)
+
+    if start is not None and lookback > 0:
+
+        short_symbols = _short_on_lookback(
+            columns=price_data,
+            symbol_names=symbol_names,
+            start=start.to_datetime64(),
+            lookback=lookback
+        )
+
+        if short_symbols:
+            earlier = dataset.to_table(
+                columns=read_columns,
+                filter=_combine_filters(
+                    filters=[
+                        ds.field('symbol').isin(short_symbols),
+                        ds.field('year') <= first_date.year,
+                        ds.field('date') < pa.scalar(first_date.to_pydatetime(), type=pa.timestamp('ms'))
+                    ]
+                )
+            )
+            table = pa.concat_tables([table, earlier.cast(table.schema)])
+            price_data, symbol_names = _table_to_columns(table=table)
+
+    if start is not None:
+        price_data = _trim_lookback(columns=price_data, start=start.to_datetime64(), lookback=lookback)
+
+    return price_data, symbol_names
+
+
+def _lookback_span(lookback: int, bar_interval: Union[str, pd.Timedelta]) -> pd.Timedelta:
+    """Estimates how much calendar time `lookback` bars span, with a margin for weekends and holidays.
+
+    Arguments:
+    ----
+    lookback {int} -- The number of bars.
+
+    bar_interval {Union[str, pd.Timedelta]} -- How far apart the bars are.
+
+    Returns:
+    ----
+    {pd.Timedelta} -- The calendar time to start reading early by.
+    """
+
+    if lookback <= 0:
+        return pd.Timedelta(0)
+
+    bar_interval = pd.Timedelta(bar_interval)
+
+    if bar_interval >= pd.Timedelta(days=1):
+        trading_days = lookback * (bar_interval / pd.Timedelta(days=1))
+        margin_days = CALENDAR_MARGIN_DAYS
+    else:
+        trading_days = np.ceil(lookback / max(SESSION_LENGTH // bar_interval, 1))
+        margin_days = INTRADAY_MARGIN_DAYS
+
+    return pd.Timedelta(days=int(np.ceil(trading_days * CALENDAR_DAYS_PER_TRADING_DAY)) + margin_days)
+
+
+def _after_filters(first_date: Optional[pd.Timestamp]) -> List[Any]:
+    """Returns the filters that skip the partitions and rows before `first_date`."""
+
+    if first_date is None:
+        return []
+
+    return [
+        ds.field('year') >= first_date.year,
+        ds.field('date') >= pa.scalar(first_date.to_pydatetime(), type=pa.timestamp('ms'))
+    ]
+
+
+def _combine_filters(filters: List[Any]) -> Any:
+    """Joins the filters with `&`, `None` if there aren't any."""
+
+    row_filter = None
+
+    for condition in filters:
+        row_filter = condition if row_filter is None else row_filter & condition
+
+    return row_filter
+
+
+def _symbol_groups(symbol_codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns where each symbol's rows start and end, for codes grouped by symbol."""
+
+    boundaries = np.flatnonzero(symbol_codes[1:] != symbol_codes[:-1]) + 1
+    starts = np.concatenate([[0], boundaries])
+    ends = np.concatenate([boundaries, [symbol_codes.size]])
+
+    return starts, ends
+
+
+def _short_on_lookback(columns: Dict[str, np.ndarray], symbol_names: List[str], start: np.datetime64,
+                       lookback: int) -> List[str]:
+    """Returns the symbols with fewer than `lookback` rows before `start`.
+
+    Arguments:
+    ----
+    columns {Dict[str, np.ndarray]} -- The columns, grouped by symbol and sorted by date.
+
+    symbol_names {List[str]} -- The names the symbol codes refer to.
+
+    start {np.datetime64} -- The first date requested.
+
+    lookback {int} -- The number of rows wanted before `start`.
+
+    Returns:
+    ----
+    {List[str]} -- The names of the symbols that are short.
+    """
+
+    symbol_codes = columns['symbol']
+    dates = columns['date'].astype('datetime64[ns]')
+
+    if symbol_codes.size == 0:
+        return []
+
+    short_symbols = []
+
+    for group_start, group_end in zip(*_symbol_groups(symbol_codes=symbol_codes)):
+        if np.searchsorted(dates[group_start:group_end], start) < lookback:
+            short_symbols.append(symbol_names[symbol_codes[group_start]])
+
+    return short_symbols
+
+
+def _trim_lookback(columns: Dict[str, np.ndarray], start: np.datetime64, lookback: int) -> Dict[str, np.ndarray]:
+    """Keeps the rows from `start` on, and the last `lookback` rows before it, for each symbol.
+
+    Arguments:
+    ----
+    columns {Dict[str, np.ndarray]} -- The columns, grouped by symbol and sorted by date.
+
+    start {np.datetime64} -- The first date requested.
+
+    lookback {int} -- The number of rows to keep before `start`.
+
+    Returns:
+    ----
+    {Dict[str, np.ndarray]} -- The trimmed columns.
+    """
+
+    symbol_codes = columns['symbol']
+    dates = columns['date'].astype('datetime64[ns]')
+
+    if symbol_codes.size == 0:
+        return columns
+
+    keep = np.zeros(symbol_codes.size, dtype=bool)
+
+    for group_start, group_end in zip(*_symbol_groups(symbol_codes=symbol_codes)):
+        first = group_start + np.searchsorted(dates[group_start:group_end], start)
+        keep[max(first - lookback, group_start):group_end] = True
+
+    if keep.all():
+        return columns
+
+    return {name: values[keep] for name, values in columns.items()}
+
+
+def _table_to_columns(table: Any) -> Tuple[Dict[str, np.ndarray], List[str]]:
+    """Converts an Arrow table to columns, with the rows grouped by symbol and sorted by date.
+
+    Arguments:
+    ----
+    table {pa.Table} -- The table read from the dataset.
+
+    Returns:
+    ----
+    {Tuple[Dict[str, np.ndarray], List[str]]} -- The columns and the symbol names.
+    """
+
+    symbol_values = pd.Categorical(table.column('symbol').to_pandas()).remove_unused_categories()
+    symbol_codes = symbol_values.codes.astype(np.int64)
+    dates = table.column('date').to_numpy()
+
+    order = None
+
+    if symbol_codes.size > 1:
+        order = np.lexsort((dates, symbol_codes))
+
+        if np.array_equal(order, np.arange(order.size)):
+            order = None
+
+    columns = {'symbol': symbol_codes, 'date': dates}
+
+    for name in table.column_names:
+        if name not in columns:
+            columns[name] = table.column(name).to_numpy()
+
+    if order is not None:
+        columns = {name: values[order] for name, values in columns.items()}
+
+    return columns, [str(symbol) for symbol in symbol_values.categories]
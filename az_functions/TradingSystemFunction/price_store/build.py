@@ -0,0 +1,428 @@
+import os
+import struct
+import tempfile
+import numpy as np
+import pandas as pd
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+from typing import BinaryIO
+from typing import Optional
+from urllib.parse import quote
+from urllib.parse import unquote
+
+from azure.storage.blob.aio import ContainerClient as AsyncContainerClient
+
+from ..loaders.build import end_bound
+from ..loaders.build import download_changed_price_blobs
+from ..stock_frame.shared import PREFIX
+from ..stock_frame.shared import block_layout
+from ..stock_frame.shared import unpack_header
+from ..stock_frame.shared import packed_header_size
+
+# The extension of the price file of each symbol.
+FILE_SUFFIX = '.bars'
+
+
+class PriceStore():
+
+    """
+    Represents a folder of memory-mapped price files, one for each symbol,
+    kept in sync with the price history in blob storage.
+    """
+
+    def __init__(self, root_path: str) -> None:
+        """Initalizes the Price Store.
+
+        Overview:
+        ----
+        Each symbol is stored in its own file, in the same layout as a shared
+        price block: a small header with the data type and position of each
+        column and the ETag of the blob it came from, followed by one fixed
+        width array for each column. Opening a symbol maps the file with
+        `np.memmap`, so only the pages of the rows and columns that are used
+        get read from disk. The dates are stored sorted, so a date range is
+        found with a binary search on the `date` column.
+
+        Arguments:
+        ----
+        root_path {str} -- The folder holding the price files, it's created
+            if it doesn't exist.
+
+        Usage:
+        ----
+            >>> price_store = PriceStore(root_path='/home/data/price-store')
+            >>> await price_store.sync(container_client=container_client, symbols=['MSFT', 'AAPL'])
+            >>> stock_frame = StockFrame.from_price_store(
+                root_path='/home/data/price-store',
+                symbols=['MSFT', 'AAPL'],
+                start='2021-01-01'
+            )
+        """
+
+        self.root_path = root_path
+        os.makedirs(root_path, exist_ok=True)
+
+    def path(self, symbol: str) -> str:
+        """Returns the path of a symbol's price file."""
+
+        return os.path.join(self.root_path, quote(symbol, safe='') + FILE_SUFFIX)
+
+    @property
+    def symbols(self) -> List[str]:
+        """Returns the symbols in the store.
+
+        Returns:
+        ----
+        {List[str]} -- The symbols, sorted.
+        """
+
+        return sorted(
+            unquote(file_name[:-len(FILE_SUFFIX)])
+            for file_name in os.listdir(self.root_path) if file_name.endswith(FILE_SUFFIX)
+        )
+
+    @staticmethod
+    def _read_header(price_file: BinaryIO) -> Optional[Tuple[dict, int]]:
+        """Reads the header from the start of an open price file, `None` if it isn't one."""
+
+        prefix = price_file.read(PREFIX.size)
+
+        if len(prefix) < PREFIX.size:
+            return None
+
+        try:
+            prefix += price_file.read(packed_header_size(prefix=prefix) - PREFIX.size)
+            return unpack_header(buffer=prefix)
+        except (ValueError, struct.error):
+            return None
+
+    def header(self, symbol: str) -> Optional[Tuple[dict, int]]:
+        """Reads the header of a symbol's price file.
+
+        Arguments:
+        ----
+        symbol {str} -- The symbol.
+
+        Returns:
+        ----
+        {Optional[Tuple[dict, int]]} -- The header and the position of the first
+            array, or `None` if the symbol isn't in the store.
+        """
+
+        # A missing or unreadable file is synced again.
+        try:
+            with open(self.path(symbol=symbol), 'rb') as price_file:
+                return self._read_header(price_file=price_file)
+        except FileNotFoundError:
+            return None
+
+    def etag(self, symbol: str) -> Optional[str]:
+        """Returns the ETag of the blob a symbol was synced from, `None` if it isn't in the store."""
+
+        header = self.header(symbol=symbol)
+
+        return header[0]['metadata'].get('etag', None) if header else None
+
+    def write(self, symbol: str, columns: Dict[str, Union[np.ndarray, list]], etag: str = None) -> str:
+        """Writes the price history of a symbol, replacing the old file.
+
+        Overview:
+        ----
+        Only the `date` and the numeric columns are stored, text fields like
+        `label` are left out. The rows are sorted by date. The file is written
+        next to the old one and then moved over it, so a reader never sees a
+        half written file.
+
+        Arguments:
+        ----
+        symbol {str} -- The symbol.
+
+        columns {Dict[str, Union[np.ndarray, list]]} -- The price columns, like the ones
+            returned by `read_price_blob`. Must include `date`.
+
+        Keyword Arguments:
+        ----
+        etag {str} -- The ETag of the blob the columns came from. (default: {None})
+
+        Returns:
+        ----
+        {str} -- The path of the file.
+        """
+
+        dates = pd.DatetimeIndex(pd.to_datetime(np.asarray(columns['date']))).values.astype('datetime64[ns]')
+
+        arrays = {'date': dates}
+        arrays.update({
+            name: values for name, values in columns.items()
+            if name not in ('symbol', 'date') and isinstance(values, np.ndarray) and values.dtype.kind in 'biuf'
+        })
+
+        if dates.size > 1 and np.any(dates[1:] < dates[:-1]):
+            order = np.argsort(dates, kind='stable')
+            arrays = {name: values[order] for name, values in arrays.items()}
+
+        header_bytes, header, data_start, size = block_layout(
+            dtypes={name: values.dtype for name, values in arrays.items()},
+            offsets=np.array([0, dates.size]),
+            symbols=[symbol],
+            metadata={'etag': etag}
+        )
+
+        path = self.path(symbol=symbol)
+
+        # Every writer gets its own temporary file, the store can be shared by several instances.
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.root_path, suffix='.tmp')
+
+        try:
+            with os.fdopen(file_descriptor, 'wb') as price_file:
+
+                price_file.write(header_bytes)
+
+                for name, layout in header['columns'].items():
+                    price_file.seek(data_start + layout['offset'])
+                    price_file.write(np.ascontiguousarray(arrays[name]).tobytes())
+
+                price_file.truncate(size)
+
+            os.replace(temporary_path, path)
+
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+        return path
+
+    def open(self, symbol: str, columns: List[str] = None) -> Dict[str, np.ndarray]:
+        """Maps a symbol's price file, without reading it.
+
+        Arguments:
+        ----
+        symbol {str} -- The symbol.
+
+        Keyword Arguments:
+        ----
+        columns {List[str]} -- The columns to map, `date` is always included.
+            `None` maps all of them. (default: {None})
+
+        Raises:
+        ----
+        KeyError: If the symbol isn't in the store.
+
+        Returns:
+        ----
+        {Dict[str, np.ndarray]} -- The read only `np.memmap` of each column.
+        """
+
+        missing = 'The symbol `{symbol}` is not in the price store.'.format(symbol=symbol)
+
+        try:
+            price_file = open(self.path(symbol=symbol), 'rb')
+        except FileNotFoundError:
+            raise KeyError(missing) from None
+
+        # The header and the maps come from the same open file, so a `write` that
+        # replaces the file in between can't pair the old header with the new data.
+        with price_file:
+
+            header = self._read_header(price_file=price_file)
+
+            if header is None:
+                raise KeyError(missing)
+
+            header, data_start = header
+            layouts = header['columns']
+
+            if columns is not None:
+                layouts = {name: layout for name, layout in layouts.items() if name == 'date' or name in columns}
+
+            # A memory map can't be empty.
+            if header['rows'] == 0:
+                return {name: np.empty(0, dtype=np.dtype(layout['dtype'])) for name, layout in layouts.items()}
+
+            return {
+                name: np.memmap(
+                    price_file,
+                    dtype=np.dtype(layout['dtype']),
+                    mode='r',
+                    offset=data_start + layout['offset'],
+                    shape=(header['rows'],)
+                )
+                for name, layout in layouts.items()
+            }
+
+    def read(self, symbols: List[str] = None, columns: List[str] = None,
+             start: Union[str, pd.Timestamp] = None, end: Union[str, pd.Timestamp] = None,
+             lookback: Optional[int] = 0) -> Tuple[Dict[str, np.ndarray], List[str]]:
+        """Reads the price history of several symbols into columns.
+
+        Overview:
+        ----
+        Each file is mapped, the rows in the date range are found with a
+        binary search on the dates, and only those rows of the requested
+        columns are copied out. `lookback` bars before `start` are kept as
+        well, so the indicators have the history they need to warm up.
+
+        Keyword Arguments:
+        ----
+        symbols {List[str]} -- The symbols to read, `None` reads all of them. (default: {None})
+
+        columns {List[str]} -- The price columns to read, `None` reads all of
+            them. (default: {None})
+
+        start {Union[str, pd.Timestamp]} -- The first date to read. (default: {None})
+
+        end {Union[str, pd.Timestamp]} -- The last date to read, a date without a time
+            reads the whole day. (default: {None})
+
+        lookback {Optional[int]} -- The number of bars before `start` to read as
+            well, `None` reads all of them. (default: {0})
+
+        Returns:
+        ----
+        {Tuple[Dict[str, np.ndarray], List[str]]} -- The columns, with the `symbol` column
+            holding the position of each symbol in the list of symbols returned.
+        """
+
+        symbols = self.symbols if symbols is None else list(symbols)
+
+        start = pd.Timestamp(start).to_datetime64() if start is not None else None
+        end = end_bound(end=end)
+
+        pieces = []
+
+        for symbol in symbols:
+
+            arrays = self.open(symbol=symbol, columns=columns)
+            dates = arrays['date']
+
+            first = 0 if start is None else int(np.searchsorted(dates, start))
+            last = dates.size if end is None else int(np.searchsorted(dates, end, side='left'))
+
+            if lookback is None:
+                first = 0
+            else:
+                first = max(first - lookback, 0)
+
+            pieces.append({name: np.array(values[first:last]) for name, values in arrays.items()})
+
+        names = []
+        for piece in pieces:
+            names += [name for name in piece if name not in names]
+
+        counts = [piece['date'].size for piece in pieces]
+
+        price_data = {'symbol': np.repeat(np.arange(len(pieces)), counts)}
+
+        for name in names:
+            price_data[name] = np.concatenate([
+                piece[name] if name in piece else np.full(count, np.nan)
+                for piece, count in zip(pieces, counts)
+            ]) if pieces else np.empty(0)
+
+        return price_data, symbols
+
+    async def sync(self, container_client: AsyncContainerClient, symbols: List[str],
+                   blob_name: str = 'iex-price-history/{symbol}.json', max_downloads: int = 16) -> Dict[str, str]:
+        """Downloads the price history that changed since the last sync into the store.
+
+        Overview:
+        ----
+        Each blob is downloaded with the ETag kept in the symbol's file, so the
+        symbols that didn't change cost a `304 Not Modified` and nothing else.
+        The changed ones are parsed once and written to the store.
+
+        Arguments:
+        ----
+        container_client {AsyncContainerClient} -- The async container client holding
+            the price history.
+
+        symbols {List[str]} -- The symbols to sync.
+
+        Keyword Arguments:
+        ----
+        blob_name {str} -- The blob name of a symbol, where `{symbol}` is
+            replaced by the symbol. (default: {'iex-price-history/{symbol}.json'})
+
+        max_downloads {int} -- The most downloads to run at once. (default: {16})
+
+        Returns:
+        ----
+        {Dict[str, str]} -- The ETag of each symbol's blob.
+        """
+
+        downloads = await download_changed_price_blobs(
+            container_client=container_client,
+            symbols=symbols,
+            etags={symbol: self.etag(symbol=symbol) for symbol in symbols},
+            blob_name=blob_name,
+            max_downloads=max_downloads
+        )
+
+        for symbol, (columns, etag) in downloads.items():
+            if columns is not None:
+                self.write(symbol=symbol, columns=columns, etag=etag)
+
+        return {symbol: etag for symbol, (columns, etag) in downloads.items()}
+
+    async def load_changed(self, container_client: AsyncContainerClient, symbols: List[str],
+                           etags: Dict[str, str] = None, blob_name: str = 'iex-price-history/{symbol}.json',
+                           max_downloads: int = 16,
+                           reader_options: dict = None) -> Dict[str, Tuple[Optional[Dict[str, np.ndarray]], str]]:
+        """Syncs the store, then reads the symbols that changed since `etags`.
+
+        Overview:
+        ----
+        Works like `download_changed_price_blobs`, but the blobs are only
+        downloaded when they changed since the last sync, and the columns are
+        read from the store.
+
+        Arguments:
+        ----
+        container_client {AsyncContainerClient} -- The async container client holding
+            the price history.
+
+        symbols {List[str]} -- The symbols to load.
+
+        Keyword Arguments:
+        ----
+        etags {Dict[str, str]} -- The ETag the caller already has for each symbol,
+            these symbols are only read if they changed. (default: {None})
+
+        blob_name {str} -- The blob name of a symbol, where `{symbol}` is
+            replaced by the symbol. (default: {'iex-price-history/{symbol}.json'})
+
+        max_downloads {int} -- The most downloads to run at once. (default: {16})
+
+        reader_options {dict} -- The `columns`, `start`, `end` and `lookback`
+            to read. (default: {None})
+
+        Returns:
+        ----
+        {Dict[str, Tuple[Optional[Dict[str, np.ndarray]], str]]} -- The columns and ETag of
+            each symbol, the columns are `None` when the symbol didn't change.
+        """
+
+        etags = etags or {}
+        current = await self.sync(
+            container_client=container_client,
+            symbols=symbols,
+            blob_name=blob_name,
+            max_downloads=max_downloads
+        )
+
+        results = {}
+
+        for symbol in symbols:
+
+            if etags.get(symbol, None) is not None and etags[symbol] == current[symbol]:
+                results[symbol] = (None, current[symbol])
+                continue
+
+            price_data, _ = self.read(symbols=[symbol], **(reader_options or {}))
+            results[symbol] = (price_data, current[symbol])
+
+        return results
@@ -0,0 +1,224 @@
+import json
+import numpy as np
+import pandas as pd
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+# The response formats and the content type each one is sent with.
+FORMATS: Dict[str, str] = {
+    'json': 'application/json',
+    'columns': 'application/json',
+    'arrow': 'application/vnd.apache.arrow.stream',
+    'parquet': 'application/vnd.apache.parquet'
+}
+
+# The content types a caller can ask for in the `Accept` header.
+CONTENT_TYPES: Dict[str, str] = {
+    'application/json': 'json',
+    'application/vnd.apache.arrow.stream': 'arrow',
+    'application/vnd.apache.parquet': 'parquet',
+    'application/x-parquet': 'parquet'
+}
+
+# The formats that need `pyarrow`.
+ARROW_FORMATS = ('arrow', 'parquet')
+
+
+class NotAcceptableError(ValueError):
+
+    """Raised when none of the requested formats can be served."""
+
+
+def available_formats() -> List[str]:
+    """Returns the formats that can be served with the installed packages.
+
+    Returns:
+    ----
+    {List[str]} -- The format names.
+    """
+
+    return [name for name in FORMATS if pa is not None or name not in ARROW_FORMATS]
+
+
+def negotiate_format(accept: str = None, requested: str = None) -> str:
+    """Picks the response format from the `format` parameter or the `Accept` header.
+
+    Overview:
+    ----
+    An explicit `format` parameter wins. Otherwise the content types in the
+    `Accept` header are tried from the highest quality down, and the first
+    one we can serve is used. Without either, the response is JSON.
+
+    Arguments:
+    ----
+    accept {str} -- The `Accept` header of the request. (default: {None})
+
+    requested {str} -- The `format` parameter of the request. (default: {None})
+
+    Raises:
+    ----
+    NotAcceptableError: If the format can't be served.
+
+    Returns:
+    ----
+    {str} -- The format name, one of the keys of `FORMATS`.
+    """
+
+    formats = available_formats()
+
+    if requested:
+
+        requested = requested.strip().lower()
+
+        if requested not in formats:
+            raise NotAcceptableError(
+                "The format `{requested}` isn't available, use one of {formats}.".format(
+                    requested=requested,
+                    formats=formats
+                )
+            )
+
+        return requested
+
+    if not accept:
+        return 'json'
+
+    accepted = []
+
+    for position, part in enumerate(accept.split(',')):
+
+        pieces = [piece.strip() for piece in part.split(';')]
+        quality = 1.0
+
+        for parameter in pieces[1:]:
+            if parameter.startswith('q='):
+                try:
+                    quality = float(parameter[2:])
+                except ValueError:
+                    quality = 0.0
+
+        if quality > 0:
+            accepted.append((-quality, position, pieces[0].lower()))
+
+    for _, _, content_type in sorted(accepted):
+
+        if content_type in ('*/*', 'application/*'):
+            return 'json'
+
+        if CONTENT_TYPES.get(content_type, None) in formats:
+            return CONTENT_TYPES[content_type]
+
+    raise NotAcceptableError(
+        "None of `{accept}` can be served, use one of {content_types}.".format(
+            accept=accept,
+            content_types=[content_type for content_type, name in CONTENT_TYPES.items() if name in formats]
+        )
+    )
+
+
+def serialize_frame(frame: pd.DataFrame, output_format: str = 'json') -> Tuple[bytes, str]:
+    """Serializes a data frame in the requested format.
+
+    Overview:
+    ----
+    The index is written out as regular columns. The `json` format is an
+    array of records, written by `pandas` without building a dictionary
+    for each row. The `columns` format is a single object holding one
+    array per column, which is a lot smaller for long histories. `arrow`
+    is an Arrow IPC stream and `parquet` a Parquet file, both of them need
+    `pyarrow`. Missing values are sent as `null` in the JSON formats.
+
+    Arguments:
+    ----
+    frame {pd.DataFrame} -- The data frame to serialize.
+
+    Keyword Arguments:
+    ----
+    output_format {str} -- The format, one of the keys of `FORMATS`. (default: {'json'})
+
+    Raises:
+    ----
+    NotAcceptableError: If the format can't be served.
+
+    Returns:
+    ----
+    {Tuple[bytes, str]} -- The body and its content type.
+    """
+
+    if output_format not in available_formats():
+        raise NotAcceptableError(
+            "The format `{output_format}` isn't available.".format(output_format=output_format)
+        )
+
+    frame = frame.reset_index() if _has_named_index(frame=frame) else frame
+
+    if output_format == 'json':
+        body = frame.to_json(orient='records', date_format='iso', date_unit='s').encode('utf-8')
+
+    elif output_format == 'columns':
+        body = json.dumps(
+            obj={name: _column_to_list(values=frame[name]) for name in frame.columns},
+            separators=(',', ':'),
+            allow_nan=False
+        ).encode('utf-8')
+
+    elif output_format == 'arrow':
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        sink = pa.BufferOutputStream()
+
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+
+        body = sink.getvalue().to_pybytes()
+
+    else:
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        pq.write_table(table, sink)
+
+        body = sink.getvalue().to_pybytes()
+
+    return body, FORMATS[output_format]
+
+
+def _has_named_index(frame: pd.DataFrame) -> bool:
+    """Checks whether the index holds data, like the `symbol` and `date` levels."""
+
+    return any(name is not None for name in frame.index.names)
+
+
+def _column_to_list(values: pd.Series) -> list:
+    """Converts a column to a list that can be written as JSON, with `None` for missing and infinite values."""
+
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        strings = np.datetime_as_string(values.to_numpy(dtype='datetime64[s]'), unit='s').astype(object)
+        strings[values.isna().to_numpy()] = None
+        return strings.tolist()
+
+    if pd.api.types.is_float_dtype(values.dtype):
+        array = values.to_numpy()
+        missing = ~np.isfinite(array)
+
+        if missing.any():
+            array = array.astype(object)
+            array[missing] = None
+
+        return array.tolist()
+
+    if pd.api.types.is_integer_dtype(values.dtype) or pd.api.types.is_bool_dtype(values.dtype):
+        return values.to_numpy().tolist()
+
+    return [
+        None if pd.isna(value) or (isinstance(value, float) and not np.isfinite(value)) else value
+        for value in values.tolist()
+    ]
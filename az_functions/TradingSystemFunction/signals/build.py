@@ -0,0 +1,274 @@
+import operator
+import numpy as np
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+
+# Maps the `operator` functions and their string forms to `numpy` ufuncs.
+OPERATORS: Dict[Any, np.ufunc] = {
+    operator.gt: np.greater,
+    operator.ge: np.greater_equal,
+    operator.lt: np.less,
+    operator.le: np.less_equal,
+    operator.eq: np.equal,
+    operator.ne: np.not_equal,
+    '>': np.greater,
+    '>=': np.greater_equal,
+    '<': np.less,
+    '<=': np.less_equal,
+    '==': np.equal,
+    '!=': np.not_equal
+}
+
+# The signal codes returned by `SignalEvaluator.signals`.
+BUY = 1
+SELL = -1
+HOLD = 0
+
+
+class SignalEvaluator():
+
+    """
+    Represents the indicator signals compiled into a set of array comparisons,
+    so the signals for every symbol are checked at once.
+    """
+
+    def __init__(self, indicators: dict, indicators_key: List[str], indicators_comp_key: List[str],
+                 combine: str = 'all') -> None:
+        """Initalizes the Signal Evaluator.
+
+        Overview:
+        ----
+        Each signal set with `Indicators.set_indicator_signal` or
+        `Indicators.set_indicator_signal_compare` becomes a rule, a column
+        compared to either a threshold or another column. The rules are
+        grouped by operator so checking them is one broadcast comparison
+        per operator over a matrix holding the last value of each column
+        for each symbol. The `buy_max` and `sell_max` bounds become rules of
+        their own that are always required.
+
+        Arguments:
+        ----
+        indicators {dict} -- A dictionary containing all the indicators to be checked
+            along with their buy and sell criteria.
+
+        indicators_key {List[str]} -- A list of the indicators where we are comparing
+            one indicator to a numerical value.
+
+        indicators_comp_key {List[str]} -- A list of the indicators where we are comparing
+            one indicator to another indicator.
+
+        Keyword Arguments:
+        ----
+        combine {str} -- How the rules are combined, `all` means every rule must be
+            met and `any` means a single rule is enough. (default: {'all'})
+
+        Usage:
+        ----
+            >>> evaluator = SignalEvaluator(
+                indicators=indicator_client.get_indicator_signal(),
+                indicators_key=['rsi'],
+                indicators_comp_key=[]
+            )
+            >>> evaluator.signals(values=stock_frame.last_values(columns=evaluator.columns))
+        """
+
+        if combine not in ('all', 'any'):
+            raise ValueError("The combine argument must be either `all` or `any`.")
+
+        self.combine = combine
+        self.columns: List[str] = []
+
+        self._buy_rules: List[Tuple] = []
+        self._sell_rules: List[Tuple] = []
+        self._buy_bounds: List[Tuple] = []
+        self._sell_bounds: List[Tuple] = []
+
+        for indicator in indicators_key:
+
+            signal = indicators[indicator]
+            column = self._column_position(column=indicator)
+
+            self._buy_rules.append((signal['buy_operator'], column, signal['buy'], False))
+            self._sell_rules.append((signal['sell_operator'], column, signal['sell'], False))
+
+            # A bound without an operator means the value can't exceed it.
+            if signal.get('buy_max', None) is not None:
+                self._buy_bounds.append(
+                    (signal.get('buy_operator_max', None) or operator.le, column, signal['buy_max'], False)
+                )
+
+            if signal.get('sell_max', None) is not None:
+                self._sell_bounds.append(
+                    (signal.get('sell_operator_max', None) or operator.le, column, signal['sell_max'], False)
+                )
+
+        for indicator in indicators_comp_key:
+
+            signal = indicators[indicator]
+            parts = indicator.split('_comp_')
+
+            column_1 = self._column_position(column=signal.get('indicator_1', parts[0]))
+            column_2 = self._column_position(column=signal.get('indicator_2', parts[1]))
+
+            if signal['buy_operator']:
+                self._buy_rules.append((signal['buy_operator'], column_1, column_2, True))
+
+            if signal['sell_operator']:
+                self._sell_rules.append((signal['sell_operator'], column_1, column_2, True))
+
+        self._buy_plan = self._compile(rules=self._buy_rules)
+        self._sell_plan = self._compile(rules=self._sell_rules)
+        self._buy_bound_plan = self._compile(rules=self._buy_bounds)
+        self._sell_bound_plan = self._compile(rules=self._sell_bounds)
+
+    def _column_position(self, column: str) -> int:
+        """Returns the position of a column in the value matrix, adding it if needed.
+
+        Arguments:
+        ----
+        column {str} -- The indicator column.
+
+        Returns:
+        ----
+        {int} -- The position of the column.
+        """
+
+        if column not in self.columns:
+            self.columns.append(column)
+
+        return self.columns.index(column)
+
+    @staticmethod
+    def _compile(rules: List[Tuple]) -> List[Tuple]:
+        """Groups the rules by operator and by what they are compared to.
+
+        Arguments:
+        ----
+        rules {List[Tuple]} -- The rules, as `(operator, column, target, is_column)` tuples.
+
+        Returns:
+        ----
+        {List[Tuple]} -- One `(ufunc, columns, targets, is_column)` tuple for each group.
+        """
+
+        groups: Dict[Tuple, Tuple[List[int], List]] = {}
+
+        for condition, column, target, is_column in rules:
+
+            # Any other callable is applied to the arrays as is.
+            ufunc = OPERATORS.get(condition, condition)
+
+            columns, targets = groups.setdefault((ufunc, is_column), ([], []))
+            columns.append(column)
+            targets.append(target)
+
+        return [
+            (
+                ufunc,
+                np.array(columns, dtype=np.intp),
+                np.array(targets, dtype=np.intp if is_column else np.float64),
+                is_column
+            )
+            for (ufunc, is_column), (columns, targets) in groups.items()
+        ]
+
+    @staticmethod
+    def _apply(plan: List[Tuple], values: np.ndarray) -> np.ndarray:
+        """Runs the compiled rules over the value matrix.
+
+        Arguments:
+        ----
+        plan {List[Tuple]} -- The compiled rules.
+
+        values {np.ndarray} -- A `(symbols, columns)` matrix with the last value of each column.
+
+        Returns:
+        ----
+        {np.ndarray} -- A `(symbols, rules)` boolean matrix.
+        """
+
+        if not plan:
+            return np.zeros((values.shape[0], 0), dtype=bool)
+
+        results = []
+
+        with np.errstate(invalid='ignore'):
+            for ufunc, columns, targets, is_column in plan:
+
+                right = values[:, targets] if is_column else targets
+                results.append(np.asarray(ufunc(values[:, columns], right), dtype=bool))
+
+        return np.concatenate(results, axis=1)
+
+    def _combine(self, rules: np.ndarray, bounds: np.ndarray) -> np.ndarray:
+        """Combines the rule results for each symbol.
+
+        Arguments:
+        ----
+        rules {np.ndarray} -- The `(symbols, rules)` results of the signal rules.
+
+        bounds {np.ndarray} -- The `(symbols, bounds)` results of the max bounds.
+
+        Returns:
+        ----
+        {np.ndarray} -- A boolean array with one value for each symbol.
+        """
+
+        if rules.shape[1] == 0:
+            return np.zeros(rules.shape[0], dtype=bool)
+
+        if self.combine == 'all':
+            met = rules.all(axis=1)
+        else:
+            met = rules.any(axis=1)
+
+        return met & bounds.all(axis=1)
+
+    def evaluate(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Checks the buy and sell rules for every symbol.
+
+        Arguments:
+        ----
+        values {np.ndarray} -- A `(symbols, columns)` matrix with the last value of
+            each column in `columns`, for each symbol.
+
+        Returns:
+        ----
+        {Tuple[np.ndarray, np.ndarray]} -- The boolean buy and sell arrays, with one
+            value for each symbol.
+        """
+
+        values = np.asarray(values, dtype=np.float64).reshape(-1, len(self.columns))
+
+        buys = self._combine(
+            rules=self._apply(plan=self._buy_plan, values=values),
+            bounds=self._apply(plan=self._buy_bound_plan, values=values)
+        )
+        sells = self._combine(
+            rules=self._apply(plan=self._sell_plan, values=values),
+            bounds=self._apply(plan=self._sell_bound_plan, values=values)
+        )
+
+        return buys, sells
+
+    def signals(self, values: np.ndarray) -> np.ndarray:
+        """Returns a single signal for each symbol.
+
+        Arguments:
+        ----
+        values {np.ndarray} -- A `(symbols, columns)` matrix with the last value of
+            each column in `columns`, for each symbol.
+
+        Returns:
+        ----
+        {np.ndarray} -- An `int8` array holding `BUY`, `SELL` or `HOLD` for each symbol,
+            a symbol with both a buy and a sell signal is held.
+        """
+
+        buys, sells = self.evaluate(values=values)
+
+        return (buys & ~sells).astype(np.int8) * BUY + (sells & ~buys).astype(np.int8) * SELL
@@ -0,0 +1,146 @@
+import numpy as np
+
+from typing import Dict
+
+
+class BarBuffer():
+
+    """
+    Represents the bars added to a single symbol that haven't been
+    merged into the StockFrame yet.
+    """
+
+    def __init__(self, dtypes: Dict[str, np.dtype], capacity: int = 64) -> None:
+        """Initalizes the Bar Buffer.
+
+        Overview:
+        ----
+        Each column is stored in a preallocated `numpy` array. When the
+        arrays are full their capacity is doubled, so adding a bar is
+        amortized constant time. Clearing the buffer keeps the arrays
+        around for the next bars.
+
+        Arguments:
+        ----
+        dtypes {Dict[str, np.dtype]} -- The data type of each column, normally
+            the data types of the columns already in the frame.
+
+        Keyword Arguments:
+        ----
+        capacity {int} -- The number of bars to make room for. (default: {64})
+        """
+
+        self.size = 0
+        self.dates = np.empty(capacity, dtype='datetime64[ns]')
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.empty(capacity, dtype=dtype) for name, dtype in dtypes.items()
+        }
+
+    @property
+    def capacity(self) -> int:
+        """The number of bars the buffer can hold before growing.
+
+        Returns:
+        ----
+        {int} -- The capacity of the buffer.
+        """
+
+        return self.dates.size
+
+    def append(self, date: np.datetime64, values: Dict[str, object]) -> None:
+        """Adds a bar to the buffer.
+
+        Arguments:
+        ----
+        date {np.datetime64} -- The date of the bar.
+
+        values {Dict[str, object]} -- The values of the bar, columns that are
+            missing are filled with `NaN`.
+        """
+
+        if self.size == self.capacity:
+            self._grow()
+
+        for name, value in values.items():
+            if name not in self.columns:
+                self._add_column(name=name, value=value)
+
+        self.dates[self.size] = date
+
+        for name, column in self.columns.items():
+
+            value = values.get(name, None)
+
+            if column.dtype.kind in 'iu' and not _is_integer(value=value):
+                column = self._upcast(name=name)
+
+            if value is None and column.dtype.kind == 'f':
+                value = np.nan
+
+            column[self.size] = value
+
+        self.size += 1
+
+    def clear(self) -> None:
+        """Empties the buffer but keeps its capacity."""
+
+        self.size = 0
+
+    def _grow(self) -> None:
+        """Doubles the capacity of the buffer."""
+
+        capacity = max(self.capacity * 2, 1)
+
+        self.dates = _resize(values=self.dates, size=self.size, capacity=capacity)
+        self.columns = {
+            name: _resize(values=column, size=self.size, capacity=capacity)
+            for name, column in self.columns.items()
+        }
+
+    def _add_column(self, name: str, value: object) -> None:
+        """Adds a column that showed up in a new bar.
+
+        Arguments:
+        ----
+        name {str} -- The name of the column.
+
+        value {object} -- The first value, used to pick the data type.
+        """
+
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            column = np.full(self.capacity, np.nan)
+        else:
+            column = np.full(self.capacity, None, dtype=object)
+
+        self.columns[name] = column
+
+    def _upcast(self, name: str) -> np.ndarray:
+        """Converts an integer column to a float column so it can hold `NaN` or fractions.
+
+        Arguments:
+        ----
+        name {str} -- The name of the column.
+
+        Returns:
+        ----
+        {np.ndarray} -- The new column.
+        """
+
+        self.columns[name] = self.columns[name].astype(np.float64)
+
+        return self.columns[name]
+
+
+def _is_integer(value: object) -> bool:
+    """Checks whether a value can be stored in an integer column."""
+
+    return isinstance(value, (int, np.integer)) and not isinstance(value, bool)
+
+
+def _resize(values: np.ndarray, size: int, capacity: int) -> np.ndarray:
+    """Copies the first `size` values into a new array with room for `capacity` values."""
+
+    resized = np.empty(capacity, dtype=values.dtype)
+    resized[:size] = values[:size]
+
+    return resized
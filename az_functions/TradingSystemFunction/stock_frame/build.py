@@ -1,29 +1,366 @@
+import numpy as np
 import pandas as pd
 
+from typing import Any
 from typing import List
 from typing import Dict
 from typing import Union
+from typing import Optional
+from typing import Sequence
 
 from pandas.core.groupby import DataFrameGroupBy
 from pandas.core.window import RollingGroupby
 
+from .buffers import BarBuffer
+from .shared import SharedPriceBlock
+from .grouping import SymbolGrouping
+from ..signals.build import SignalEvaluator
+from ..loaders.parquet import read_price_dataset
+from ..price_store.build import PriceStore
+
 
 class StockFrame():
 
-    def __init__(self, data: List[Dict]) -> None:
+    def __init__(self, data: Union[List[Dict], Dict[str, List]]) -> None:
         """Initalizes the Stock Data Frame Object.
 
         Arguments:
         ----
-        data {List[Dict]} -- The data to convert to a frame. Normally, this is 
-            returned from the historical prices endpoint.
+        data {Union[List[Dict], Dict[str, List]]} -- The data to convert to a frame. Normally, this is 
+            returned from the historical prices endpoint, either as a list of records or as
+            a dictionary of columns.
         """
 
         self._data = data
-        self._frame: pd.DataFrame = self.create_frame()
+        self._buffers: Dict[str, BarBuffer] = {}
+        self._pending_rows = 0
+        self._set_frame(price_df=self.create_frame())
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Union[np.ndarray, Sequence]], symbol_names: List[str] = None,
+                     date_unit: str = 'ns') -> 'StockFrame':
+        """Creates a StockFrame straight from column arrays.
+
+        Overview:
+        ----
+        Building the frame from a list of records means creating a Python object
+        for every value, parsing the dates and then copying the frame again when
+        the index is set. This constructor takes typed arrays instead and builds
+        the `(symbol, date)` MultiIndex once from integer codes.
+
+        Arguments:
+        ----
+        columns {Dict[str, Union[np.ndarray, Sequence]]} -- The columns of the frame, must
+            include a `symbol` and a `date` column. The `symbol` column can either be the
+            symbols themselves or integer codes into `symbol_names`. The `date` column can
+            either be `datetime64` values, integer epochs or date strings.
+
+        Keyword Arguments:
+        ----
+        symbol_names {List[str]} -- The symbols the `symbol` codes refer to, only
+            needed when the `symbol` column holds codes. (default: {None})
+
+        date_unit {str} -- The unit of integer epoch dates. (default: {'ns'})
+
+        Returns:
+        ----
+        {StockFrame} -- A new StockFrame object.
+
+        Usage:
+        ----
+            >>> stock_frame = StockFrame.from_columns(
+                columns={
+                    'symbol': np.array([0, 0, 1, 1]),
+                    'date': np.array([1609718400, 1609804800, 1609718400, 1609804800]),
+                    'close': np.array([217.69, 217.90, 131.01, 131.17]),
+                    'volume': np.array([37130100, 23823000, 143301900, 97664900])
+                },
+                symbol_names=['MSFT', 'AAPL'],
+                date_unit='s'
+            )
+        """
+
+        columns = dict(columns)
+        symbols = columns.pop('symbol')
+        dates = columns.pop('date')
+
+        # Grab the codes and the names for the symbols.
+        if symbol_names is None:
+            symbol_codes, symbol_level = pd.factorize(np.asarray(symbols), sort=True)
+        else:
+            symbol_codes, symbol_level = cls._sort_symbol_codes(
+                symbol_codes=np.asarray(symbols),
+                symbol_names=symbol_names
+            )
+
+        dates = cls._parse_date_array(dates=dates, date_unit=date_unit)
+
+        # Keep the rows for each symbol next to each other.
+        if symbol_codes.size and np.any(symbol_codes[1:] < symbol_codes[:-1]):
+            order = np.argsort(symbol_codes, kind='stable')
+            symbol_codes = symbol_codes[order]
+            dates = dates[order]
+            columns = {name: np.asarray(values)[order] for name, values in columns.items()}
+
+        index = cls._build_index(
+            symbol_codes=symbol_codes,
+            symbol_level=symbol_level,
+            dates=dates
+        )
+
+        stock_frame = cls.__new__(cls)
+        stock_frame._data = None
+        stock_frame._buffers = {}
+        stock_frame._pending_rows = 0
+        stock_frame._set_frame(
+            price_df=pd.DataFrame(data=columns, index=index)
+        )
+
+        return stock_frame
+
+    @classmethod
+    def from_parquet(cls, root_path: str, symbols: List[str] = None, columns: List[str] = None,
+                     start: Union[str, pd.Timestamp] = None, end: Union[str, pd.Timestamp] = None,
+                     lookback: Optional[int] = 0, bar_interval: Union[str, pd.Timedelta] = '1D',
+                     filesystem: Any = None) -> 'StockFrame':
+        """Creates a StockFrame from a Parquet price dataset partitioned by symbol and year.
+
+        Arguments:
+        ----
+        root_path {str} -- The folder the dataset was written to with `write_price_dataset`.
+
+        Keyword Arguments:
+        ----
+        symbols {List[str]} -- The symbols to load, `None` loads all of them. (default: {None})
+
+        columns {List[str]} -- The price columns to load, `None` loads all of
+            them. (default: {None})
+
+        start {Union[str, pd.Timestamp]} -- The first date to load. (default: {None})
+
+        end {Union[str, pd.Timestamp]} -- The last date to load. (default: {None})
+
+        lookback {Optional[int]} -- The number of bars before `start` to load as well,
+            see `kernels.lookback_bars`. `None` loads all of them. (default: {0})
+
+        bar_interval {Union[str, pd.Timedelta]} -- How far apart the bars are, like
+            `'1D'` or `'1min'`, used to size the `lookback` window. (default: {'1D'})
+
+        filesystem {Any} -- A `pyarrow` or `fsspec` filesystem, `None` means
+            the local disk. (default: {None})
+
+        Returns:
+        ----
+        {StockFrame} -- A new StockFrame object.
+
+        Usage:
+        ----
+            >>> stock_frame = StockFrame.from_parquet(
+                root_path='price-history/iex-price-parquet',
+                symbols=['MSFT', 'AAPL'],
+                columns=['open', 'high', 'low', 'close', 'volume'],
+                start='2021-06-01',
+                lookback=lookback_bars(indicators=[{'indicator': 'sma', 'period': 100}])
+            )
+        """
+
+        price_data, symbol_names = read_price_dataset(
+            root_path=root_path,
+            symbols=symbols,
+            columns=columns,
+            start=start,
+            end=end,
+            lookback=lookback,
+            bar_interval=bar_interval,
+            filesystem=filesystem
+        )
+
+        return cls.from_columns(columns=price_data, symbol_names=symbol_names)
+
+    @classmethod
+    def from_price_store(cls, root_path: str, symbols: List[str] = None, columns: List[str] = None,
+                         start: Union[str, pd.Timestamp] = None, end: Union[str, pd.Timestamp] = None,
+                         lookback: Optional[int] = 0) -> 'StockFrame':
+        """Creates a StockFrame from the memory-mapped files of a local `PriceStore`.
+
+        Arguments:
+        ----
+        root_path {str} -- The folder of the price store.
+
+        Keyword Arguments:
+        ----
+        symbols {List[str]} -- The symbols to load, `None` loads all of them. (default: {None})
+
+        columns {List[str]} -- The price columns to load, `None` loads all of
+            them. (default: {None})
+
+        start {Union[str, pd.Timestamp]} -- The first date to load. (default: {None})
+
+        end {Union[str, pd.Timestamp]} -- The last date to load. (default: {None})
+
+        lookback {Optional[int]} -- The number of bars before `start` to load as well,
+            see `kernels.lookback_bars`. `None` loads all of them. (default: {0})
+
+        Returns:
+        ----
+        {StockFrame} -- A new StockFrame object.
+
+        Usage:
+        ----
+            >>> stock_frame = StockFrame.from_price_store(
+                root_path='/home/data/price-store',
+                symbols=['MSFT', 'AAPL'],
+                columns=['open', 'high', 'low', 'close', 'volume'],
+                start='2021-06-01',
+                lookback=lookback_bars(indicators=[{'indicator': 'sma', 'period': 100}])
+            )
+        """
+
+        price_data, symbol_names = PriceStore(root_path=root_path).read(
+            symbols=symbols,
+            columns=columns,
+            start=start,
+            end=end,
+            lookback=lookback
+        )
+
+        return cls.from_columns(columns=price_data, symbol_names=symbol_names)
+
+    @classmethod
+    def from_shared(cls, name: str) -> 'StockFrame':
+        """Creates a StockFrame from a shared memory block made by `to_shared`.
+
+        Overview:
+        ----
+        The columns are copied into the new frame once, so the block can be
+        closed and unlinked afterwards. Workers that only need the arrays can
+        skip the frame and read `SharedPriceBlock.attach(name=name).columns`
+        without copying anything.
+
+        Arguments:
+        ----
+        name {str} -- The name of the shared memory block.
+
+        Returns:
+        ----
+        {StockFrame} -- A new StockFrame object.
+
+        Usage:
+        ----
+            >>> stock_frame = StockFrame.from_shared(name=block.name)
+        """
+
+        block = SharedPriceBlock.attach(name=name)
+
+        try:
+            columns = dict(block.columns)
+            columns['symbol'] = np.repeat(np.arange(len(block.symbols)), np.diff(block.offsets))
+
+            stock_frame = cls.from_columns(columns=columns, symbol_names=block.symbols)
+
+            del columns
+
+        finally:
+            block.close()
+
+        return stock_frame
+
+    @staticmethod
+    def _build_index(symbol_codes: np.ndarray, symbol_level: pd.Index, dates: pd.DatetimeIndex) -> pd.MultiIndex:
+        """Builds the `(symbol, date)` MultiIndex from the symbol codes and the dates.
+
+        Arguments:
+        ----
+        symbol_codes {np.ndarray} -- The position of each row's symbol in `symbol_level`.
+
+        symbol_level {pd.Index} -- The sorted symbols.
+
+        dates {pd.DatetimeIndex} -- The date of each row.
+
+        Returns:
+        ----
+        {pd.MultiIndex} -- The index for the frame.
+        """
+
+        date_codes, date_level = pd.factorize(dates, sort=True)
+
+        return pd.MultiIndex(
+            levels=[symbol_level, date_level],
+            codes=[symbol_codes, date_codes],
+            names=['symbol', 'date'],
+            verify_integrity=False
+        )
+
+    @staticmethod
+    def _sort_symbol_codes(symbol_codes: np.ndarray, symbol_names: List[str]) -> tuple:
+        """Remaps the symbol codes so the symbol names are sorted.
+
+        Arguments:
+        ----
+        symbol_codes {np.ndarray} -- The integer codes for each row.
+
+        symbol_names {List[str]} -- The symbols the codes refer to.
+
+        Returns:
+        ----
+        {tuple} -- The remapped codes and the sorted symbols as a `pd.Index`.
+        """
+
+        symbol_names = np.asarray(symbol_names, dtype=object)
+        order = np.argsort(symbol_names, kind='stable')
+
+        # Map each old code to its position in the sorted names.
+        remap = np.empty_like(order)
+        remap[order] = np.arange(order.size)
+
+        return remap[symbol_codes.astype(np.intp)], pd.Index(symbol_names[order])
+
+    @staticmethod
+    def _parse_date_array(dates: Union[np.ndarray, Sequence], date_unit: str) -> pd.DatetimeIndex:
+        """Converts the dates passed through to a `pd.DatetimeIndex`.
+
+        Arguments:
+        ----
+        dates {Union[np.ndarray, Sequence]} -- The dates, either as `datetime64` values,
+            integer epochs or strings.
+
+        date_unit {str} -- The unit of integer epoch dates.
+
+        Returns:
+        ----
+        {pd.DatetimeIndex} -- The parsed dates.
+        """
+
+        dates = np.asarray(dates)
+
+        if np.issubdtype(dates.dtype, np.integer):
+            return pd.DatetimeIndex(dates.astype('datetime64[{unit}]'.format(unit=date_unit)))
+
+        if np.issubdtype(dates.dtype, np.datetime64):
+            return pd.DatetimeIndex(dates)
+
+        return pd.DatetimeIndex(pd.to_datetime(dates))
+
+    def _set_frame(self, price_df: pd.DataFrame, index_changed: bool = True) -> None:
+        """Sets the frame and resets anything derived from the old one.
+
+        Arguments:
+        ----
+        price_df {pd.DataFrame} -- The new multi-index price data frame.
+
+        Keyword Arguments:
+        ----
+        index_changed {bool} -- Set to `False` when the new frame has the same
+            rows as the old one, so the symbol grouping is kept. (default: {True})
+        """
+
+        self._frame: pd.DataFrame = price_df
         self._symbol_groups = None
         self._symbol_rolling_groups = None
 
+        if index_changed:
+            self._grouping = None
+
     @property
     def frame(self) -> pd.DataFrame:
         """The frame object.
@@ -32,8 +369,169 @@ class StockFrame():
         ----
         pd.DataFrame -- A pandas data frame with the price data.
         """
+
+        if self._pending_rows:
+            self._merge_pending_rows()
+
         return self._frame
 
+    def add_rows(self, data: List[Dict]) -> None:
+        """Adds new bars to the StockFrame.
+
+        Overview:
+        ----
+        The bars are appended to a buffer for each symbol instead of the frame,
+        so adding a bar doesn't copy or sort the frame. The buffers are merged
+        into the frame the next time it's used, which means many bars can be
+        added between refreshes for the cost of a single merge. The bars for
+        each symbol are expected to be newer than the ones already in the frame.
+
+        Arguments:
+        ----
+        data {List[Dict]} -- The bars to add, each one must have a `symbol` and
+            a `date` key, any columns that are missing are filled with `NaN`.
+
+        Usage:
+        ----
+            >>> stock_frame.add_rows(
+                data=[
+                    {'symbol': 'MSFT', 'date': '2021-01-06', 'open': 212.17,
+                     'high': 216.49, 'low': 211.94, 'close': 212.25, 'volume': 35930700}
+                ]
+            )
+        """
+
+        for bar in data:
+
+            values = dict(bar)
+            symbol = values.pop('symbol')
+            date = pd.Timestamp(values.pop('date')).to_datetime64()
+
+            if symbol not in self._buffers:
+                self._buffers[symbol] = BarBuffer(
+                    dtypes={
+                        name: dtype if isinstance(dtype, np.dtype) else np.dtype(object)
+                        for name, dtype in self._frame.dtypes.items()
+                    }
+                )
+
+            self._buffers[symbol].append(date=date, values=values)
+            self._pending_rows += 1
+
+    def _merge_pending_rows(self) -> None:
+        """Merges the buffered bars into the frame.
+
+        Overview:
+        ----
+        Every row, old or new, already knows where it belongs because the rows
+        for each symbol are contiguous. So instead of concatenating and sorting,
+        each column is allocated once and the old and the new rows are copied
+        straight into their positions.
+        """
+
+        old_frame = self._frame
+        old_grouping = self._grouping or SymbolGrouping(index=old_frame.index)
+        old_offsets = old_grouping.offsets
+        old_symbols = old_grouping.symbols
+
+        buffers = {symbol: buffer for symbol, buffer in self._buffers.items() if buffer.size}
+        symbol_level = old_symbols.union(pd.Index(list(buffers))).sort_values()
+
+        # Count the old and new rows for each symbol, in the order of the new frame.
+        old_counts = np.zeros(symbol_level.size, dtype=np.int64)
+        old_counts[symbol_level.get_indexer(old_symbols)] = np.diff(old_offsets)
+
+        new_counts = np.zeros(symbol_level.size, dtype=np.int64)
+        new_counts[symbol_level.get_indexer(list(buffers))] = [buffer.size for buffer in buffers.values()]
+
+        offsets = np.concatenate([[0], np.cumsum(old_counts + new_counts)])
+
+        # Work out where each old row and each new row ends up.
+        old_positions = np.repeat(offsets[:-1], old_counts) + _ranges(counts=old_counts)
+        new_positions = np.repeat(offsets[:-1] + old_counts, new_counts) + _ranges(counts=new_counts)
+
+        # The buffered rows, in the order of the new frame.
+        buffer_order = [buffers[symbol] for symbol in symbol_level if symbol in buffers]
+
+        size = int(offsets[-1])
+        old_dates = old_frame.index.levels[1].values[old_frame.index.codes[1]]
+
+        dates = np.empty(size, dtype=old_dates.dtype if old_dates.size else 'datetime64[ns]')
+        dates[old_positions] = old_dates
+        dates[new_positions] = np.concatenate([buffer.dates[:buffer.size] for buffer in buffer_order])
+
+        column_names = list(old_frame.columns) + [
+            name for name in dict.fromkeys(
+                name for buffer in buffer_order for name in buffer.columns
+            ) if name not in old_frame.columns
+        ]
+
+        columns = {}
+
+        for name in column_names:
+
+            old_values = old_frame[name].to_numpy() if name in old_frame.columns else None
+            new_values = [
+                buffer.columns[name][:buffer.size] if name in buffer.columns
+                else np.full(buffer.size, np.nan) for buffer in buffer_order
+            ]
+
+            dtypes = [values.dtype for values in new_values]
+
+            if old_values is not None:
+                dtypes.append(old_values.dtype)
+
+            values = np.empty(size, dtype=np.result_type(*dtypes))
+
+            if old_values is None:
+                values[old_positions] = np.nan if values.dtype.kind == 'f' else None
+            else:
+                values[old_positions] = old_values
+
+            values[new_positions] = np.concatenate(new_values)
+            columns[name] = values
+
+        index = self._build_index(
+            symbol_codes=np.repeat(np.arange(symbol_level.size), old_counts + new_counts),
+            symbol_level=symbol_level,
+            dates=pd.DatetimeIndex(dates)
+        )
+
+        price_df = pd.DataFrame(data=columns, index=index)
+
+        # Only sort if a bar came in older than the ones we already had.
+        if not price_df.index.is_monotonic_increasing:
+            price_df = price_df.sort_index()
+
+        for buffer in self._buffers.values():
+            buffer.clear()
+
+        self._pending_rows = 0
+        self._set_frame(price_df=price_df)
+
+    @property
+    def grouping(self) -> SymbolGrouping:
+        """Returns how the rows of the StockFrame are split by symbol.
+
+        Overview:
+        ----
+        The grouping holds the symbols, the row offsets and the group code
+        of each row. It's worked out once and kept until rows are added or
+        the index changes, so the indicators and the signal checks can all
+        share it instead of grouping the frame again.
+
+        Returns:
+        ----
+        {SymbolGrouping} -- The symbol grouping for the current frame.
+        """
+
+        frame = self.frame
+
+        if self._grouping is None:
+            self._grouping = SymbolGrouping(index=frame.index)
+
+        return self._grouping
+
     @property
     def symbol_groups(self) -> DataFrameGroupBy:
         """Returns the Groups in the StockFrame.
@@ -50,10 +548,8 @@ class StockFrame():
         """
 
         # Group by Symbol.
-        self._symbol_groups: DataFrameGroupBy = self._frame.groupby(
-            by='symbol',
-            as_index=False,
-            sort=True
+        self._symbol_groups: DataFrameGroupBy = self.grouping.groupby(
+            frame=self.frame
         )
 
         return self._symbol_groups
@@ -71,7 +567,7 @@ class StockFrame():
         """
 
         # If we don't a symbols group, then create it.
-        if not self._symbol_groups:
+        if self._symbol_groups is None:
             self.symbol_groups
 
         self._symbol_rolling_groups: RollingGroupby = self._symbol_groups.rolling(
@@ -128,8 +624,131 @@ class StockFrame():
 
         price_df = price_df.set_index(keys=['symbol', 'date'])
 
+        # Keep the rows for each symbol next to each other.
+        if not price_df.index.is_monotonic_increasing:
+            price_df = price_df.sort_index()
+
         return price_df
 
+    @property
+    def symbols(self) -> pd.Index:
+        """Returns the symbols in the order they appear in the frame.
+
+        Returns:
+        ----
+        {pd.Index} -- The symbols in the StockFrame.
+        """
+
+        return self.grouping.symbols
+
+    @property
+    def symbol_offsets(self) -> np.ndarray:
+        """Returns the row offsets where each symbol starts.
+
+        Overview:
+        ----
+        The rows for each symbol are stored next to each other, so the
+        rows of the `i`th symbol are `offsets[i]` up to `offsets[i + 1]`.
+        This lets us slice each symbol straight out of a column array
+        instead of grouping the frame.
+
+        Returns:
+        ----
+        {np.ndarray} -- An array with one more value than there are symbols.
+        """
+
+        return self.grouping.offsets
+
+    def to_shared(self, columns: List[str] = None, name: str = None) -> SharedPriceBlock:
+        """Copies the price columns into a shared memory block other processes can read.
+
+        Overview:
+        ----
+        The block holds the dates, the symbol offsets and the columns, along
+        with a small header describing the symbols and the data type of each
+        column. Other processes open it with `SharedPriceBlock.attach` and
+        read the bars straight out of the shared memory, or build their own
+        frame with `StockFrame.from_shared`. The process that made the block
+        should `unlink` it when the others are done.
+
+        Keyword Arguments:
+        ----
+        columns {List[str]} -- The columns to share, `None` shares the `open`, `high`,
+            `low`, `close` and `volume` columns the frame has. (default: {None})
+
+        name {str} -- The name of the shared memory, `None` picks a unique one. (default: {None})
+
+        Returns:
+        ----
+        {SharedPriceBlock} -- The block, owned by this process.
+
+        Usage:
+        ----
+            >>> with stock_frame.to_shared() as block:
+                    pool.map(run_backtest, [(block.name, symbol) for symbol in block.symbols])
+        """
+
+        frame = self.frame
+
+        if columns is None:
+            columns = [column for column in ['open', 'high', 'low', 'close', 'volume'] if column in frame.columns]
+
+        shared_columns = {'date': frame.index.get_level_values('date').values}
+        shared_columns.update({column: frame[column].to_numpy() for column in columns})
+
+        return SharedPriceBlock.create(
+            columns=shared_columns,
+            offsets=self.symbol_offsets,
+            symbols=[str(symbol) for symbol in self.symbols],
+            name=name
+        )
+
+    def set_values(self, column: str, positions: np.ndarray, values: np.ndarray) -> None:
+        """Overwrites the values of a column at the given rows.
+
+        Arguments:
+        ----
+        column {str} -- The column to update, it's created if it doesn't exist.
+
+        positions {np.ndarray} -- The integer positions of the rows.
+
+        values {np.ndarray} -- The new values.
+        """
+
+        if column not in self.frame.columns:
+            self.add_columns(columns={column: np.full(len(self._frame), np.nan)})
+
+        self._frame.iloc[positions, self._frame.columns.get_loc(column)] = values
+
+    def add_columns(self, columns: Union[Dict[str, np.ndarray], pd.DataFrame]) -> pd.DataFrame:
+        """Adds several columns to the frame in a single operation.
+
+        Arguments:
+        ----
+        columns {Union[Dict[str, np.ndarray], pd.DataFrame]} -- The new columns, each one
+            aligned with the rows of the frame. A data frame is added as it is, so a
+            block of columns stays a single block. Existing columns are replaced.
+
+        Returns:
+        ----
+        {pd.DataFrame} -- The frame with the new columns.
+        """
+
+        if isinstance(columns, pd.DataFrame):
+            new_columns = columns
+        else:
+            new_columns = pd.DataFrame(data=columns, index=self.frame.index)
+        old_columns = self._frame.drop(
+            columns=self._frame.columns.intersection(new_columns.columns)
+        )
+
+        self._set_frame(
+            price_df=pd.concat([old_columns, new_columns], axis=1),
+            index_changed=False
+        )
+
+        return self._frame
+
     def do_indicator_exist(self, column_names: List[str]) -> bool:
         """Checks to see if the indicator columns specified exist.
 
@@ -153,7 +772,7 @@ class StockFrame():
         bool -- `True` if all the columns exist.
         """
 
-        if set(column_names).issubset(self._frame.columns):
+        if set(column_names).issubset(self.frame.columns):
             return True
         else:
             raise KeyError("The following indicator columns are missing from the StockFrame: {missing_columns}".format(
@@ -161,125 +780,110 @@ class StockFrame():
                     self._frame.columns)
             ))
 
-    def _check_signals(self, indicators: dict, indciators_comp_key: List[str], indicators_key: List[str]) -> Union[pd.DataFrame, None]:
-        """Returns the last row of the StockFrame if conditions are met.
-
-        Overview:
-        ----
-        Before a trade is executed, we must check to make sure if the
-        conditions that warrant a `buy` or `sell` signal are met. This
-        method will take last row for each symbol in the StockFrame and
-        compare the indicator column values with the conditions specified
-        by the user.
-
-        If the conditions are met the row will be returned back to the user.
+    def last_values(self, columns: List[str]) -> np.ndarray:
+        """Returns the last value of each column for every symbol.
 
         Arguments:
         ----
-        indicators {dict} -- A dictionary containing all the indicators to be checked
-            along with their buy and sell criteria.
-
-        indicators_comp_key List[str] -- A list of the indicators where we are comparing
-            one indicator to another indicator.
-
-        indicators_key List[str] -- A list of the indicators where we are comparing
-            one indicator to a numerical value.
+        columns {List[str]} -- The columns to grab.
 
         Returns:
         ----
-        {Union[pd.DataFrame, None]} -- If signals are generated then, a pandas.DataFrame object
-            will be returned. If no signals are found then nothing will be returned.
+        {np.ndarray} -- A `(symbols, columns)` float matrix, the rows follow `symbols`.
         """
 
-        # Grab the last rows.
-        last_rows = self._symbol_groups.tail(1)
+        frame = self.frame
+        last_positions = self.grouping.ends - 1
 
-        # Define a list of conditions.
-        conditions = {}
+        values = np.empty((last_positions.size, len(columns)), dtype=np.float64)
 
-        # Check to see if all the columns exist.
-        if self.do_indicator_exist(column_names=indicators_key):
+        for position, column in enumerate(columns):
+            values[:, position] = frame[column].to_numpy(dtype=np.float64, na_value=np.nan)[last_positions]
 
-            for indicator in indicators_key:
+        return values
 
-                column = last_rows[indicator]
+    def evaluate_signals(self, evaluator: SignalEvaluator) -> np.ndarray:
+        """Checks the signals of every symbol against its last row.
 
-                # Grab the Buy & Sell Condition.
-                buy_condition_target = indicators[indicator]['buy']
-                sell_condition_target = indicators[indicator]['sell']
+        Arguments:
+        ----
+        evaluator {SignalEvaluator} -- The compiled indicator signals.
 
-                buy_condition_operator = indicators[indicator]['buy_operator']
-                sell_condition_operator = indicators[indicator]['sell_operator']
+        Returns:
+        ----
+        {np.ndarray} -- An `int8` array holding `1` for buy, `-1` for sell and `0` otherwise,
+            with one value for each symbol in `symbols`.
+        """
 
-                condition_1: pd.Series = buy_condition_operator(
-                    column, buy_condition_target
-                )
-                condition_2: pd.Series = sell_condition_operator(
-                    column, sell_condition_target
-                )
+        self.do_indicator_exist(column_names=evaluator.columns)
 
-                condition_1 = condition_1.where(lambda x: x == True).dropna()
-                condition_2 = condition_2.where(lambda x: x == True).dropna()
+        return evaluator.signals(values=self.last_values(columns=evaluator.columns))
 
-                conditions['buys'] = condition_1
-                conditions['sells'] = condition_2
-        
-        # Store the indicators in a list.
-        check_indicators = []
-        
-        # Split the name so we can check if the indicator exist.
-        for indicator in indciators_comp_key:
-            parts = indicator.split('_comp_')
-            check_indicators += parts
+    def _check_signals(self, indicators: dict, indciators_comp_key: List[str], indicators_key: List[str],
+                       combine: str = 'all', evaluator: SignalEvaluator = None) -> Dict[str, pd.Series]:
+        """Returns the last row of the StockFrame if conditions are met.
 
-        if self.do_indicator_exist(column_names=check_indicators):
+        Overview:
+        ----
+        Before a trade is executed, we must check to make sure if the
+        conditions that warrant a `buy` or `sell` signal are met. This
+        method will take last row for each symbol in the StockFrame and
+        compare the indicator column values with the conditions specified
+        by the user.
 
-            for indicator in indciators_comp_key:
-                
-                # Split the indicators.
-                parts = indicator.split('_comp_')
+        The conditions are compiled into a `SignalEvaluator`, which checks
+        every symbol at once and combines the conditions, including the
+        `buy_max` and `sell_max` bounds.
 
-                # Grab the indicators that need to be compared.
-                indicator_1 = last_rows[parts[0]]
-                indicator_2 = last_rows[parts[1]]
+        Arguments:
+        ----
+        indicators {dict} -- A dictionary containing all the indicators to be checked
+            along with their buy and sell criteria.
 
-                # If we have a buy operator, grab it.
-                if indicators[indicator]['buy_operator']:
+        indicators_comp_key List[str] -- A list of the indicators where we are comparing
+            one indicator to another indicator.
 
-                    # Grab the Buy Operator.
-                    buy_condition_operator = indicators[indicator]['buy_operator']
+        indicators_key List[str] -- A list of the indicators where we are comparing
+            one indicator to a numerical value.
 
-                    # Grab the Condition.
-                    condition_1: pd.Series = buy_condition_operator(
-                        indicator_1, indicator_2
-                    )
+        Keyword Arguments:
+        ----
+        combine {str} -- How the conditions are combined, `all` or `any`. (default: {'all'})
 
-                    # Keep the one's that aren't null.
-                    condition_1 = condition_1.where(lambda x: x == True).dropna()
+        evaluator {SignalEvaluator} -- An evaluator that was already compiled from the
+            indicators, if there is one. (default: {None})
 
-                    # Add it as a buy signal.
-                    conditions['buys'] = condition_1
+        Returns:
+        ----
+        {Dict[str, pd.Series]} -- The `buys` and `sells`, each a series indexed by the
+            last row of the symbols where the signal was generated.
+        """
 
-                # If we have a sell operator, grab it.
-                if indicators[indicator]['sell_operator']:
+        if evaluator is None:
+            evaluator = SignalEvaluator(
+                indicators=indicators,
+                indicators_key=indicators_key,
+                indicators_comp_key=indciators_comp_key,
+                combine=combine
+            )
 
-                    # Grab the Sell Operator.
-                    sell_condition_operator = indicators[indicator]['sell_operator']
+        self.do_indicator_exist(column_names=evaluator.columns)
 
-                    # Store it in a Pd.Series.
-                    condition_2: pd.Series = sell_condition_operator(
-                        indicator_1, indicator_2
-                    )
+        # Grab the last rows.
+        last_index = self.frame.index[self.grouping.ends - 1]
 
-                    # keep the one's that aren't null.
-                    condition_2 = condition_2.where(lambda x: x == True).dropna()
+        buys, sells = evaluator.evaluate(
+            values=self.last_values(columns=evaluator.columns)
+        )
 
-                    # Add it as a sell signal.
-                    conditions['sells'] = condition_2
+        conditions = {
+            'buys': pd.Series(True, index=last_index[buys], dtype=bool),
+            'sells': pd.Series(True, index=last_index[sells], dtype=bool)
+        }
 
         return conditions
 
-    def grab_current_bar(self, symbol: str) -> pd.Series:
+    def grab_current_bar(self, symbol: str) -> pd.DataFrame:
         """Grabs the current trading bar.
 
         ### Parameters
@@ -290,17 +894,41 @@ class StockFrame():
 
         ### Returns
         -------
-        pd.Series
+        pd.DataFrame
             A candle bar, represented as a
-            pandas series object.
-        """        
+            single row pandas data frame.
+        """
 
-        # Filter the Stock Frame.
-        bars_filtered = self._frame.filter(like=symbol, axis=0)
-        bars = bars_filtered.tail(1)
+        # Find the last row of the symbol.
+        group = self.grouping.locate(symbols=symbol)
+        bars = self.frame.iloc[self.grouping.ends[group] - 1]
 
         return bars
 
+    def grab_current_bars(self, symbols: List[str] = None) -> pd.DataFrame:
+        """Grabs the current trading bar for multiple symbols.
+
+        ### Parameters
+        ----------
+        symbols : List[str] (optional, Default=None)
+            The symbols to grab the latest bar
+            for, if `None` the latest bar of
+            every symbol is returned.
+
+        ### Returns
+        -------
+        pd.DataFrame
+            One candle bar for each symbol, in
+            the order the symbols were passed.
+        """
+
+        if symbols is None:
+            last_positions = self.grouping.ends - 1
+        else:
+            last_positions = self.grouping.ends[self.grouping.locate(symbols=symbols)] - 1
+
+        return self.frame.iloc[last_positions]
+
     def grab_n_bars_ago(self, symbol: str, n: int) -> pd.Series:
         """Grabs the current trading bar.
 
@@ -313,15 +941,42 @@ class StockFrame():
         n : str
             The number of bars to look back.
 
+        ### Raises
+        -------
+        IndexError
+            If the symbol has fewer than
+            `n` bars.
+
         ### Returns
         -------
         pd.Series
             A candle bar, represented as a
             pandas series object.
-        """        
+        """
+
+        # Find the rows of the symbol.
+        group = self.grouping.locate(symbols=symbol)[0]
+        start = self.grouping.starts[group]
+        end = self.grouping.ends[group]
+
+        if n < 1 or n > end - start:
+            raise IndexError("{symbol} has {count} bars, can't go back {n}.".format(
+                symbol=symbol,
+                count=end - start,
+                n=n
+            ))
+
+        bars = self.frame.iloc[end - n]
+
+        return bars
+
+
+def _ranges(counts: np.ndarray) -> np.ndarray:
+    """Returns `0, 1, ..., count - 1` for each count, joined together."""
+
+    if counts.sum() == 0:
+        return np.zeros(0, dtype=np.int64)
 
-        # Filter the Stock Frame.
-        bars_filtered = self._frame.filter(like=symbol, axis=0)
-        bars = bars_filtered.iloc[-n]
+    starts = np.repeat(np.cumsum(counts) - counts, counts)
 
-        return bars
\ No newline at end of file
+    return np.arange(counts.sum()) - starts
@@ -0,0 +1,160 @@
+import numpy as np
+import pandas as pd
+
+from typing import List
+from typing import Union
+
+from pandas.core.groupby import DataFrameGroupBy
+
+
+class SymbolGrouping():
+
+    """
+    Represents how the rows of a StockFrame are split by symbol, so the
+    grouping only has to be worked out once for each index.
+    """
+
+    def __init__(self, index: pd.MultiIndex) -> None:
+        """Initalizes the Symbol Grouping.
+
+        Overview:
+        ----
+        The rows for each symbol are stored next to each other, so a symbol
+        is fully described by the offset of its first row. Everything else,
+        the group code of each row, the symbols in frame order and the pandas
+        `GroupBy` object, is derived from the offsets when it's first needed.
+
+        Arguments:
+        ----
+        index {pd.MultiIndex} -- The `(symbol, date)` index of the frame.
+        """
+
+        symbol_codes = index.codes[0]
+
+        if symbol_codes.size:
+            boundaries = np.flatnonzero(symbol_codes[1:] != symbol_codes[:-1]) + 1
+            self.offsets = np.concatenate([[0], boundaries, [symbol_codes.size]]).astype(np.int64)
+        else:
+            self.offsets = np.zeros(1, dtype=np.int64)
+
+        self.symbols: pd.Index = index.levels[0][symbol_codes[self.offsets[:-1]]]
+
+        self._codes = None
+        self._lookup = None
+        self._groupby = None
+        self._grouped_frame = None
+
+    @property
+    def starts(self) -> np.ndarray:
+        """The position of the first row of each symbol.
+
+        Returns:
+        ----
+        {np.ndarray} -- The start offsets.
+        """
+
+        return self.offsets[:-1]
+
+    @property
+    def ends(self) -> np.ndarray:
+        """The position after the last row of each symbol.
+
+        Returns:
+        ----
+        {np.ndarray} -- The end offsets.
+        """
+
+        return self.offsets[1:]
+
+    @property
+    def counts(self) -> np.ndarray:
+        """The number of rows for each symbol.
+
+        Returns:
+        ----
+        {np.ndarray} -- The row counts.
+        """
+
+        return np.diff(self.offsets)
+
+    @property
+    def codes(self) -> np.ndarray:
+        """The group number of each row, matching the position of its symbol in `symbols`.
+
+        Returns:
+        ----
+        {np.ndarray} -- The group codes.
+        """
+
+        if self._codes is None:
+            self._codes = np.repeat(np.arange(self.symbols.size), self.counts)
+
+        return self._codes
+
+    def locate(self, symbols: Union[str, List[str]]) -> np.ndarray:
+        """Finds the position of each symbol in `symbols`, matching the names exactly.
+
+        Arguments:
+        ----
+        symbols {Union[str, List[str]]} -- A symbol or a list of symbols.
+
+        Raises:
+        ----
+        KeyError: If one of the symbols isn't in the frame.
+
+        Returns:
+        ----
+        {np.ndarray} -- The group number of each symbol.
+        """
+
+        if isinstance(symbols, str):
+            symbols = [symbols]
+
+        if self._lookup is None:
+            self._lookup = pd.Index(self.symbols)
+
+        positions = self._lookup.get_indexer(symbols)
+
+        if (positions < 0).any():
+            raise KeyError("The following symbols are missing from the StockFrame: {missing_symbols}".format(
+                missing_symbols=[symbol for symbol, position in zip(symbols, positions) if position < 0]
+            ))
+
+        return positions
+
+    def groupby(self, frame: pd.DataFrame) -> DataFrameGroupBy:
+        """Groups the frame by symbol using the group codes.
+
+        Overview:
+        ----
+        Grouping by the `symbol` level means hashing every row. Since we already
+        have the group codes, the frame is grouped by a categorical built straight
+        from them instead. The `GroupBy` object is kept until a different frame
+        object is passed through.
+
+        Arguments:
+        ----
+        frame {pd.DataFrame} -- The frame, it must share the index the grouping
+            was built from.
+
+        Returns:
+        ----
+        {DataFrameGroupBy} -- A `pandas.core.groupby.GroupBy` object with each symbol.
+        """
+
+        if self._grouped_frame is not frame:
+
+            symbol_keys = pd.Categorical.from_codes(
+                codes=self.codes,
+                categories=self.symbols
+            )
+
+            self._groupby = frame.groupby(
+                by=symbol_keys,
+                as_index=False,
+                sort=False,
+                observed=True
+            )
+            self._grouped_frame = frame
+
+        return self._groupby
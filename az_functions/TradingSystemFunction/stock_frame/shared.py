@@ -0,0 +1,333 @@
+import json
+import struct
+import numpy as np
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+
+# Marks the start of a block, followed by the version and the length of the JSON header.
+MAGIC = b'STKF'
+VERSION = 1
+PREFIX = struct.Struct('<4sII')
+
+# Every array starts on a cache line.
+ALIGNMENT = 64
+
+
+def _check_shared_memory() -> None:
+    """Raises an error if `multiprocessing.shared_memory` isn't available."""
+
+    if shared_memory is None:
+        raise ImportError('Sharing a StockFrame needs `multiprocessing.shared_memory`, which comes with Python 3.8.')
+
+
+def _align(position: int) -> int:
+    """Rounds a byte position up to the next multiple of `ALIGNMENT`."""
+
+    return -(-position // ALIGNMENT) * ALIGNMENT
+
+
+def block_layout(dtypes: Dict[str, Union[str, np.dtype]], offsets: np.ndarray, symbols: List[str] = None,
+                 metadata: dict = None) -> Tuple[bytes, dict, int, int]:
+    """Lays out a price block, the format used in shared memory and by the local price store.
+
+    Overview:
+    ----
+    A block starts with the `STKF` marker, a version and the length of a
+    JSON header describing the symbols, and the data type and position of
+    the symbol offsets and of every column. The arrays follow the header,
+    each one starting on a 64 byte boundary, with their positions counted
+    from the end of the header.
+
+    Arguments:
+    ----
+    dtypes {Dict[str, Union[str, np.dtype]]} -- The data type of each column.
+
+    offsets {np.ndarray} -- The symbol offsets, the first row of each symbol
+        followed by the number of rows.
+
+    Keyword Arguments:
+    ----
+    symbols {List[str]} -- The symbol names, `None` numbers them. (default: {None})
+
+    metadata {dict} -- Anything else to keep in the header, it has to be
+        JSON serializable. (default: {None})
+
+    Returns:
+    ----
+    {Tuple[bytes, dict, int, int]} -- The packed header, the header, the position of
+        the first array and the size of the whole block.
+    """
+
+    offsets = np.asarray(offsets, dtype=np.int64)
+    rows = int(offsets[-1]) if offsets.size else 0
+
+    if symbols is None:
+        symbols = range(offsets.size - 1)
+
+    layouts = {}
+    position = _align(offsets.nbytes)
+
+    for column_name, dtype in dtypes.items():
+        dtype = np.dtype(dtype)
+        layouts[column_name] = {'dtype': dtype.str, 'offset': position}
+        position = _align(position + dtype.itemsize * rows)
+
+    header = {
+        'rows': rows,
+        'symbols': [str(symbol) for symbol in symbols],
+        'offsets': {'dtype': offsets.dtype.str, 'offset': 0},
+        'columns': layouts,
+        'metadata': metadata or {}
+    }
+
+    header_json = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    data_start = _align(PREFIX.size + len(header_json))
+
+    return PREFIX.pack(MAGIC, VERSION, len(header_json)) + header_json, header, data_start, data_start + position
+
+
+def unpack_header(buffer: Union[bytes, memoryview]) -> Tuple[dict, int]:
+    """Reads the header at the start of a price block.
+
+    Arguments:
+    ----
+    buffer {Union[bytes, memoryview]} -- The start of the block, at least up to
+        the end of the header.
+
+    Raises:
+    ----
+    ValueError: If the buffer doesn't start with a price block.
+
+    Returns:
+    ----
+    {Tuple[dict, int]} -- The header and the position of the first array.
+    """
+
+    if len(buffer) < PREFIX.size:
+        raise ValueError('The buffer is too short to hold a price block.')
+
+    magic, version, header_size = PREFIX.unpack(bytes(buffer[:PREFIX.size]))
+
+    if magic != MAGIC or version != VERSION or len(buffer) < PREFIX.size + header_size:
+        raise ValueError('The buffer does not hold a price block.')
+
+    header = json.loads(bytes(buffer[PREFIX.size:PREFIX.size + header_size]).decode('utf-8'))
+
+    return header, _align(PREFIX.size + header_size)
+
+
+def packed_header_size(prefix: bytes) -> int:
+    """Returns the number of bytes to read to get the whole header, from the first `PREFIX.size` bytes."""
+
+    return PREFIX.size + PREFIX.unpack(prefix[:PREFIX.size])[2]
+
+
+class SharedPriceBlock():
+
+    """
+    Represents the price columns of one or more symbols stored in a
+    single shared memory block, so several processes can read them.
+    """
+
+    def __init__(self, memory: Any, header: dict, data_start: int, owner: bool = False) -> None:
+        """Initalizes the Shared Price Block.
+
+        Overview:
+        ----
+        The block starts with a small header describing the symbols, the
+        symbol offsets and the data type of every column, followed by the
+        arrays, see `block_layout`. Use `create` or
+        `allocate` to make a new block and `attach` to open one made by
+        another process; the columns are then `numpy` views of the shared
+        memory, nothing is copied.
+
+        Arguments:
+        ----
+        memory {shared_memory.SharedMemory} -- The shared memory holding the block.
+
+        header {dict} -- The parsed header.
+
+        data_start {int} -- The position of the first array, right after the header.
+
+        Keyword Arguments:
+        ----
+        owner {bool} -- `True` for the process that made the block, which
+            is the one that should `unlink` it. (default: {False})
+        """
+
+        self._memory = memory
+        self._data_start = data_start
+        self.header = header
+        self.owner = owner
+
+        self.name: str = memory.name
+        self.rows: int = header['rows']
+        self.symbols: List[str] = header['symbols']
+        self.offsets: np.ndarray = self._view(layout=header['offsets'], size=len(self.symbols) + 1)
+        self.columns: Dict[str, np.ndarray] = {
+            name: self._view(layout=layout, size=self.rows) for name, layout in header['columns'].items()
+        }
+
+    def __enter__(self) -> 'SharedPriceBlock':
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+
+        if self.owner:
+            self.unlink()
+
+    def __repr__(self) -> str:
+        return '<SharedPriceBlock name={name} symbols={symbols} rows={rows} columns={columns}>'.format(
+            name=self.name,
+            symbols=len(self.symbols),
+            rows=self.rows,
+            columns=list(self.columns)
+        )
+
+    def _view(self, layout: dict, size: int) -> np.ndarray:
+        """Returns an array of the block without copying it."""
+
+        return np.ndarray(
+            shape=(size,),
+            dtype=np.dtype(layout['dtype']),
+            buffer=self._memory.buf,
+            offset=self._data_start + layout['offset']
+        )
+
+    @classmethod
+    def allocate(cls, dtypes: Dict[str, Union[str, np.dtype]], offsets: np.ndarray, symbols: List[str] = None,
+                 name: str = None) -> 'SharedPriceBlock':
+        """Makes a new block with empty columns.
+
+        Arguments:
+        ----
+        dtypes {Dict[str, Union[str, np.dtype]]} -- The data type of each column.
+
+        offsets {np.ndarray} -- The symbol offsets, the first row of each symbol
+            followed by the number of rows.
+
+        Keyword Arguments:
+        ----
+        symbols {List[str]} -- The symbol names, `None` numbers them. (default: {None})
+
+        name {str} -- The name of the shared memory, `None` picks a unique one. (default: {None})
+
+        Returns:
+        ----
+        {SharedPriceBlock} -- The block, owned by this process.
+        """
+
+        _check_shared_memory()
+
+        header_bytes, header, data_start, size = block_layout(dtypes=dtypes, offsets=offsets, symbols=symbols)
+
+        memory = shared_memory.SharedMemory(name=name, create=True, size=max(size, 1))
+        memory.buf[:len(header_bytes)] = header_bytes
+
+        block = cls(memory=memory, header=header, data_start=data_start, owner=True)
+        block.offsets[:] = np.asarray(offsets, dtype=np.int64)
+
+        return block
+
+    @classmethod
+    def create(cls, columns: Dict[str, np.ndarray], offsets: np.ndarray, symbols: List[str] = None,
+               name: str = None) -> 'SharedPriceBlock':
+        """Makes a new block holding a copy of the columns.
+
+        Arguments:
+        ----
+        columns {Dict[str, np.ndarray]} -- The columns, grouped by symbol.
+
+        offsets {np.ndarray} -- The symbol offsets, the first row of each symbol
+            followed by the number of rows.
+
+        Keyword Arguments:
+        ----
+        symbols {List[str]} -- The symbol names, `None` numbers them. (default: {None})
+
+        name {str} -- The name of the shared memory, `None` picks a unique one. (default: {None})
+
+        Returns:
+        ----
+        {SharedPriceBlock} -- The block, owned by this process.
+
+        Usage:
+        ----
+            >>> block = SharedPriceBlock.create(
+                columns={'close': close, 'volume': volume},
+                offsets=stock_frame.symbol_offsets,
+                symbols=list(stock_frame.symbols)
+            )
+            >>> block.name
+        """
+
+        columns = {column_name: np.asarray(values) for column_name, values in columns.items()}
+
+        block = cls.allocate(
+            dtypes={column_name: values.dtype for column_name, values in columns.items()},
+            offsets=offsets,
+            symbols=symbols,
+            name=name
+        )
+
+        for column_name, values in columns.items():
+            block.columns[column_name][:] = values
+
+        return block
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedPriceBlock':
+        """Opens a block made by another process.
+
+        Arguments:
+        ----
+        name {str} -- The name of the shared memory.
+
+        Raises:
+        ----
+        ValueError: If the shared memory doesn't hold a price block.
+
+        Returns:
+        ----
+        {SharedPriceBlock} -- The block, its columns are views of the shared memory.
+        """
+
+        _check_shared_memory()
+
+        memory = shared_memory.SharedMemory(name=name)
+
+        try:
+            header, data_start = unpack_header(buffer=memory.buf)
+        except ValueError:
+            memory.close()
+            raise ValueError('The shared memory `{name}` does not hold a price block.'.format(name=name))
+
+        return cls(memory=memory, header=header, data_start=data_start, owner=False)
+
+    def column(self, name: str) -> np.ndarray:
+        """Grabs a column of the block, without copying it."""
+
+        return self.columns[name]
+
+    def close(self) -> None:
+        """Closes this process' view of the block, the arrays can't be used afterwards."""
+
+        self.offsets = None
+        self.columns = {}
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """Frees the shared memory once every process has closed it."""
+
+        self._memory.unlink()
@@ -0,0 +1,202 @@
+import os
+import asyncio
+import aiohttp
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Callable
+
+from azure.core.pipeline.transport import AioHttpTransport
+from azure.identity.aio import DefaultAzureCredential
+from azure.storage.blob.aio import ContainerClient
+from azure.storage.blob.aio import BlobServiceClient
+
+
+class BlobClientCache():
+
+    """
+    Represents the blob clients shared by every invocation running in
+    the same Function worker.
+    """
+
+    def __init__(self, max_connections: int = 100, credential_factory: Callable[[], Any] = DefaultAzureCredential) -> None:
+        """Initalizes the Blob Client Cache.
+
+        Overview:
+        ----
+        Creating a credential and a `BlobServiceClient` for every request means
+        a new token and a new connection pool each time. The cache creates them
+        once per account and keeps them open, so a warm worker goes straight
+        to the download. The token is kept by the client's pipeline and only
+        refreshed when it's close to expiring.
+
+        The clients belong to the event loop they were opened on. If the loop
+        changes, the old ones are closed and they are opened again on the new
+        one. A lock makes sure that
+        concurrent invocations share a single client instead of racing to
+        create their own.
+
+        Keyword Arguments:
+        ----
+        max_connections {int} -- The size of the connection pool of each
+            account. (default: {100})
+
+        credential_factory {Callable[[], Any]} -- Creates the async credential used
+            by the clients. (default: {DefaultAzureCredential})
+
+        Usage:
+        ----
+            >>> client_cache = BlobClientCache(max_connections=50)
+            >>> container_client = await client_cache.get_container_client(
+                account_url='https://tradingsystem.blob.core.windows.net/',
+                container='price-history'
+            )
+        """
+
+        self.max_connections = max_connections
+        self.credential_factory = credential_factory
+
+        self._loop = None
+        self._lock = None
+        self._credential = None
+        self._service_clients: Dict[str, BlobServiceClient] = {}
+        self._container_clients: Dict[tuple, ContainerClient] = {}
+
+    async def _check_loop(self) -> None:
+        """Closes and forgets the clients if they were opened on a different event loop."""
+
+        loop = asyncio.get_running_loop()
+
+        if self._loop is not loop:
+
+            credential = self._credential
+            service_clients = list(self._service_clients.values())
+
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._credential = None
+            self._service_clients = {}
+            self._container_clients = {}
+
+            await self._close_clients(service_clients=service_clients, credential=credential)
+
+    @staticmethod
+    async def _close_clients(service_clients: List[BlobServiceClient], credential: Any) -> None:
+        """Closes the service clients, their sessions and the credential.
+
+        Overview:
+        ----
+        Clients left over from an old event loop are closed from the new one.
+        If the old loop is already closed, their sockets can't be shut down
+        cleanly anymore, so that error is ignored rather than stopping the
+        other clients from being closed.
+
+        Arguments:
+        ----
+        service_clients {List[BlobServiceClient]} -- The service clients to close.
+
+        credential {Any} -- The credential to close, can be `None`.
+        """
+
+        for blob_service_client in service_clients:
+            try:
+                await blob_service_client.close()
+            except RuntimeError:
+                pass
+
+        if credential is not None and hasattr(credential, 'close'):
+            try:
+                await credential.close()
+            except RuntimeError:
+                pass
+
+    async def get_service_client(self, account_url: str) -> BlobServiceClient:
+        """Returns the open `BlobServiceClient` of an account, creating it the first time.
+
+        Arguments:
+        ----
+        account_url {str} -- The URL of the storage account.
+
+        Returns:
+        ----
+        {BlobServiceClient} -- The shared blob service client.
+        """
+
+        await self._check_loop()
+
+        if account_url in self._service_clients:
+            return self._service_clients[account_url]
+
+        async with self._lock:
+
+            # Another invocation may have created it while we waited.
+            if account_url not in self._service_clients:
+
+                if self._credential is None:
+                    self._credential = self.credential_factory()
+
+                session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=self.max_connections),
+                    cookie_jar=aiohttp.DummyCookieJar(),
+                    auto_decompress=False,
+                    trust_env=True
+                )
+
+                blob_service_client = BlobServiceClient(
+                    account_url=account_url,
+                    credential=self._credential,
+                    transport=AioHttpTransport(session=session, session_owner=True)
+                )
+
+                await blob_service_client.__aenter__()
+                self._service_clients[account_url] = blob_service_client
+
+        return self._service_clients[account_url]
+
+    async def get_container_client(self, account_url: str, container: str) -> ContainerClient:
+        """Returns a container client that shares the account's connection pool.
+
+        Arguments:
+        ----
+        account_url {str} -- The URL of the storage account.
+
+        container {str} -- The name of the container.
+
+        Returns:
+        ----
+        {ContainerClient} -- The shared container client.
+        """
+
+        blob_service_client = await self.get_service_client(account_url=account_url)
+
+        key = (account_url, container)
+
+        if key not in self._container_clients:
+            self._container_clients[key] = blob_service_client.get_container_client(
+                container=container
+            )
+
+        return self._container_clients[key]
+
+    async def close(self) -> None:
+        """Closes the clients and the credential."""
+
+        await self._check_loop()
+
+        async with self._lock:
+
+            await self._close_clients(
+                service_clients=list(self._service_clients.values()),
+                credential=self._credential
+            )
+
+            self._credential = None
+            self._service_clients = {}
+            self._container_clients = {}
+
+
+# The clients shared by the invocations of this worker.
+CLIENT_CACHE = BlobClientCache(
+    max_connections=int(os.environ.get('BLOB_MAX_CONNECTIONS', 100))
+)
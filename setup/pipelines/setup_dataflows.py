@@ -58,6 +58,43 @@ response = data_factory_mgmt_client.data_flows.create_or_update(
 if id in response:
     print("DATA FLOW (PRICE) CREATED...")
 
+#########################################
+# DATA FLOWS - PRICES PARQUET
+#########################################
+
+# Step 1: Define our `DataFlowSource`, this reads every price file at once.
+data_flow_source = DataFlowSource(
+    name='LoadAllPriceFiles',
+    dataset=DatasetReference(reference_name='IexPriceDumps')
+)
+
+# Step 2: Define our `DataFlowSink`.
+data_flow_sink = DataFlowSink(
+    name='WriteParquetPartitions',
+    dataset=DatasetReference(reference_name='IexPricesParquet')
+)
+
+# Define the Mapping Data Flow, prices become 32 bit floats, volumes 64 bit integers and the
+# files are partitioned by symbol and year so readers can skip what they don't need.
+mapping_data_flow_parquet = MappingDataFlow(
+    description='Takes the price history data files and rewrites them as Parquet files partitioned by symbol and year.',
+    folder=prices_folder,
+    sources=[data_flow_source],
+    sinks=[data_flow_sink],
+    script="source(output(\n\t\tclose as double,\n\t\tdate as date,\n\t\thigh as double,\n\t\tlow as double,\n\t\topen as double,\n\t\tsymbol as string,\n\t\tvolume as long\n\t),\n\tallowSchemaDrift: true,\n\tvalidateSchema: false,\n\tignoreNoFilesFound: false,\n\twildcardPaths:['iex-price-history/*.json'],\n\tdocumentForm: 'documentPerLine') ~> LoadAllPriceFiles\nLoadAllPriceFiles derive(open = toFloat(open),\n\t\thigh = toFloat(high),\n\t\tlow = toFloat(low),\n\t\tclose = toFloat(close),\n\t\tvolume = toLong(volume),\n\t\tdate = toTimestamp(date),\n\t\tyear = year(date)) ~> CastPriceTypes\nCastPriceTypes select(mapColumn(\n\t\tsymbol,\n\t\tdate,\n\t\topen,\n\t\thigh,\n\t\tlow,\n\t\tclose,\n\t\tvolume,\n\t\tyear\n\t),\n\tskipDuplicateMapInputs: true,\n\tskipDuplicateMapOutputs: true) ~> SelectPriceColumns\nSelectPriceColumns sort(asc(symbol, true),\n\tasc(date, true)) ~> SortByDate\nSortByDate sink(allowSchemaDrift: true,\n\tvalidateSchema: false,\n\tformat: 'parquet',\n\tcompressionCodec: 'snappy',\n\ttruncate: true,\n\tpartitionBy('key',\n\t\t0,\n\t\tsymbol,\n\t\tyear\n\t),\n\tskipDuplicateMapInputs: true,\n\tskipDuplicateMapOutputs: true) ~> WriteParquetPartitions"
+)
+
+# Create the Data Flow.
+response = data_factory_mgmt_client.data_flows.create_or_update(
+    resource_group_name=RESOURCE_GROUP_NAME,
+    factory_name=DATA_FACTORY_NAME,
+    data_flow_name='ConvertPricesToParquet',
+    data_flow=DataFlowResource(properties=mapping_data_flow_parquet)
+)
+
+if id in response:
+    print("DATA FLOW (PRICE PARQUET) CREATED...")
+
 #########################################
 # DATA FLOWS - TICKERS
 #########################################
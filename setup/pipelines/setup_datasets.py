@@ -5,6 +5,7 @@ from azure.mgmt.datafactory.models import LinkedServiceReference
 
 # Import Dataset Models.
 from azure.mgmt.datafactory.models import JsonDataset
+from azure.mgmt.datafactory.models import ParquetDataset
 from azure.mgmt.datafactory.models import DatasetResource
 from azure.mgmt.datafactory.models import RestResourceDataset
 from azure.mgmt.datafactory.models import AzureSqlTableDataset
@@ -369,6 +370,41 @@ response = data_factory_mgmt_client.datasets.create_or_update(
 if 'id' in response:
     print('AZURE BLOB STORAGE (PRICES) DATASET CREATED...')
 
+#########################################
+# DATASETS - AZURE BLOB STORAGE (PRICES PARQUET)
+#########################################
+
+# Step 1: Define `LinkedServiceReference` object that refers to our `AzureBlobStorage`.
+azure_blob_reference = LinkedServiceReference(
+    reference_name='TradingSystemBlobStorage'
+)
+
+# Step 2: Define an `AzureBlobStorageLocation`, the files are partitioned into `symbol=<SYMBOL>/year=<YEAR>` folders.
+azure_blob_location = AzureBlobStorageLocation(
+    container='price-history',
+    folder_path='iex-price-parquet'
+)
+
+# Step 3: Define a `ParquetDataset`.
+azure_parquet_dataset = ParquetDataset(
+    description='Represents the price history stored as Parquet files, partitioned by symbol and year.',
+    linked_service_name=azure_blob_reference,
+    folder=prices_folder,
+    location=azure_blob_location,
+    compression_codec='snappy'
+)
+
+# Step 4: Create a new `Dataset` object.
+response = data_factory_mgmt_client.datasets.create_or_update(
+    resource_group_name=RESOURCE_GROUP_NAME,
+    factory_name=DATA_FACTORY_NAME,
+    dataset_name='IexPricesParquet',
+    dataset=DatasetResource(properties=azure_parquet_dataset)
+)
+
+if 'id' in response:
+    print('AZURE BLOB STORAGE (PRICES PARQUET) DATASET CREATED...')
+
 #########################################
 # DATASETS - AZURE BLOB STORAGE (TICKERS)
 #########################################
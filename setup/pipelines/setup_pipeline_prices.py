@@ -275,6 +275,35 @@ for_each_Activity = ForEachActivity(
 if for_each_Activity.validate() == []:
     print('FOR EACH ACTIVITY DEFINED...')
 
+#########################################
+# ACTIVITIES - EXECUTE DATA FLOW (PARQUET)
+#########################################
+
+# Step 1: Define our `DataFlowReference`.
+parquet_data_flow_reference = DataFlowReference(
+    reference_name='ConvertPricesToParquet'
+)
+
+# Step 2: Define the `ActivityDependency` so we only convert once every ticker has been captured.
+previous_activity_success = ActivityDependency(
+    activity=for_each_Activity.name,
+    dependency_conditions=[DependencyCondition.SUCCEEDED]
+)
+
+# Step 3: Define our `ExecuteDataFlowActivity`.
+parquet_data_flow_activity = ExecuteDataFlowActivity(
+    name='ConvertFilesToParquet',
+    description='Rewrites the JSON price files as Parquet files partitioned by symbol and year.',
+    policy=activity_policy,
+    depends_on=[previous_activity_success],
+    data_flow=parquet_data_flow_reference,
+    compute=compute_type,
+    trace_level='Fine'
+)
+
+if parquet_data_flow_activity.validate() == []:
+    print('EXECUTE DATAFLOW ACTIVITY (PARQUET) DEFINED...')
+
 #########################################
 # PIPELINES - CREATE
 #########################################
@@ -284,7 +313,8 @@ pipeline_resource = PipelineResource(
     activities=[
         web_activity,
         lookup_activity,
-        for_each_Activity
+        for_each_Activity,
+        parquet_data_flow_activity
     ]
 )
 
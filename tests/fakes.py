@@ -0,0 +1,48 @@
+import asyncio
+import hashlib
+
+from types import SimpleNamespace
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceNotModifiedError
+
+
+class FakeDownloader():
+
+    """Hands out the content of a blob in small chunks, like the async downloader."""
+
+    def __init__(self, content: bytes, etag: str, chunk_size: int = 16) -> None:
+        self.content = content
+        self.chunk_size = chunk_size
+        self.properties = SimpleNamespace(etag=etag)
+
+    async def chunks(self):
+        for position in range(0, len(self.content), self.chunk_size):
+            await asyncio.sleep(0)
+            yield self.content[position:position + self.chunk_size]
+
+
+class FakeContainer():
+
+    """Serves blobs from a dictionary and counts the downloads, like the async container client."""
+
+    def __init__(self, blobs: dict) -> None:
+        self.blobs = blobs
+        self.downloads = 0
+
+    @staticmethod
+    def etag(content: bytes) -> str:
+        """Returns the ETag of a blob, it changes whenever the content does."""
+
+        return '"{digest}"'.format(digest=hashlib.md5(content).hexdigest())
+
+    async def download_blob(self, blob: str, etag: str = None, match_condition: MatchConditions = None) -> FakeDownloader:
+
+        content = self.blobs[blob]
+        current_etag = self.etag(content=content)
+
+        if match_condition == MatchConditions.IfModified and etag == current_etag:
+            raise ResourceNotModifiedError('The blob has not changed.')
+
+        self.downloads += 1
+
+        return FakeDownloader(content=content, etag=current_etag)
@@ -0,0 +1,144 @@
+import time
+import operator
+import unittest
+import numpy as np
+
+from unittest import TestCase
+from az_functions.TradingSystemFunction.stock_frame.build import StockFrame
+from az_functions.TradingSystemFunction.indicators.build import Indicators
+from az_functions.TradingSystemFunction.backtest.build import Backtest
+
+
+class BacktestTest(TestCase):
+
+    """Will perform a unit test for the `Backtest` object."""
+
+    def setUp(self) -> None:
+        """Set up two symbols with a `score` column that triggers the signals."""
+
+        self.stock_frame = StockFrame.from_columns(
+            columns={
+                'symbol': np.repeat(np.arange(2), 5),
+                'date': np.tile(np.arange(5) * 86400, 2),
+                'open': np.array([10.0, 10.0, 11.0, 12.0, 13.0, 20.0, 21.0, 20.0, 18.0, 19.0]),
+                'close': np.array([10.0, 11.0, 12.0, 13.0, 12.0, 21.0, 20.0, 19.0, 18.0, 20.0]),
+                'score': np.array([0.0, 1.0, 0.0, -1.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0])
+            },
+            symbol_names=['AAPL', 'MSFT'],
+            date_unit='s'
+        )
+
+        self.indicators = Indicators(price_data_frame=self.stock_frame)
+        self.indicators.set_indicator_signal(
+            indicator='score',
+            buy=0.5,
+            sell=-0.5,
+            condition_buy=operator.gt,
+            condition_sell=operator.lt
+        )
+
+    def loop_equity(self, backtest: Backtest, signals: np.ndarray) -> np.ndarray:
+        """Replays the backtest one bar at a time, as a reference."""
+
+        frame = self.stock_frame.frame
+        equity = np.empty(len(frame))
+
+        for start, end in zip(self.stock_frame.symbol_offsets[:-1], self.stock_frame.symbol_offsets[1:]):
+
+            cash = backtest.initial_cash
+            target = held = 0.0
+
+            for row in range(start, end):
+
+                previous = held
+                held = target if row > start else 0.0
+                close, fill = frame['close'].iloc[row], frame['open'].iloc[row]
+
+                if row > start:
+                    cash *= 1.0 + previous * (fill / frame['close'].iloc[row - 1] - 1.0)
+
+                cash *= 1.0 - abs(held - previous) * (backtest.slippage + backtest.commission)
+                cash *= 1.0 + held * (close / fill - 1.0)
+                equity[row] = cash
+
+                if signals[row] == 1:
+                    target = 1.0
+                elif signals[row] == -1:
+                    target = 0.0
+
+        return equity
+
+    def test_positions_follow_signals_a_bar_late(self):
+        """Make sure the position changes on the bar after the signal and never crosses symbols."""
+
+        result = Backtest(indicators=self.indicators).run()
+
+        self.assertEqual(result.frame['signal'].tolist(), [0, 1, 0, -1, 0, 1, 0, 0, 0, 0])
+        self.assertEqual(result.frame['position'].tolist(), [0, 0, 1, 1, 0, 0, 1, 1, 1, 1])
+
+        trades = result.trades
+
+        self.assertEqual(trades['symbol'].tolist(), ['AAPL', 'MSFT'])
+        self.assertEqual(trades['exit_price'].isna().tolist(), [False, True])
+        self.assertEqual(result.summary['trades'].tolist(), [1, 1])
+
+    def test_matches_bar_by_bar_loop(self):
+        """Make sure the vectorized equity matches a loop over every bar."""
+
+        backtest = Backtest(indicators=self.indicators, slippage=0.001, commission=0.002)
+        result = backtest.run()
+
+        np.testing.assert_allclose(
+            result.equity.to_numpy(),
+            self.loop_equity(backtest=backtest, signals=result.frame['signal'].to_numpy())
+        )
+
+        summary = result.summary
+
+        self.assertAlmostEqual(summary.loc['MSFT', 'max_drawdown'], 1.0 - 18.0 / 21.0 * (1 - 0.003), places=6)
+
+    def test_costs_reduce_equity(self):
+        """Make sure slippage and commission lower the final equity."""
+
+        free = Backtest(indicators=self.indicators, slippage=0.0).run().summary
+        costly = Backtest(indicators=self.indicators, slippage=0.01, commission=0.01).run().summary
+
+        self.assertTrue((costly['final_equity'] < free['final_equity']).all())
+
+    def test_large_backtest_is_fast(self):
+        """Run ten years of daily bars for five hundred symbols."""
+
+        symbols, bars = 500, 2520
+        random_state = np.random.RandomState(7)
+        close = 100.0 * np.exp(np.cumsum(random_state.normal(0.0, 0.01, symbols * bars)))
+
+        stock_frame = StockFrame.from_columns(
+            columns={
+                'symbol': np.repeat(np.arange(symbols), bars),
+                'date': np.tile(np.arange(bars) * 86400, symbols),
+                'open': close * (1.0 + random_state.normal(0.0, 0.002, close.size)),
+                'close': close,
+                'score': random_state.normal(0.0, 1.0, close.size)
+            },
+            symbol_names=['S{number}'.format(number=number) for number in range(symbols)],
+            date_unit='s'
+        )
+
+        indicators = Indicators(price_data_frame=stock_frame)
+        indicators.set_indicator_signal(
+            indicator='score',
+            buy=1.5,
+            sell=-1.5,
+            condition_buy=operator.gt,
+            condition_sell=operator.lt
+        )
+
+        start = time.perf_counter()
+        result = Backtest(indicators=indicators).run()
+
+        self.assertLess(time.perf_counter() - start, 10.0)
+        self.assertEqual(len(result.summary), symbols)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import shutil
+import tempfile
+import unittest
+import pandas as pd
+
+from unittest import TestCase
+from az_functions.TradingSystemFunction.cache.build import ResultCache
+from az_functions.TradingSystemFunction.cache.build import spec_hash
+
+
+class ResultCacheTest(TestCase):
+
+    """Will perform a unit test for the `ResultCache` object."""
+
+    def setUp(self) -> None:
+        """Set up a `ResultCache` object with a disk tier."""
+
+        self.directory = tempfile.mkdtemp()
+        self.result_cache = ResultCache(max_entries=2, directory=self.directory)
+        self.spec_key = spec_hash(indicators=[{'indicator': 'rsi', 'period': 14}])
+
+    def test_spec_hash_ignores_key_order(self):
+        """Make sure the same spec written in a different order gets the same hash."""
+
+        self.assertEqual(
+            spec_hash(indicators=[{'period': 14, 'indicator': 'rsi'}]),
+            self.spec_key
+        )
+        self.assertNotEqual(
+            spec_hash(indicators=[{'indicator': 'rsi', 'period': 15}]),
+            self.spec_key
+        )
+
+    def test_least_recently_used_entry_is_dropped(self):
+        """Add three entries to a cache that holds two and make sure the oldest leaves memory."""
+
+        for symbol in ['MSFT', 'AAPL']:
+            self.result_cache.put(blob_name=symbol, spec_key=self.spec_key, etag='"1"', value=symbol)
+
+        self.result_cache.get(blob_name='MSFT', spec_key=self.spec_key)
+        self.result_cache.put(blob_name='TSLA', spec_key=self.spec_key, etag='"1"', value='TSLA')
+
+        self.assertEqual(len(self.result_cache), 2)
+        self.assertIn(('MSFT', self.spec_key), self.result_cache._entries)
+        self.assertNotIn(('AAPL', self.spec_key), self.result_cache._entries)
+
+    def test_entries_are_read_from_disk(self):
+        """Add an entry, start a new cache on the same folder and make sure it's found."""
+
+        frame = pd.DataFrame({'close': [217.69, 217.90], 'rsi': [55.0, 56.2]})
+
+        self.result_cache.put(blob_name='MSFT', spec_key=self.spec_key, etag='"2"', value=frame)
+
+        result_cache = ResultCache(directory=self.directory)
+        etag, cached_frame = result_cache.get(blob_name='MSFT', spec_key=self.spec_key)
+
+        self.assertEqual(etag, '"2"')
+        pd.testing.assert_frame_equal(cached_frame, frame)
+        self.assertIsNone(result_cache.get(blob_name='AAPL', spec_key=self.spec_key))
+
+    def test_unreadable_entry_is_a_miss(self):
+        """Write an entry that can't be unpickled and make sure it's removed and missed."""
+
+        path = self.result_cache._path(key=('MSFT', self.spec_key))
+
+        # A pickle pointing at a module that doesn't exist anymore.
+        with open(path, 'wb') as cache_file:
+            cache_file.write(b'cno_such_module\nThing\n.')
+
+        self.assertIsNone(self.result_cache.get(blob_name='MSFT', spec_key=self.spec_key))
+        self.assertFalse(os.path.exists(path))
+
+    def tearDown(self) -> None:
+        """Teardown the `ResultCache` object."""
+
+        del self.result_cache
+        shutil.rmtree(self.directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+import os
+import json
+import time
+import shutil
+import asyncio
+import operator
+import tempfile
+import unittest
+import numpy as np
+
+from unittest import TestCase
+from az_functions.TradingSystemFunction.stock_frame.build import StockFrame
+from az_functions.TradingSystemFunction.indicators.build import Indicators
+from az_functions.TradingSystemFunction.engine.build import STAGES
+from az_functions.TradingSystemFunction.engine.build import LiveEngine
+from az_functions.TradingSystemFunction.engine.build import SocketSource
+from az_functions.TradingSystemFunction.engine.build import FileReplaySource
+
+
+class LiveEngineTest(TestCase):
+
+    """Will perform a unit test for the `LiveEngine` object."""
+
+    def setUp(self) -> None:
+        """Set up a frame with twenty bars of history and ten more bars to replay."""
+
+        closes = {
+            'AAPL': np.linspace(100.0, 120.0, 30),
+            'MSFT': np.linspace(200.0, 150.0, 30)
+        }
+
+        self.stock_frame = StockFrame.from_columns(
+            columns={
+                'symbol': np.repeat(np.arange(2), 20),
+                'date': np.tile(np.arange(20) * 86400, 2),
+                'close': np.concatenate([closes['AAPL'][:20], closes['MSFT'][:20]])
+            },
+            symbol_names=['AAPL', 'MSFT'],
+            date_unit='s'
+        )
+
+        self.indicators = Indicators(price_data_frame=self.stock_frame)
+        self.indicators.sma(period=5)
+        self.indicators.set_indicator_signal_compare(
+            indicator_1='close',
+            indicator_2='sma',
+            condition_buy=operator.gt,
+            condition_sell=operator.lt
+        )
+
+        self.bars = [
+            {'symbol': symbol, 'date': str(np.datetime64(day * 86400, 's')), 'close': closes[symbol][day]}
+            for day in range(20, 30) for symbol in ['AAPL', 'MSFT']
+        ]
+
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'bars.json')
+
+        with open(self.path, 'w') as bar_file:
+            bar_file.write('\n'.join(json.dumps(bar) for bar in reversed(self.bars)))
+
+    def test_file_replay_fires_signals(self):
+        """Replay the file and make sure each date fires a buy and a sell."""
+
+        fired = []
+
+        engine = LiveEngine(
+            stock_frame=self.stock_frame,
+            indicators=self.indicators,
+            source=FileReplaySource(path=self.path)
+        )
+        engine.add_callback(callback=lambda signals, bars: fired.append(signals))
+
+        stats = asyncio.run(engine.run())
+
+        self.assertEqual(stats.bars, 20)
+        self.assertEqual(len(self.stock_frame.frame), 60)
+        self.assertGreaterEqual(len(fired), 1)
+        self.assertEqual(list(fired[-1]['buys'].index.get_level_values('symbol')), ['AAPL'])
+        self.assertEqual(list(fired[-1]['sells'].index.get_level_values('symbol')), ['MSFT'])
+
+        np.testing.assert_allclose(
+            self.stock_frame.frame.loc['AAPL', 'sma'].to_numpy()[-1],
+            np.linspace(100.0, 120.0, 30)[-5:].mean()
+        )
+
+    def test_socket_source_and_latency_stats(self):
+        """Serve the bars over a local socket and make sure every stage is timed."""
+
+        fired = []
+
+        async def handle(reader, writer):
+            for position in range(0, len(self.bars), 2):
+                writer.write((json.dumps(self.bars[position:position + 2]) + '\n').encode('utf-8'))
+                await writer.drain()
+            writer.close()
+
+        async def callback(signals, bars):
+            fired.append({bar['symbol'] for bar in bars})
+
+        async def replay():
+            server = await asyncio.start_server(handle, host='127.0.0.1', port=0)
+            port = server.sockets[0].getsockname()[1]
+
+            engine = LiveEngine(
+                stock_frame=self.stock_frame,
+                indicators=self.indicators,
+                source=SocketSource(host='127.0.0.1', port=port)
+            )
+            engine.add_callback(callback=callback)
+
+            async with server:
+                return await engine.run()
+
+        stats = asyncio.run(replay())
+        summary = stats.summary()
+
+        self.assertEqual(stats.bars, 20)
+        self.assertEqual(list(summary.index), STAGES)
+        self.assertTrue((summary['max'] >= 0.0).all())
+        self.assertTrue(all(symbols == {'AAPL', 'MSFT'} for symbols in fired))
+
+    def test_latency_counts_bars_waiting_on_a_slow_batch(self):
+        """Stall every refresh and make sure the bars that arrive meanwhile are timed from their arrival."""
+
+        refresh = self.indicators.refresh
+
+        def slow_refresh(incremental: bool = False):
+            time.sleep(0.05)
+            return refresh(incremental=incremental)
+
+        self.indicators.refresh = slow_refresh
+
+        async def handle(reader, writer):
+            for position in range(0, len(self.bars), 2):
+                writer.write((json.dumps(self.bars[position:position + 2]) + '\n').encode('utf-8'))
+                await writer.drain()
+                await asyncio.sleep(0.01)
+            writer.close()
+
+        async def replay():
+            server = await asyncio.start_server(handle, host='127.0.0.1', port=0)
+            port = server.sockets[0].getsockname()[1]
+
+            engine = LiveEngine(
+                stock_frame=self.stock_frame,
+                indicators=self.indicators,
+                source=SocketSource(host='127.0.0.1', port=port),
+                latency_budget=0.06
+            )
+
+            async with server:
+                return await engine.run()
+
+        stats = asyncio.run(replay())
+
+        self.assertEqual(stats.bars, 20)
+        self.assertLess(stats.batches, 10)
+        self.assertGreater(max(stats.timings['queue']), 0.02)
+        self.assertGreater(stats.over_budget, 0)
+
+    def tearDown(self) -> None:
+        """Remove the bar file."""
+
+        shutil.rmtree(self.folder)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,483 @@
+import unittest
+import warnings
+import numpy as np
+import pandas as pd
+
+from unittest import TestCase
+from az_functions.TradingSystemFunction.stock_frame.build import StockFrame
+from az_functions.TradingSystemFunction.indicators.build import Indicators
+from az_functions.TradingSystemFunction.indicators.kernels import linear_scan
+from az_functions.TradingSystemFunction.indicators.kernels import lookback_bars
+from az_functions.TradingSystemFunction.indicators.kernels import rolling_moments
+from az_functions.TradingSystemFunction.indicators.kernels import _rolling_moments_loop
+from az_functions.TradingSystemFunction.indicators.kernels import segmented_scan
+from az_functions.TradingSystemFunction.indicators.parallel import balanced_shards
+
+
+def build_stock_frame(size: int = 500) -> StockFrame:
+    """Builds a StockFrame with a random walk for three symbols."""
+
+    random_state = np.random.RandomState(seed=7)
+
+    return StockFrame.from_columns(
+        columns={
+            'symbol': np.repeat(np.arange(3), size),
+            'date': np.tile(np.arange(size) * 86400, 3),
+            'open': 100 + np.cumsum(random_state.normal(size=3 * size)),
+            'high': 101 + np.cumsum(random_state.normal(size=3 * size)),
+            'low': 99 + np.cumsum(random_state.normal(size=3 * size)),
+            'close': 100 + np.cumsum(random_state.normal(size=3 * size)),
+            'volume': random_state.randint(1000, 100000, size=3 * size)
+        },
+        symbol_names=['AAPL', 'MSFT', 'TSLA'],
+        date_unit='s'
+    )
+
+
+class IndicatorsTest(TestCase):
+
+    """Will perform a unit test for the `Indicators` object."""
+
+    def setUp(self) -> None:
+        """Set up the `Indicators` object."""
+
+        self.stock_frame = build_stock_frame()
+        self.indicators = Indicators(price_data_frame=self.stock_frame)
+
+    def test_creates_instance_of_indicators(self):
+        """Create an instance and make sure it's a `Indicators` object."""
+
+        self.assertIsInstance(self.indicators, Indicators)
+
+    def test_compute_matches_indicator_methods(self):
+        """Calculate the indicators in a batch and compare them to the single methods."""
+
+        self.indicators.rsi(period=14)
+        self.indicators.sma(period=20)
+        self.indicators.ema(period=10)
+        self.indicators.rate_of_change(period=5)
+
+        expected = self.indicators.price_data_frame[['rsi', 'sma', 'ema', 'rate_of_change']].copy()
+
+        batch_indicators = Indicators(price_data_frame=build_stock_frame())
+        price_data_frame = batch_indicators.compute(
+            indicators=[
+                {'indicator': 'rsi', 'period': 14},
+                {'indicator': 'sma', 'period': 20},
+                {'indicator': 'ema', 'period': 10},
+                {'indicator': 'rate_of_change', 'period': 5}
+            ]
+        )
+
+        pd.testing.assert_frame_equal(
+            price_data_frame[['rsi', 'sma', 'ema', 'rate_of_change']],
+            expected,
+            rtol=1e-9
+        )
+
+    def test_compute_rejects_unknown_indicators(self):
+        """Make sure an indicator without a kernel raises an error."""
+
+        with self.assertRaises(ValueError):
+            self.indicators.compute(indicators=[{'indicator': 'mass_index', 'period': 9}])
+
+    def test_refresh_recomputes_batch_indicators(self):
+        """Calculate a batch, then refresh it and make sure the columns are kept."""
+
+        self.indicators.compute(indicators=[{'indicator': 'sma', 'period': 5, 'column_name': 'sma_5'}])
+        expected = self.indicators.price_data_frame['sma_5'].copy()
+
+        self.indicators.refresh()
+
+        pd.testing.assert_series_equal(self.indicators.price_data_frame['sma_5'], expected)
+
+    def test_incremental_refresh_matches_full_refresh(self):
+        """Grow the frame, refresh incrementally and compare it to a full calculation."""
+
+        self.indicators.rsi(period=14)
+        self.indicators.sma(period=20)
+        self.indicators.bollinger_bands(period=20)
+        self.indicators.average_true_range(period=14)
+
+        expected = self.indicators.price_data_frame.copy()
+
+        # Start from the first 400 rows of each symbol.
+        stock_frame = build_stock_frame()
+        full_frame = stock_frame.frame
+        offsets = stock_frame.symbol_offsets
+        rows = np.concatenate([np.arange(start, start + 400) for start in offsets[:-1]])
+        stock_frame._set_frame(price_df=full_frame.iloc[rows].copy())
+
+        indicators = Indicators(price_data_frame=stock_frame)
+        indicators.rsi(period=14)
+        indicators.sma(period=20)
+        indicators.bollinger_bands(period=20)
+        indicators.average_true_range(period=14)
+        indicators.refresh(incremental=True)
+
+        # Add the last 100 rows of each symbol, a few bars at a time.
+        new_rows = full_frame.drop(index=full_frame.index[rows])
+        bars = [
+            dict(symbol=symbol, date=date, **values)
+            for (symbol, date), values in zip(new_rows.index, new_rows.to_dict(orient='records'))
+        ]
+
+        for position in range(0, len(bars), 30):
+            stock_frame.add_rows(data=bars[position:position + 30])
+            indicators.refresh(incremental=True)
+
+        for column in ['rsi', 'sma', 'band_upper', 'band_mid', 'band_lower', 'average_true_range']:
+            pd.testing.assert_series_equal(
+                indicators.price_data_frame[column],
+                expected[column],
+                rtol=1e-7
+            )
+
+    def test_lookback_warms_up_indicators(self):
+        """Calculate the indicators from the lookback alone and compare them to the full history."""
+
+        specs = [{'indicator': 'sma', 'period': 20}, {'indicator': 'ema', 'period': 10}]
+        lookback = lookback_bars(indicators=specs)
+
+        self.assertGreaterEqual(lookback, 19)
+        self.assertIsNone(lookback_bars(indicators=[{'indicator': 'macd'}]))
+
+        expected = self.indicators.compute(indicators=specs).loc['AAPL'].iloc[-50:]
+
+        # Keep the last 50 bars and the lookback before them.
+        history = self.stock_frame.frame.loc[['AAPL']].iloc[-(50 + lookback):]
+
+        trimmed = Indicators(
+            price_data_frame=StockFrame.from_columns(
+                columns={
+                    'symbol': history.index.get_level_values('symbol'),
+                    'date': history.index.get_level_values('date'),
+                    'close': history['close'].to_numpy()
+                }
+            )
+        ).compute(indicators=specs).iloc[-50:]
+
+        np.testing.assert_allclose(trimmed['sma'], expected['sma'], rtol=1e-9)
+        np.testing.assert_allclose(trimmed['ema'], expected['ema'], rtol=1e-4)
+
+    def test_rsi_uses_wilders_smoothing(self):
+        """Calculate the RSI and compare it to Wilder's definition, one symbol at a time."""
+
+        price_data_frame = self.indicators.rsi(period=14)
+
+        for symbol in ['AAPL', 'TSLA']:
+
+            close = price_data_frame.loc[symbol, 'close'].to_numpy()
+            change = np.diff(close)
+
+            up_moves = np.where(change > 0, change, 0.0)
+            down_moves = np.where(change < 0, -change, 0.0)
+
+            expected = np.full(close.size, np.nan)
+            average_up = up_moves[:14].mean()
+            average_down = down_moves[:14].mean()
+            expected[14] = 100.0 - 100.0 / (1.0 + average_up / average_down)
+
+            for position in range(14, change.size):
+                average_up = (average_up * 13 + up_moves[position]) / 14
+                average_down = (average_down * 13 + down_moves[position]) / 14
+                expected[position + 1] = 100.0 - 100.0 / (1.0 + average_up / average_down)
+
+            np.testing.assert_allclose(price_data_frame.loc[symbol, 'rsi'], expected, rtol=1e-9)
+
+    def test_average_true_range_stays_inside_each_symbol(self):
+        """Calculate the ATR for all the symbols and compare it to each symbol on its own."""
+
+        price_data_frame = self.indicators.average_true_range(period=14)
+
+        for symbol in ['MSFT', 'TSLA']:
+
+            history = self.stock_frame.frame.loc[[symbol]]
+            single = Indicators(
+                price_data_frame=StockFrame.from_columns(
+                    columns={
+                        'symbol': history.index.get_level_values('symbol'),
+                        'date': history.index.get_level_values('date'),
+                        'high': history['high'].to_numpy(),
+                        'low': history['low'].to_numpy(),
+                        'close': history['close'].to_numpy()
+                    }
+                )
+            ).average_true_range(period=14)
+
+            np.testing.assert_allclose(
+                price_data_frame.loc[symbol, 'average_true_range'],
+                single['average_true_range'],
+                rtol=1e-9
+            )
+
+    def test_segmented_scan_starts_over_at_each_symbol(self):
+        """Run the filter over several segments and compare it to filtering each one alone."""
+
+        inputs = np.random.RandomState(seed=3).normal(size=700)
+        offsets = np.array([0, 5, 250, 251, 700])
+
+        expected = np.concatenate([
+            linear_scan(inputs=inputs[start:end], decay=0.9)
+            for start, end in zip(offsets[:-1], offsets[1:])
+        ])
+
+        np.testing.assert_allclose(
+            segmented_scan(inputs=inputs, decay=0.9, starts=offsets[:-1]),
+            expected,
+            rtol=1e-9,
+            atol=1e-12
+        )
+
+    def test_bollinger_bands_match_rolling_moments(self):
+        """Calculate the Bollinger Bands and compare them to the rolling mean and standard deviation."""
+
+        price_data_frame = self.indicators.bollinger_bands(period=20, num_std=2.5)
+        rolling = self.stock_frame.frame.groupby(level='symbol')['close'].rolling(window=20)
+
+        moving_avg = rolling.mean().droplevel(0)
+        moving_std = rolling.std().droplevel(0)
+
+        np.testing.assert_allclose(price_data_frame['band_mid'], moving_avg, rtol=1e-9)
+        np.testing.assert_allclose(price_data_frame['band_upper'], moving_avg + 2.5 * moving_std, rtol=1e-9)
+        np.testing.assert_allclose(price_data_frame['band_lower'], moving_avg - 2.5 * moving_std, rtol=1e-9)
+
+    def test_welford_loop_matches_rolling_sums(self):
+        """Run the rolling moments loop and compare it to the running sums, including a missing value."""
+
+        values = 1000 + np.random.RandomState(seed=5).normal(size=300)
+        values[40] = np.nan
+        offsets = np.array([0, 120, 300])
+
+        means = np.empty(values.size)
+        stds = np.empty(values.size)
+        _rolling_moments_loop(values, 10, np.arange(values.size) - np.repeat([0, 120], [120, 180]), means, stds)
+
+        expected_means, expected_stds = rolling_moments(values=values, window=10, offsets=offsets)
+
+        np.testing.assert_allclose(means, expected_means, rtol=1e-9)
+        np.testing.assert_allclose(stds, expected_stds, rtol=1e-7)
+        self.assertTrue(np.isnan(means[40:50]).all())
+
+    def test_shift_based_indicators_stay_inside_each_symbol(self):
+        """Calculate the shift and EWM based indicators for all the symbols and compare them to one symbol alone."""
+
+        def add_indicators(indicators: Indicators) -> pd.DataFrame:
+            indicators.macd(fast_period=12, slow_period=26)
+            indicators.mass_index(period=9)
+            indicators.force_index(period=3)
+            indicators.ease_of_movement(period=5)
+            indicators.chaikin_oscillator(period=3)
+            indicators.commodity_channel_index(period=10)
+            return indicators.kst_oscillator(r1=10, r2=15, r3=20, r4=30, n1=10, n2=10, n3=10, n4=15)
+
+        columns = [
+            'macd_fast', 'macd_slow', 'macd', 'mass_index', 'force_index', 'ease_of_movement',
+            'chaikin_oscillator', 'commodity_channel_index', 'kst_oscillator', 'kst_oscillator_signal'
+        ]
+
+        price_data_frame = add_indicators(indicators=self.indicators)
+
+        history = self.stock_frame.frame.loc[['MSFT']]
+        single = add_indicators(
+            indicators=Indicators(
+                price_data_frame=StockFrame.from_columns(
+                    columns=dict(
+                        symbol=history.index.get_level_values('symbol'),
+                        date=history.index.get_level_values('date'),
+                        **{column: history[column].to_numpy() for column in ['open', 'high', 'low', 'close', 'volume']}
+                    )
+                )
+            )
+        )
+
+        pd.testing.assert_frame_equal(
+            price_data_frame.loc[['MSFT'], columns],
+            single[columns],
+            rtol=1e-9
+        )
+
+        # The first bars of a symbol don't see the previous symbol's prices.
+        self.assertTrue(np.isnan(price_data_frame.loc['MSFT', 'force_index'].iloc[:3]).all())
+
+        # The MACD still matches the exponentially weighted means of each symbol.
+        expected_fast = self.stock_frame.frame.groupby(level='symbol')['close'].transform(
+            lambda x: x.ewm(span=12, min_periods=12).mean()
+        )
+        np.testing.assert_allclose(price_data_frame['macd_fast'], expected_fast, rtol=1e-9)
+
+    def test_stochastic_oscillator_matches_definition(self):
+        """Calculate the Stochastic Oscillator and compare it to where the close sits in the bar's range."""
+
+        price_data_frame = self.indicators.stochastic_oscillator()
+        frame = self.stock_frame.frame
+
+        np.testing.assert_allclose(
+            price_data_frame['stochastic_oscillator'],
+            (frame['close'] - frame['low']) / (frame['high'] - frame['low']),
+            rtol=1e-12
+        )
+
+    def test_commodity_channel_index_matches_definition(self):
+        """Calculate the Commodity Channel Index and compare it to the mean deviation definition."""
+
+        price_data_frame = self.indicators.commodity_channel_index(period=10)
+        frame = self.stock_frame.frame
+
+        typical_price = (frame['high'] + frame['low'] + frame['close']) / 3
+        rolling = typical_price.groupby(level='symbol').rolling(10)
+        mean = rolling.mean().droplevel(0)
+        mean_deviation = rolling.apply(lambda x: np.abs(x - x.mean()).mean(), raw=True).droplevel(0)
+
+        np.testing.assert_allclose(
+            price_data_frame['commodity_channel_index'],
+            (typical_price - mean) / (0.015 * mean_deviation),
+            rtol=1e-9,
+            atol=1e-6
+        )
+
+    def test_sweep_matches_single_periods(self):
+        """Sweep the indicators over several periods and compare each column to the single method."""
+
+        periods = [5, 14, 30]
+
+        sma_block = self.indicators.sweep(indicator='sma', periods=periods)
+        ema_block = self.indicators.sweep(indicator='ema', periods=periods)
+        rsi_block = self.indicators.sweep(indicator='rsi', periods=periods)
+        band_block = self.indicators.sweep(indicator='bollinger_bands', periods=periods, num_std=1.5)
+
+        self.assertEqual(sma_block.shape, (1500, 3))
+        self.assertEqual(list(band_block.columns[:3]), ['band_upper_5', 'band_upper_14', 'band_upper_30'])
+        self.assertIn('rsi_30', self.indicators.price_data_frame.columns)
+
+        single = Indicators(price_data_frame=build_stock_frame())
+
+        for period in periods:
+
+            price_data_frame = single.sma(period=period)
+            price_data_frame = single.ema(period=period)
+            price_data_frame = single.rsi(period=period)
+            price_data_frame = single.bollinger_bands(period=period, num_std=1.5)
+
+            np.testing.assert_allclose(sma_block['sma_{}'.format(period)], price_data_frame['sma'], rtol=1e-9)
+            np.testing.assert_allclose(ema_block['ema_{}'.format(period)], price_data_frame['ema'], rtol=1e-9)
+            np.testing.assert_allclose(rsi_block['rsi_{}'.format(period)], price_data_frame['rsi'], rtol=1e-9)
+
+            for band in ['band_upper', 'band_mid', 'band_lower']:
+                np.testing.assert_allclose(
+                    band_block['{}_{}'.format(band, period)],
+                    price_data_frame[band],
+                    rtol=1e-9
+                )
+
+        with self.assertRaises(ValueError):
+            self.indicators.sweep(indicator='macd', periods=periods)
+
+    def test_batch_adds_the_columns_at_once(self):
+        """Run several indicators in a batch and make sure only their outputs are added, at the end."""
+
+        columns = list(self.stock_frame.frame.columns)
+
+        with self.indicators.batch() as context:
+
+            self.indicators.rsi(period=14)
+            self.indicators.macd(fast_period=12, slow_period=26)
+            self.indicators.bollinger_bands(period=20)
+
+            # Nothing is added until the batch is over.
+            self.assertEqual(list(self.indicators.price_data_frame.columns), columns)
+            self.assertEqual(len(context), 8)
+
+        price_data_frame = self.indicators.price_data_frame
+
+        self.assertEqual(
+            list(price_data_frame.columns),
+            columns + ['rsi', 'macd_fast', 'macd_slow', 'macd_diff', 'macd', 'band_upper', 'band_mid', 'band_lower']
+        )
+
+        single = Indicators(price_data_frame=build_stock_frame())
+        single.rsi(period=14)
+        single.macd(fast_period=12, slow_period=26)
+        expected = single.bollinger_bands(period=20)
+
+        pd.testing.assert_frame_equal(price_data_frame, expected[price_data_frame.columns])
+
+    def test_many_indicators_dont_fragment_the_frame(self):
+        """Add a lot of indicators and make sure pandas doesn't warn about a fragmented frame."""
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', pd.errors.PerformanceWarning)
+
+            with self.indicators.batch():
+                for period in range(2, 150):
+                    self.indicators.sma(period=period, column_name='sma_{}'.format(period))
+                    self.indicators.rate_of_change(period=period, column_name='roc_{}'.format(period))
+
+            self.indicators.price_data_frame['close_copy'] = self.indicators.price_data_frame['close']
+
+        self.assertEqual(self.indicators.price_data_frame.shape[1], 5 + 2 * 148 + 1)
+
+    def test_plan_shares_intermediate_steps(self):
+        """Plan indicators with steps in common and make sure each one is only there once."""
+
+        indicators = [
+            {'indicator': 'ema', 'period': 12},
+            {'indicator': 'macd', 'fast_period': 12, 'slow_period': 26},
+            {'indicator': 'rsi', 'period': 14},
+            {'indicator': 'change_in_price'},
+            {'indicator': 'sma', 'period': 20},
+            {'indicator': 'bollinger_bands', 'period': 20}
+        ]
+
+        indicator_plan = self.indicators.plan(indicators=indicators)
+        steps = [key[0] for key in indicator_plan.order()]
+
+        # The EMA and the fast MACD share an EWMA, the RSI and the change in price a diff.
+        self.assertEqual(steps.count('ewm'), 3)
+        self.assertEqual(steps.count('diff'), 1)
+        self.assertEqual(steps.count('rolling_moments'), 1)
+        self.assertIn('8 steps', self.indicators.explain(indicators=indicators[:2]))
+
+        self.indicators.compute(indicators=indicators)
+
+        single = Indicators(price_data_frame=build_stock_frame())
+        single.ema(period=12)
+        single.macd(fast_period=12, slow_period=26)
+        single.rsi(period=14)
+        single.change_in_price()
+        single.sma(period=20)
+        expected = single.bollinger_bands(period=20)
+
+        pd.testing.assert_frame_equal(self.indicators.price_data_frame, expected)
+
+        with self.assertRaises(ValueError):
+            self.indicators.explain(indicators=[{'indicator': 'mass_index'}])
+
+    def test_parallel_compute_matches_single_process(self):
+        """Calculate the indicators on a process pool and compare them to a single process."""
+
+        indicators = [
+            {'indicator': 'rsi', 'period': 14},
+            {'indicator': 'macd', 'fast_period': 12, 'slow_period': 26},
+            {'indicator': 'average_true_range', 'period': 14}
+        ]
+
+        self.assertEqual(
+            balanced_shards(offsets=np.array([0, 10, 12, 20, 40]), shards=2),
+            [(0, 3), (3, 4)]
+        )
+
+        expected = Indicators(price_data_frame=build_stock_frame()).compute(indicators=indicators)
+        price_data_frame = self.indicators.compute(indicators=indicators, workers=2)
+
+        pd.testing.assert_frame_equal(price_data_frame, expected)
+
+    def tearDown(self) -> None:
+        """Teardown the `Indicators` object."""
+
+        del self.indicators
+        del self.stock_frame
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+import asyncio
+import unittest
+import numpy as np
+
+from unittest import TestCase
+from az_functions.TradingSystemFunction.loaders.build import BOM
+from az_functions.TradingSystemFunction.loaders.build import NdjsonColumnReader
+from az_functions.TradingSystemFunction.loaders.build import read_ndjson_columns
+from az_functions.TradingSystemFunction.loaders.build import download_price_blobs
+from az_functions.TradingSystemFunction.loaders.build import download_changed_price_blobs
+from az_functions.TradingSystemFunction.stock_frame.build import StockFrame
+from fakes import FakeContainer
+
+
+class NdjsonColumnReaderTest(TestCase):
+
+    """Will perform a unit test for the `NdjsonColumnReader` object."""
+
+    def setUp(self) -> None:
+        """Set up a small price file."""
+
+        self.content = BOM + (
+            b'{"symbol":"MSFT","date":"2021-01-04","close":217.69,"volume":37130100,"label":"Jan 4"}\r\n'
+            b'{"symbol":"MSFT","date":"2021-01-05","close":217.9,"volume":23823000,"label":"Jan 5"}\r\n'
+            b'{"symbol":"MSFT","date":"2021-01-06","close":212.25,"volume":35930700}\r\n'
+        )
+
+    def test_reads_columns_from_single_chunk(self):
+        """Read the whole file in one chunk and make sure the columns line up."""
+
+        columns = read_ndjson_columns(chunks=[self.content])
+
+        self.assertEqual(columns['symbol'], ['MSFT', 'MSFT', 'MSFT'])
+        self.assertEqual(columns['label'], ['Jan 4', 'Jan 5', None])
+        self.assertEqual(columns['close'].dtype, np.float64)
+        self.assertEqual(columns['volume'].dtype, np.int64)
+        np.testing.assert_allclose(columns['close'], [217.69, 217.9, 212.25])
+
+    def test_reads_columns_from_small_chunks(self):
+        """Split the file into tiny chunks, including one inside the BOM."""
+
+        reader = NdjsonColumnReader()
+
+        for position in range(0, len(self.content), 2):
+            reader.feed(chunk=self.content[position:position + 2])
+
+        columns = reader.close()
+
+        self.assertEqual(reader.row_count, 3)
+        self.assertEqual(columns['date'], ['2021-01-04', '2021-01-05', '2021-01-06'])
+
+    def test_reads_file_without_trailing_newline(self):
+        """Make sure the last record is kept when the file doesn't end in a newline."""
+
+        columns = read_ndjson_columns(chunks=[self.content.rstrip()])
+
+        self.assertEqual(len(columns['close']), 3)
+
+    def test_date_only_end_keeps_the_whole_day(self):
+        """Read minute bars with a date alone as `end` and make sure the last day is kept whole."""
+
+        content = (
+            b'{"date":"2021-01-04T15:59:00","close":217.69}\n'
+            b'{"date":"2021-01-05T09:30:00","close":217.50}\n'
+            b'{"date":"2021-01-05T15:59:00","close":217.90}\n'
+            b'{"date":"2021-01-06T09:30:00","close":212.25}\n'
+        )
+
+        reader = NdjsonColumnReader(end='2021-01-05')
+        columns = read_ndjson_columns(chunks=[content], reader=reader)
+
+        self.assertEqual(columns['close'].tolist(), [217.69, 217.50, 217.90])
+        self.assertTrue(reader.past_end)
+
+        columns = read_ndjson_columns(
+            chunks=[content],
+            reader=NdjsonColumnReader(end='2021-01-05T09:30:00')
+        )
+
+        self.assertEqual(columns['close'].tolist(), [217.69, 217.50])
+
+    def test_missing_integers_stay_float(self):
+        """Read a null volume and a column first seen mid file and make sure the gaps stay `NaN`."""
+
+        columns = read_ndjson_columns(
+            chunks=[
+                b'{"date":"2021-01-04","volume":100}\n'
+                b'{"date":"2021-01-05","volume":null}\n'
+                b'{"date":"2021-01-06","volume":5,"trades":3}\n'
+            ]
+        )
+
+        self.assertEqual(columns['volume'].dtype, np.float64)
+        self.assertEqual(columns['trades'].dtype, np.float64)
+        np.testing.assert_array_equal(columns['volume'], [100.0, np.nan, 5.0])
+        np.testing.assert_array_equal(columns['trades'], [np.nan, np.nan, 3.0])
+
+    def test_reads_date_range_and_columns(self):
+        """Read one day with a single day of lookback and make sure the rest is skipped."""
+
+        reader = NdjsonColumnReader(columns=['close'], start='2021-01-05', end='2021-01-05', lookback=1)
+        columns = read_ndjson_columns(chunks=[self.content], reader=reader)
+
+        self.assertEqual(sorted(columns), ['close', 'date', 'symbol'])
+        self.assertEqual(columns['date'], ['2021-01-04', '2021-01-05'])
+        self.assertTrue(reader.past_end)
+
+    def test_downloads_several_symbols(self):
+        """Download two symbols at once and build a single frame from them."""
+
+        container = FakeContainer(
+            blobs={
+                'iex-price-history/MSFT.json': self.content,
+                'iex-price-history/AAPL.json': (
+                    b'{"date":"2021-01-04","close":129.41,"volume":143301900}\n'
+                    b'{"date":"2021-01-05","close":131.01,"volume":97664900}\n'
+                )
+            }
+        )
+
+        columns = asyncio.run(
+            download_price_blobs(container_client=container, symbols=['MSFT', 'AAPL'])
+        )
+
+        self.assertEqual(columns['symbol'].tolist(), [0, 0, 0, 1, 1])
+        self.assertEqual(columns['volume'].dtype, np.int64)
+        self.assertEqual(columns['label'], ['Jan 4', 'Jan 5', None, None, None])
+
+        stock_frame = StockFrame.from_columns(columns=columns, symbol_names=['MSFT', 'AAPL'])
+
+        self.assertEqual(list(stock_frame.symbols), ['AAPL', 'MSFT'])
+        self.assertEqual(stock_frame.frame.loc['AAPL', 'close'].tolist(), [129.41, 131.01])
+
+    def test_skips_unchanged_blobs(self):
+        """Pass the ETag of one blob and make sure only the other one is downloaded."""
+
+        container = FakeContainer(
+            blobs={
+                'iex-price-history/MSFT.json': self.content,
+                'iex-price-history/AAPL.json': b'{"date":"2021-01-04","close":129.41}\n'
+            }
+        )
+
+        first = asyncio.run(
+            download_changed_price_blobs(container_client=container, symbols=['MSFT', 'AAPL'])
+        )
+        second = asyncio.run(
+            download_changed_price_blobs(
+                container_client=container,
+                symbols=['MSFT', 'AAPL'],
+                etags={'MSFT': first['MSFT'][1]}
+            )
+        )
+
+        self.assertIsNone(second['MSFT'][0])
+        self.assertEqual(second['MSFT'][1], first['MSFT'][1])
+        self.assertEqual(second['AAPL'][0]['close'].tolist(), [129.41])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+
+from unittest import TestCase
+from az_functions.TradingSystemFunction.loaders.parquet import pq
+from az_functions.TradingSystemFunction.loaders.parquet import write_price_dataset
+from az_functions.TradingSystemFunction.loaders.parquet import read_price_dataset
+from az_functions.TradingSystemFunction.loaders.parquet import _lookback_span
+from az_functions.TradingSystemFunction.stock_frame.build import StockFrame
+
+
+@unittest.skipIf(pq is None, 'pyarrow is not installed.')
+class ParquetPriceDatasetTest(TestCase):
+
+    """Will perform a unit test for the Parquet price dataset."""
+
+    def setUp(self) -> None:
+        """Write two symbols that span two years."""
+
+        self.root_path = tempfile.mkdtemp()
+
+        self.columns = {
+            'symbol': ['MSFT', 'AAPL', 'MSFT', 'AAPL', 'MSFT'],
+            'date': ['2021-01-04', '2020-12-31', '2020-12-31', '2021-01-04', '2021-01-05'],
+            'close': np.array([217.69, 132.69, 222.42, 129.41, 217.90]),
+            'volume': np.array([37130100, 99116600, 20942100, 143301900, 23823000]),
+            'label': ['Jan 4', 'Dec 31', 'Dec 31', 'Jan 4', 'Jan 5']
+        }
+
+        self.paths = write_price_dataset(columns=self.columns, root_path=self.root_path)
+
+    def test_writes_partitions_with_compact_types(self):
+        """Make sure each symbol and year gets its own file with the compact types."""
+
+        self.assertEqual(len(self.paths), 4)
+        self.assertTrue(any('symbol=MSFT/year=2021' in path for path in self.paths))
+
+        schema = pq.read_schema(self.paths[0])
+
+        self.assertEqual(str(schema.field('close').type), 'float')
+        self.assertEqual(str(schema.field('volume').type), 'int64')
+        self.assertNotIn('label', schema.names)
+
+    def test_reads_selected_symbols_and_columns(self):
+        """Read one symbol and one column back and make sure the dates are in order."""
+
+        columns, symbol_names = read_price_dataset(
+            root_path=self.root_path,
+            symbols=['MSFT'],
+            columns=['close']
+        )
+
+        self.assertEqual(symbol_names, ['MSFT'])
+        self.assertEqual(sorted(columns), ['close', 'date', 'symbol'])
+        np.testing.assert_allclose(columns['close'], [222.42, 217.69, 217.90], rtol=1e-6)
+
+    def test_reads_date_range_with_lookback(self):
+        """Read from the new year with one bar of lookback for each symbol."""
+
+        columns, symbol_names = read_price_dataset(
+            root_path=self.root_path,
+            start='2021-01-04',
+            end='2021-01-04',
+            lookback=1
+        )
+
+        self.assertEqual(symbol_names, ['AAPL', 'MSFT'])
+        self.assertEqual(columns['symbol'].tolist(), [0, 0, 1, 1])
+        self.assertEqual(
+            columns['date'].astype('datetime64[D]').astype(str).tolist(),
+            ['2020-12-31', '2021-01-04', '2020-12-31', '2021-01-04']
+        )
+
+    def test_lookback_window_follows_the_bar_interval(self):
+        """Make sure minute bars read a day or so early and daily bars read a few months early."""
+
+        self.assertLess(_lookback_span(lookback=100, bar_interval='1min'), pd.Timedelta(days=7))
+        self.assertGreater(_lookback_span(lookback=100, bar_interval='1D'), pd.Timedelta(days=140))
+        self.assertEqual(_lookback_span(lookback=0, bar_interval='1D'), pd.Timedelta(0))
+
+    def test_lookback_reads_past_a_gap(self):
+        """Leave a year long gap before `start` and make sure the lookback bars are still found."""
+
+        root_path = tempfile.mkdtemp()
+
+        try:
+            write_price_dataset(
+                columns={
+                    'symbol': ['MSFT'] * 4,
+                    'date': ['2019-06-03', '2019-06-04', '2020-12-31', '2021-01-04'],
+                    'close': np.array([123.16, 125.83, 222.42, 217.69])
+                },
+                root_path=root_path
+            )
+
+            columns, _ = read_price_dataset(root_path=root_path, start='2021-01-04', lookback=2)
+
+        finally:
+            shutil.rmtree(root_path)
+
+        np.testing.assert_allclose(columns['close'], [125.83, 222.42, 217.69], rtol=1e-6)
+
+    def test_date_only_end_keeps_the_whole_day(self):
+        """Write minute bars and make sure a date alone as `end` keeps the bars after midnight."""
+
+        root_path = tempfile.mkdtemp()
+
+        try:
+            write_price_dataset(
+                columns={
+                    'symbol': ['MSFT'] * 4,
+                    'date': ['2021-01-04 15:59:00', '2021-01-05 09:30:00', '2021-01-05 15:59:00', '2021-01-06 09:30:00'],
+                    'close': np.array([217.69, 217.50, 217.90, 212.25])
+                },
+                root_path=root_path
+            )
+
+            whole_day, _ = read_price_dataset(root_path=root_path, end='2021-01-05')
+            up_to_time, _ = read_price_dataset(root_path=root_path, end='2021-01-05 09:30:00')
+
+        finally:
+            shutil.rmtree(root_path)
+
+        np.testing.assert_allclose(whole_day['close'], [217.69, 217.50, 217.90], rtol=1e-6)
+        np.testing.assert_allclose(up_to_time['close'], [217.69, 217.50], rtol=1e-6)
+
+    def test_stock_frame_from_parquet(self):
+        """Load the whole dataset into a StockFrame."""
+
+        stock_frame = StockFrame.from_parquet(root_path=self.root_path)
+
+        self.assertEqual(list(stock_frame.symbols), ['AAPL', 'MSFT'])
+        self.assertEqual(stock_frame.frame.loc['AAPL', 'volume'].tolist(), [99116600, 143301900])
+
+    def tearDown(self) -> None:
+        """Remove the dataset."""
+
+        shutil.rmtree(self.root_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
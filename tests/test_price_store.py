@@ -0,0 +1,120 @@
+import shutil
+import asyncio
+import tempfile
+import unittest
+import numpy as np
+
+from unittest import TestCase
+from az_functions.TradingSystemFunction.price_store.build import PriceStore
+from az_functions.TradingSystemFunction.stock_frame.build import StockFrame
+from fakes import FakeContainer
+
+
+class PriceStoreTest(TestCase):
+
+    """Will perform a unit test for the `PriceStore` object."""
+
+    def setUp(self) -> None:
+        """Set up an empty store and the price history of two symbols."""
+
+        self.root_path = tempfile.mkdtemp()
+        self.price_store = PriceStore(root_path=self.root_path)
+
+        self.container = FakeContainer(
+            blobs={
+                'iex-price-history/MSFT.json': (
+                    b'{"symbol":"MSFT","date":"2021-01-04","close":217.69,"volume":37130100,"label":"Jan 4"}\n'
+                    b'{"symbol":"MSFT","date":"2021-01-05","close":217.90,"volume":23823000,"label":"Jan 5"}\n'
+                    b'{"symbol":"MSFT","date":"2021-01-06","close":212.25,"volume":35930700,"label":"Jan 6"}\n'
+                ),
+                'iex-price-history/AAPL.json': (
+                    b'{"symbol":"AAPL","date":"2021-01-04","close":129.41,"volume":143301900}\n'
+                    b'{"symbol":"AAPL","date":"2021-01-05","close":131.01,"volume":97664900}\n'
+                )
+            }
+        )
+
+    def test_sync_only_downloads_changed_blobs(self):
+        """Sync twice and make sure the second sync doesn't download anything."""
+
+        etags = asyncio.run(self.price_store.sync(container_client=self.container, symbols=['MSFT', 'AAPL']))
+
+        self.assertEqual(self.container.downloads, 2)
+        self.assertEqual(self.price_store.symbols, ['AAPL', 'MSFT'])
+        self.assertEqual(self.price_store.etag(symbol='MSFT'), etags['MSFT'])
+
+        asyncio.run(self.price_store.sync(container_client=self.container, symbols=['MSFT', 'AAPL']))
+
+        self.assertEqual(self.container.downloads, 2)
+
+    def test_sync_downloads_changed_blob_of_same_size(self):
+        """Change a close without changing the size of the blob and make sure it's synced again."""
+
+        asyncio.run(self.price_store.sync(container_client=self.container, symbols=['AAPL']))
+
+        blob_name = 'iex-price-history/AAPL.json'
+        self.container.blobs[blob_name] = self.container.blobs[blob_name].replace(b'131.01', b'131.02')
+
+        asyncio.run(self.price_store.sync(container_client=self.container, symbols=['AAPL']))
+
+        self.assertEqual(self.container.downloads, 2)
+        self.assertEqual(self.price_store.open(symbol='AAPL')['close'].tolist(), [129.41, 131.02])
+
+    def test_open_maps_the_columns(self):
+        """Sync a symbol and make sure its columns are memory maps with the right types."""
+
+        asyncio.run(self.price_store.sync(container_client=self.container, symbols=['MSFT']))
+
+        columns = self.price_store.open(symbol='MSFT')
+
+        self.assertIsInstance(columns['close'], np.memmap)
+        self.assertNotIn('label', columns)
+        self.assertEqual(columns['volume'].dtype, np.int64)
+        self.assertEqual(columns['close'].tolist(), [217.69, 217.90, 212.25])
+
+        with self.assertRaises(KeyError):
+            self.price_store.open(symbol='AMZN')
+
+    def test_reads_date_range_into_stock_frame(self):
+        """Read a date range with a lookback and make sure it matches the history."""
+
+        asyncio.run(self.price_store.sync(container_client=self.container, symbols=['MSFT', 'AAPL']))
+
+        stock_frame = StockFrame.from_price_store(
+            root_path=self.root_path,
+            columns=['close'],
+            start='2021-01-05',
+            end='2021-01-05',
+            lookback=1
+        )
+
+        self.assertEqual(list(stock_frame.frame.columns), ['close'])
+        self.assertEqual(stock_frame.frame.loc['MSFT', 'close'].tolist(), [217.69, 217.90])
+        self.assertEqual(stock_frame.frame.loc['AAPL', 'close'].tolist(), [129.41, 131.01])
+
+    def test_load_changed_skips_known_etags(self):
+        """Load through the store and make sure symbols the caller has are left out."""
+
+        first = asyncio.run(
+            self.price_store.load_changed(container_client=self.container, symbols=['MSFT', 'AAPL'])
+        )
+        second = asyncio.run(
+            self.price_store.load_changed(
+                container_client=self.container,
+                symbols=['MSFT', 'AAPL'],
+                etags={'MSFT': first['MSFT'][1]},
+                reader_options={'columns': ['close'], 'start': '2021-01-05', 'lookback': 0}
+            )
+        )
+
+        self.assertIsNone(second['MSFT'][0])
+        self.assertEqual(second['AAPL'][0]['close'].tolist(), [131.01])
+
+    def tearDown(self) -> None:
+        """Remove the store."""
+
+        shutil.rmtree(self.root_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import io
+import json
+import unittest
+import numpy as np
+import pandas as pd
+
+from unittest import TestCase
+from az_functions.TradingSystemFunction.serializers.build import pa
+from az_functions.TradingSystemFunction.serializers.build import negotiate_format
+from az_functions.TradingSystemFunction.serializers.build import serialize_frame
+from az_functions.TradingSystemFunction.serializers.build import NotAcceptableError
+
+
+class SerializersTest(TestCase):
+
+    """Will perform a unit test for the response serializers."""
+
+    def setUp(self) -> None:
+        """Set up a small multi-index frame with a missing value."""
+
+        self.frame = pd.DataFrame(
+            data={'close': [217.69, 217.90], 'rsi': [np.nan, 56.2], 'volume': [37130100, 23823000]},
+            index=pd.MultiIndex.from_tuples(
+                [('MSFT', pd.Timestamp('2021-01-04')), ('MSFT', pd.Timestamp('2021-01-05'))],
+                names=['symbol', 'date']
+            )
+        )
+
+    def test_negotiates_format(self):
+        """Make sure the `format` parameter wins and the `Accept` qualities are respected."""
+
+        self.assertEqual(negotiate_format(), 'json')
+        self.assertEqual(negotiate_format(accept='text/html, */*;q=0.1'), 'json')
+        self.assertEqual(negotiate_format(accept='application/json', requested='columns'), 'columns')
+
+        with self.assertRaises(NotAcceptableError):
+            negotiate_format(accept='text/html')
+
+        with self.assertRaises(NotAcceptableError):
+            negotiate_format(requested='xml')
+
+    def test_json_formats(self):
+        """Serialize the frame as records and as columns and read both back."""
+
+        body, content_type = serialize_frame(frame=self.frame, output_format='json')
+        records = json.loads(body)
+
+        self.assertEqual(content_type, 'application/json')
+        self.assertTrue(records[0].pop('date').startswith('2021-01-04T00:00:00'))
+        self.assertEqual(records[0], {'symbol': 'MSFT', 'close': 217.69, 'rsi': None, 'volume': 37130100})
+
+        body, content_type = serialize_frame(frame=self.frame, output_format='columns')
+        columns = json.loads(body)
+
+        self.assertEqual(columns['date'], ['2021-01-04T00:00:00', '2021-01-05T00:00:00'])
+        self.assertEqual(columns['rsi'], [None, 56.2])
+        self.assertEqual(columns['volume'], [37130100, 23823000])
+
+    def test_columns_format_writes_null_for_infinity(self):
+        """Serialize infinite values as columns and make sure they're written as null, like the records."""
+
+        self.frame['change'] = [np.inf, -np.inf]
+
+        columns = json.loads(serialize_frame(frame=self.frame, output_format='columns')[0])
+        records = json.loads(serialize_frame(frame=self.frame, output_format='json')[0])
+
+        self.assertEqual(columns['change'], [None, None])
+        self.assertEqual([record['change'] for record in records], columns['change'])
+
+    @unittest.skipIf(pa is None, 'pyarrow is not installed.')
+    def test_arrow_formats(self):
+        """Serialize the frame as an Arrow stream and as Parquet and read both back."""
+
+        self.assertEqual(
+            negotiate_format(accept='application/json;q=0.5, application/vnd.apache.arrow.stream'),
+            'arrow'
+        )
+
+        body, content_type = serialize_frame(frame=self.frame, output_format='arrow')
+        table = pa.ipc.open_stream(body).read_all()
+
+        self.assertEqual(content_type, 'application/vnd.apache.arrow.stream')
+        self.assertEqual(table.column_names, ['symbol', 'date', 'close', 'rsi', 'volume'])
+
+        body, content_type = serialize_frame(frame=self.frame, output_format='parquet')
+        frame = pd.read_parquet(io.BytesIO(body))
+
+        self.assertEqual(frame['close'].tolist(), [217.69, 217.90])
+
+    def tearDown(self) -> None:
+        """Teardown the frame."""
+
+        del self.frame
+
+
+if __name__ == '__main__':
+    unittest.main()
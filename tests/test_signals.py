@@ -0,0 +1,87 @@
+import operator
+import unittest
+import numpy as np
+
+from unittest import TestCase
+from az_functions.TradingSystemFunction.stock_frame.build import StockFrame
+from az_functions.TradingSystemFunction.indicators.build import Indicators
+from az_functions.TradingSystemFunction.signals.build import SignalEvaluator
+
+
+class SignalEvaluatorTest(TestCase):
+
+    """Will perform a unit test for the `SignalEvaluator` object."""
+
+    def setUp(self) -> None:
+        """Set up the last `rsi` and `sma` values for three symbols."""
+
+        self.stock_frame = StockFrame.from_columns(
+            columns={
+                'symbol': np.repeat(np.arange(3), 2),
+                'date': np.tile(np.arange(2) * 86400, 3),
+                'close': np.array([10.0, 11.0, 20.0, 19.0, 30.0, 31.0]),
+                'rsi': np.array([50.0, 25.0, 50.0, 75.0, 50.0, 15.0]),
+                'sma': np.array([10.0, 10.5, 20.0, 19.5, 30.0, 32.0])
+            },
+            symbol_names=['AAPL', 'MSFT', 'TSLA'],
+            date_unit='s'
+        )
+
+        self.indicators = Indicators(price_data_frame=self.stock_frame)
+        self.indicators.set_indicator_signal(
+            indicator='rsi',
+            buy=30.0,
+            sell=70.0,
+            condition_buy=operator.lt,
+            condition_sell=operator.gt,
+            buy_max=20.0,
+            condition_buy_max=operator.ge
+        )
+
+    def test_buy_max_is_honored(self):
+        """Make sure a symbol past the `buy_max` bound doesn't get a buy signal."""
+
+        self.assertEqual(self.indicators.signal_array().tolist(), [1, -1, 0])
+
+        signals = self.indicators.check_signals()
+
+        self.assertEqual(list(signals['buys'].index.get_level_values('symbol')), ['AAPL'])
+        self.assertEqual(list(signals['sells'].index.get_level_values('symbol')), ['MSFT'])
+
+    def test_rules_are_combined(self):
+        """Add a comparison and make sure `all` and `any` combine the rules, a buy and a sell cancel out."""
+
+        self.indicators.set_indicator_signal_compare(
+            indicator_1='close',
+            indicator_2='sma',
+            condition_buy='<',
+            condition_sell=None
+        )
+
+        self.assertEqual(self.indicators.signal_array(combine='all').tolist(), [0, -1, 0])
+        self.assertEqual(self.indicators.signal_array(combine='any').tolist(), [1, 0, 0])
+
+    def test_evaluates_value_matrix(self):
+        """Evaluate a matrix directly, the `NaN` values never generate a signal."""
+
+        evaluator = SignalEvaluator(
+            indicators=self.indicators.get_indicator_signal(),
+            indicators_key=['rsi'],
+            indicators_comp_key=[]
+        )
+
+        buys, sells = evaluator.evaluate(values=np.array([[25.0], [np.nan], [80.0]]))
+
+        self.assertEqual(evaluator.columns, ['rsi'])
+        self.assertEqual(buys.tolist(), [True, False, False])
+        self.assertEqual(sells.tolist(), [False, False, True])
+
+    def tearDown(self) -> None:
+        """Teardown the `Indicators` object."""
+
+        del self.indicators
+        del self.stock_frame
+
+
+if __name__ == '__main__':
+    unittest.main()
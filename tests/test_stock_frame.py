@@ -0,0 +1,175 @@
+import unittest
+import numpy as np
+import pandas as pd
+
+from unittest import TestCase
+from az_functions.TradingSystemFunction.stock_frame.build import StockFrame
+from az_functions.TradingSystemFunction.stock_frame.shared import SharedPriceBlock
+
+
+class StockFrameTest(TestCase):
+
+    """Will perform a unit test for the `StockFrame` object."""
+
+    def setUp(self) -> None:
+        """Set up the price data for two symbols."""
+
+        self.records = [
+            {'symbol': 'MSFT', 'date': '2021-01-04', 'close': 217.69, 'volume': 37130100},
+            {'symbol': 'AAPL', 'date': '2021-01-04', 'close': 129.41, 'volume': 143301900},
+            {'symbol': 'MSFT', 'date': '2021-01-05', 'close': 217.90, 'volume': 23823000},
+            {'symbol': 'AAPL', 'date': '2021-01-05', 'close': 131.01, 'volume': 97664900}
+        ]
+
+        self.stock_frame = StockFrame(data=self.records)
+
+    def test_creates_instance_of_stock_frame(self):
+        """Create an instance and make sure it's a `StockFrame` object."""
+
+        self.assertIsInstance(self.stock_frame, StockFrame)
+        self.assertIsInstance(self.stock_frame.frame.index, pd.MultiIndex)
+
+    def test_from_columns_matches_records(self):
+        """Build the frame from symbol codes and epoch dates and compare it to the records."""
+
+        stock_frame = StockFrame.from_columns(
+            columns={
+                'symbol': np.array([0, 1, 0, 1]),
+                'date': np.array([1609718400, 1609718400, 1609804800, 1609804800]),
+                'close': np.array([217.69, 129.41, 217.90, 131.01]),
+                'volume': np.array([37130100, 143301900, 23823000, 97664900])
+            },
+            symbol_names=['MSFT', 'AAPL'],
+            date_unit='s'
+        )
+
+        pd.testing.assert_frame_equal(
+            stock_frame.frame,
+            self.stock_frame.frame.sort_index(),
+            check_index_type=False
+        )
+
+    def test_from_columns_groups_rows_by_symbol(self):
+        """Make sure the rows for each symbol end up next to each other."""
+
+        stock_frame = StockFrame.from_columns(
+            columns={
+                'symbol': ['MSFT', 'AAPL', 'MSFT', 'AAPL'],
+                'date': ['2021-01-04', '2021-01-04', '2021-01-05', '2021-01-05'],
+                'close': np.array([217.69, 129.41, 217.90, 131.01])
+            }
+        )
+
+        self.assertTrue(stock_frame.frame.index.is_monotonic_increasing)
+        self.assertEqual(
+            stock_frame.frame.loc['MSFT', 'close'].tolist(),
+            [217.69, 217.90]
+        )
+
+    def test_add_rows_merges_bars_in_place(self):
+        """Add bars for an old and a new symbol and make sure they land in the right rows."""
+
+        self.stock_frame.add_rows(
+            data=[
+                {'symbol': 'MSFT', 'date': '2021-01-06', 'close': 212.25, 'volume': 35930700},
+                {'symbol': 'AMZN', 'date': '2021-01-06', 'close': 3138.38, 'volume': 4906100}
+            ]
+        )
+        self.stock_frame.add_rows(
+            data=[{'symbol': 'MSFT', 'date': '2021-01-07', 'close': 218.29, 'volume': 27694500}]
+        )
+
+        frame = self.stock_frame.frame
+
+        self.assertTrue(frame.index.is_monotonic_increasing)
+        self.assertEqual(list(self.stock_frame.symbols), ['AAPL', 'AMZN', 'MSFT'])
+        self.assertEqual(frame.loc['MSFT', 'close'].tolist(), [217.69, 217.90, 212.25, 218.29])
+        self.assertEqual(frame['volume'].dtype, np.int64)
+
+    def test_add_rows_grows_buffers(self):
+        """Add more bars than the buffer holds and make sure none are lost."""
+
+        dates = pd.date_range(start='2021-01-06', periods=200, freq='D')
+
+        for number, date in enumerate(dates):
+            self.stock_frame.add_rows(
+                data=[{'symbol': 'AAPL', 'date': date, 'close': float(number), 'volume': number}]
+            )
+
+        self.assertEqual(len(self.stock_frame.frame.loc['AAPL']), 202)
+        self.assertEqual(self.stock_frame.frame.loc['AAPL', 'close'].iloc[-1], 199.0)
+
+    def test_grouping_is_kept_until_rows_change(self):
+        """Add a column and a row and make sure the grouping is only rebuilt for the row."""
+
+        grouping = self.stock_frame.grouping
+        self.assertEqual(list(grouping.symbols), ['AAPL', 'MSFT'])
+        self.assertEqual(grouping.offsets.tolist(), [0, 2, 4])
+
+        self.stock_frame.add_columns(columns={'sma': np.arange(4, dtype=float)})
+        self.assertIs(self.stock_frame.grouping, grouping)
+        self.assertIs(self.stock_frame.symbol_groups, self.stock_frame.symbol_groups)
+
+        self.stock_frame.add_rows(
+            data=[{'symbol': 'AAPL', 'date': '2021-01-06', 'close': 126.60, 'volume': 155088000}]
+        )
+        self.assertIsNot(self.stock_frame.grouping, grouping)
+        self.assertEqual(self.stock_frame.grouping.offsets.tolist(), [0, 3, 5])
+        self.assertEqual(
+            self.stock_frame.symbol_groups.last()['close'].tolist(),
+            [126.60, 217.90]
+        )
+
+    def test_grab_bars_matches_symbols_exactly(self):
+        """Add a symbol that contains another one and make sure the lookups don't mix them up."""
+
+        self.stock_frame.add_rows(
+            data=[{'symbol': 'MSFTX', 'date': '2021-01-05', 'close': 1.0, 'volume': 100}]
+        )
+
+        current_bar = self.stock_frame.grab_current_bar(symbol='MSFT')
+        self.assertEqual(current_bar.index.tolist(), [('MSFT', pd.Timestamp('2021-01-05'))])
+
+        current_bars = self.stock_frame.grab_current_bars(symbols=['MSFTX', 'AAPL'])
+        self.assertEqual(current_bars['close'].tolist(), [1.0, 131.01])
+
+        self.assertEqual(self.stock_frame.grab_n_bars_ago(symbol='MSFT', n=2)['close'], 217.69)
+
+        with self.assertRaises(IndexError):
+            self.stock_frame.grab_n_bars_ago(symbol='MSFTX', n=2)
+
+        with self.assertRaises(KeyError):
+            self.stock_frame.grab_current_bars(symbols=['AMZN'])
+
+    def test_shared_memory_round_trip(self):
+        """Share the frame, attach to it like another process would and rebuild the frame."""
+
+        with self.stock_frame.to_shared() as block:
+
+            attached = SharedPriceBlock.attach(name=block.name)
+
+            self.assertEqual(attached.symbols, ['AAPL', 'MSFT'])
+            np.testing.assert_array_equal(attached.offsets, [0, 2, 4])
+            np.testing.assert_array_equal(attached.columns['close'], self.stock_frame.frame['close'].to_numpy())
+            self.assertEqual(attached.columns['volume'].dtype, np.int64)
+
+            # The columns are views, a write shows up in the other process' block.
+            attached.columns['close'][0] = 1.0
+            self.assertEqual(block.columns['close'][0], 1.0)
+            attached.close()
+
+            block.columns['close'][0] = self.stock_frame.frame['close'].iloc[0]
+
+            pd.testing.assert_frame_equal(
+                StockFrame.from_shared(name=block.name).frame,
+                self.stock_frame.frame
+            )
+
+    def tearDown(self) -> None:
+        """Teardown the `StockFrame` object."""
+
+        del self.stock_frame
+
+
+if __name__ == '__main__':
+    unittest.main()
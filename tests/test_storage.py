@@ -0,0 +1,101 @@
+import asyncio
+import unittest
+
+from unittest import TestCase
+from az_functions.TradingSystemFunction.storage.build import BlobClientCache
+
+
+class FakeCredential():
+
+    """A credential that counts how many times it was created and closed."""
+
+    created = 0
+
+    def __init__(self) -> None:
+        FakeCredential.created += 1
+        self.closed = False
+
+    async def get_token(self, *scopes, **kwargs):
+        raise AssertionError('No requests should be sent.')
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class BlobClientCacheTest(TestCase):
+
+    """Will perform a unit test for the `BlobClientCache` object."""
+
+    def setUp(self) -> None:
+        """Set up the `BlobClientCache` object."""
+
+        FakeCredential.created = 0
+
+        self.account_url = 'https://tradingsystem.blob.core.windows.net/'
+        self.client_cache = BlobClientCache(max_connections=8, credential_factory=FakeCredential)
+
+    def test_clients_are_shared(self):
+        """Grab the container from several invocations at once and make sure one client is created."""
+
+        async def invoke():
+
+            container_clients = await asyncio.gather(
+                *[
+                    self.client_cache.get_container_client(account_url=self.account_url, container='price-history')
+                    for _ in range(5)
+                ]
+            )
+            blob_service_client = await self.client_cache.get_service_client(account_url=self.account_url)
+            credential = self.client_cache._credential
+
+            await self.client_cache.close()
+
+            return container_clients, blob_service_client, credential
+
+        container_clients, blob_service_client, credential = asyncio.run(invoke())
+
+        self.assertTrue(all(client is container_clients[0] for client in container_clients))
+        self.assertEqual(container_clients[0].container_name, 'price-history')
+        self.assertEqual(FakeCredential.created, 1)
+        self.assertTrue(credential.closed)
+
+    def test_clients_follow_event_loop(self):
+        """Use the cache from two event loops and make sure each gets its own client."""
+
+        async def invoke():
+            blob_service_client = await self.client_cache.get_service_client(account_url=self.account_url)
+            await self.client_cache.close()
+            return blob_service_client
+
+        first_client = asyncio.run(invoke())
+        second_client = asyncio.run(invoke())
+
+        self.assertIsNot(first_client, second_client)
+        self.assertEqual(FakeCredential.created, 2)
+
+    def test_loop_change_closes_old_clients(self):
+        """Leave the clients open on one loop and make sure the next loop closes them."""
+
+        async def open_clients():
+            await self.client_cache.get_service_client(account_url=self.account_url)
+            return self.client_cache._credential
+
+        async def reopen_clients():
+            await self.client_cache.get_service_client(account_url=self.account_url)
+            await self.client_cache.close()
+
+        first_credential = asyncio.run(open_clients())
+        self.assertFalse(first_credential.closed)
+
+        asyncio.run(reopen_clients())
+
+        self.assertTrue(first_credential.closed)
+
+    def tearDown(self) -> None:
+        """Teardown the `BlobClientCache` object."""
+
+        del self.client_cache
+
+
+if __name__ == '__main__':
+    unittest.main()